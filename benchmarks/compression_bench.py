@@ -0,0 +1,82 @@
+"""Compare source-archive throughput across compression codecs on a synthetic tree.
+
+Usage: python benchmarks/compression_bench.py [--files N] [--file-size BYTES]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deploybot.utils.archive import SourceTree, write_deterministic_tar
+from deploybot.utils.compression import CODECS, get_codec
+
+
+class _CountingSink:
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def _make_tree(root: str, files: int, file_size: int) -> int:
+    """Create a mix of source-like text and incompressible binary files; return total bytes."""
+    rng = random.Random(0)
+    words = [f"token_{i}" for i in range(512)]
+    total = 0
+    for i in range(files):
+        directory = os.path.join(root, f"pkg_{i % 20}", f"mod_{i % 7}")
+        os.makedirs(directory, exist_ok=True)
+        if i % 5 == 0:
+            data = rng.randbytes(file_size)
+            name = f"asset_{i}.bin"
+        else:
+            text = []
+            while sum(map(len, text)) < file_size:
+                text.append(" ".join(rng.choice(words) for _ in range(12)) + "\n")
+            data = "".join(text).encode()[:file_size]
+            name = f"module_{i}.py"
+        with open(os.path.join(directory, name), 'wb') as f:
+            f.write(data)
+        total += len(data)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=2000)
+    parser.add_argument('--file-size', type=int, default=64 * 1024)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        total = _make_tree(root, args.files, args.file_size)
+        tree = SourceTree(root)
+        print(f"Synthetic tree: {args.files} files, {total / 1e6:.1f} MB")
+        print(f"{'codec':<8} {'MB/s':>8} {'ratio':>7} {'seconds':>8}")
+        for name in CODECS:
+            try:
+                codec = get_codec(name)
+                best = None
+                for _ in range(args.repeat):
+                    sink = _CountingSink()
+                    start = time.perf_counter()
+                    write_deterministic_tar(tree, sink, codec)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+            except Exception as e:
+                print(f"{name:<8} skipped: {e}")
+                continue
+            print(f"{name:<8} {total / 1e6 / best:>8.1f} {sink.size / total:>7.3f} {best:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""Measure provisioner output parser throughput and allocations on multi-MB logs.
+
+Usage: python benchmarks/parser_bench.py [--size-mb MB] [--repeat N] [--terraform-log PATH] [--pulumi-log PATH]
+
+Logs are synthetic unless recorded ones are given; a Terraform log recorded
+with -json is fed to the JSON parser, a plain one to the text parser.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deploybot.provisioners.terraform_parser import TerraformJsonParser, TerraformOutputParser
+from deploybot.provisioners.pulumi_parser import PulumiOutputParser
+
+
+def _fill(size: int, make_line) -> str:
+    """Repeat make_line(rng, i) until the text reaches size bytes."""
+    rng = random.Random(0)
+    lines = []
+    total = 0
+    i = 0
+    while total < size:
+        line = make_line(rng, i) + "\n"
+        lines.append(line)
+        total += len(line)
+        i += 1
+    return "".join(lines)
+
+
+def _terraform_line(rng: random.Random, i: int) -> str:
+    address = f"module.app_{i % 40}.google_compute_instance.vm_{i % 500}"
+    choice = rng.random()
+    if choice < 0.15:
+        return f"{address}: Creating..."
+    if choice < 0.30:
+        return f"{address}: Creation complete after {rng.randint(1, 90)}s [id=projects/p/zones/z/instances/vm-{i}]"
+    if choice < 0.35:
+        return f"{address}: Destroying... [id=vm-{i}]"
+    if choice < 0.60:
+        return f"{address}: Still creating... [{rng.randint(1, 9)}0s elapsed]"
+    # Plan body and provider noise, which most lines of a real log are
+    return f"      + labels = {{ \"team\" = \"platform\", \"index\" = \"{i}\" }}"
+
+
+def _terraform_json_line(rng: random.Random, i: int) -> str:
+    address = f"module.app_{i % 40}.google_compute_instance.vm_{i % 500}"
+    resource = {'addr': address, 'resource_type': 'google_compute_instance'}
+    choice = rng.random()
+    if choice < 0.2:
+        message = {'type': 'apply_start', 'hook': {'resource': resource, 'action': 'create'}}
+    elif choice < 0.4:
+        message = {'type': 'apply_complete', 'hook': {'resource': resource, 'action': 'create', 'elapsed_seconds': rng.randint(1, 90)}}
+    elif choice < 0.7:
+        message = {'type': 'apply_progress', 'hook': {'resource': resource, 'action': 'create', 'elapsed_seconds': 10}}
+    elif choice < 0.8:
+        message = {'type': 'planned_change', 'change': {'resource': resource, 'action': 'create'}}
+    else:
+        message = {'type': 'log', '@message': f"provider log line {i}"}
+    message.update({'@level': 'info', '@module': 'terraform.ui', '@timestamp': '2026-01-01T00:00:00Z'})
+    return json.dumps(message)
+
+
+def _pulumi_line(rng: random.Random, i: int) -> str:
+    choice = rng.random()
+    if choice < 0.35:
+        return f"    + gcp:compute:Instance vm-{i % 500} creating ({rng.randint(0, 90)}s)"
+    if choice < 0.55:
+        return f"    ~ gcp:storage:Bucket assets-{i % 50} updating"
+    if choice < 0.6:
+        return f"warning: gcp:compute:Instance vm-{i % 500} deprecated field"
+    if choice < 0.7:
+        return f"    url_{i % 10}: https://example-{i}.run.app"
+    if choice < 0.75:
+        return "@ updating...."
+    return f"    {rng.choice(['downloading', 'installing', 'resolving'])} plugin gcp v8.36.{i % 10}"
+
+
+def _read(path: str) -> str:
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def _count(parser, stream: io.StringIO) -> int:
+    stream.seek(0)
+    count = 0
+    for _ in parser.iter_events(stream):
+        count += 1
+    return count
+
+
+def _bench(name: str, parser, text: str, repeat: int) -> None:
+    lines = text.count("\n")
+    stream = io.StringIO(text)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        events = _count(parser, stream)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Separate pass: tracing slows parsing down too much to time it. Peak is the
+    # most memory held at once while streaming, blocks what was left allocated after
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    _count(parser, stream)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    allocated = [stat for stat in after.compare_to(before, 'filename') if stat.size_diff > 0]
+    blocks = sum(stat.count_diff for stat in allocated)
+
+    print(f"{name:<12} {len(text) / 1e6:>6.1f} {lines:>9} {events:>8} {lines / best:>12,.0f} {peak / 1024:>9.0f} {blocks:>8}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=float, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--terraform-log', help="Recorded `terraform apply` output (plain or -json)")
+    parser.add_argument('--pulumi-log', help="Recorded `pulumi up` output")
+    args = parser.parse_args()
+    size = int(args.size_mb * 1024 * 1024)
+
+    logs = []
+    if args.terraform_log:
+        text = _read(args.terraform_log)
+        if text.lstrip().startswith('{'):
+            logs.append(('tf-json', TerraformJsonParser(), text))
+        else:
+            logs.append(('terraform', TerraformOutputParser(), text))
+    else:
+        logs.append(('terraform', TerraformOutputParser(), _fill(size, _terraform_line)))
+        logs.append(('tf-json', TerraformJsonParser(), _fill(size, _terraform_json_line)))
+    text = _read(args.pulumi_log) if args.pulumi_log else _fill(size, _pulumi_line)
+    logs.append(('pulumi', PulumiOutputParser(), text))
+
+    print(f"{'parser':<12} {'MB':>6} {'lines':>9} {'events':>8} {'lines/s':>12} {'peak KiB':>9} {'blocks':>8}")
+    for name, log_parser, text in logs:
+        _bench(name, log_parser, text, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""Measure CLI startup with -X importtime and fail when `--help` exceeds its budget.
+
+Usage: python benchmarks/startup_bench.py [--budget-ms MS] [--repeat N] [--top N]
+
+Exits non-zero if the cumulative import time of `deploybot --help` is over
+budget, or if it imports any cloud SDK or provisioner backend.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages `--help` must never import; they belong to specific targets or provisioners
+FORBIDDEN_PREFIXES = (
+    'google',
+    'googleapiclient',
+    'grpc',
+    'boto3',
+    'botocore',
+    'pulumi',
+    'pydantic',
+    'stacks',
+    'deploybot.targets.gcp',
+    'deploybot.targets.aws',
+    'deploybot.provisioners.native',
+    'deploybot.provisioners.pulumi',
+)
+
+
+def _parse_importtime(stderr: str):
+    """Return (total cumulative microseconds of top-level imports, [(cumulative_us, module)])."""
+    total = 0
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        try:
+            cumulative = int(fields[1])
+        except ValueError:
+            # Header line
+            continue
+        name = fields[2].rstrip()
+        modules.append((cumulative, name.strip()))
+        # Nested imports are indented by two spaces per level
+        if len(name) - len(name.lstrip()) == 1:
+            total += cumulative
+    return total, modules
+
+
+def _run(args):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-m', 'deploybot.cli', *args],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise SystemExit(f"deploybot {' '.join(args)} failed:\n{result.stderr[-2000:]}")
+    return elapsed, result.stderr
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=250.0, help='Budget for cumulative import time of --help')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help='Number of heaviest imports to list')
+    args = parser.parse_args()
+
+    wall_times = []
+    import_times = []
+    modules = []
+    for _ in range(args.repeat):
+        elapsed, stderr = _run(['--help'])
+        total, modules = _parse_importtime(stderr)
+        wall_times.append(elapsed)
+        import_times.append(total)
+
+    import_ms = statistics.median(import_times) / 1000
+    print(f"deploybot --help: wall {statistics.median(wall_times) * 1000:.0f} ms, "
+          f"imports {import_ms:.0f} ms (median of {args.repeat}, budget {args.budget_ms:.0f} ms)")
+
+    print("\nHeaviest imports (cumulative ms):")
+    for cumulative, name in sorted(modules, reverse=True)[:args.top]:
+        print(f"   {cumulative / 1000:>8.1f}  {name}")
+
+    forbidden = sorted({
+        name for _, name in modules
+        if any(name == prefix or name.startswith(prefix + '.') for prefix in FORBIDDEN_PREFIXES)
+    })
+    failed = False
+    if forbidden:
+        failed = True
+        print(f"\n❌ --help imported modules it should not need: {', '.join(forbidden[:20])}")
+    if import_ms > args.budget_ms:
+        failed = True
+        print(f"\n❌ Import time {import_ms:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+    if failed:
+        sys.exit(1)
+    print("\n✅ Startup within budget")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,9 @@
 import click
 import time
 from deploybot.core.enums import Target
-from deploybot.core.stack import get_stack
-from deploybot.core.parameters import DeployParameters
-from deploybot.targets.factory import TargetFactory
-from deploybot.ui.console import ConsoleUI
 
-
-ui = ConsoleUI()
+# Stack loading, targets and provisioners are imported inside the commands
+# that need them, so `deploybot --help` does not load pydantic or any cloud SDK
 
 @click.group()
 def cli():
@@ -16,6 +12,10 @@ def cli():
 
 def _setup_stack_and_provisioner(stack: str, target: str, project_id: str, region: str):
     """Helper method to set up stack and provisioner for commands."""
+    from deploybot.core.stack import get_stack
+    from deploybot.core.parameters import DeployParameters
+    from deploybot.targets.factory import TargetFactory
+
     # Create parameters model
     params = DeployParameters(
         stack=stack,
@@ -42,21 +42,84 @@ def _setup_stack_and_provisioner(stack: str, target: str, project_id: str, regio
     
     return target_instance, infrastructure_provisioner
 
+# Options shared by commands that can run on several stacks at once
+_FLEET_OPTIONS = [
+    click.option('--stacks', help='Comma-separated stacks to process in one run (e.g. web,api)'),
+    click.option('--manifest', type=click.Path(exists=True, dir_okay=False), help='YAML file listing the stacks to process'),
+    click.option('--targets', help='Comma-separated targets to fan each stack out to (e.g. gcp,aws)'),
+    click.option('--regions', help='Comma-separated regions to fan each stack out to; prefix each with its target when using several targets (e.g. gcp:us-central1,aws:us-east-1)'),
+    click.option('--parallelism', type=click.IntRange(min=1), default=4, show_default=True, help='Maximum number of stacks processed at once'),
+]
+
+def _fleet_options(command):
+    for option in reversed(_FLEET_OPTIONS):
+        command = option(command)
+    return command
+
+def _fleet_items(stack: str, stacks: str, manifest: str, targets: str, regions: str, target: str, project_id: str, region: str):
+    """Return the stacks and target/region pairs of a fleet run, or None for a single stack deployment."""
+    if stack and (stacks or manifest):
+        raise click.UsageError("Use either --stack or --stacks/--manifest, not both")
+    if target and targets:
+        raise click.UsageError("Use either --target or --targets, not both")
+    if region and regions:
+        raise click.UsageError("Use either --region or --regions, not both")
+    if not (stack or stacks or manifest):
+        raise click.UsageError("Missing option '--stack' (or '--stacks'/'--manifest')")
+    if stack and not (targets or regions):
+        return None
+    from deploybot.core.fleet import resolve_fleet
+    try:
+        return resolve_fleet(stack or stacks, manifest, target, project_id, region, targets, regions)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+
+def _run_fleet(action: str, items, parallelism: int, operation) -> None:
+    """Run operation for every stack in one process and report per-stack status and timings."""
+    from deploybot.core.fleet import run_fleet, print_fleet_summary, print_outputs_table
+
+    start_time = time.time()
+    print("=" * 60)
+    print(f"🚢 DeployBot - Fleet {action}")
+    print("=" * 60)
+    print(f"\n📋 {len(items)} stacks, up to {min(parallelism, len(items))} at once: {', '.join(item.label for item in items)}\n")
+
+    results = run_fleet(items, operation, parallelism)
+    failed = print_fleet_summary(action, results, time.time() - start_time)
+    print_outputs_table(results)
+    if failed:
+        raise click.ClickException(f"{failed} of {len(results)} stacks failed")
+
 @cli.command()
-@click.option('--stack', required=True, help='Name of the stack (e.g. gcp-web)')
+@click.option('--stack', help='Name of the stack (e.g. gcp-web)')
+@_fleet_options
 @click.option('--target', help='Deployment target (gcp, aws). Defaults to stack\'s default target if not provided.')
 @click.option('--project-id', help='GCP Project ID (required for GCP target)')
 @click.option('--region', help='Region to deploy to (overrides stack config)')
+@click.option('--use-plan', is_flag=True, help='Apply the diff saved by the last \'plan\' instead of recomputing it')
 # @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output during deployment')
-def deploy(stack: str, target: str, project_id: str, region: str):
-    """Deploy a stack to the specified target."""
+def deploy(stack: str, stacks: str, manifest: str, targets: str, regions: str, parallelism: int, target: str, project_id: str, region: str, use_plan: bool):
+    """Deploy one stack, or several with --stacks/--manifest, to the specified target."""
     start_time = time.time()
 
+    items = _fleet_items(stack, stacks, manifest, targets, regions, target, project_id, region)
+    if items is not None:
+        def deploy_one(item):
+            _, infrastructure_provisioner = _setup_stack_and_provisioner(item.stack, item.target, item.project_id, item.region)
+            if use_plan and not infrastructure_provisioner.supports_saved_plan:
+                raise Exception(f"The {infrastructure_provisioner.__class__.__name__} does not support --use-plan")
+            return infrastructure_provisioner.apply(use_plan=True) if use_plan else infrastructure_provisioner.apply()
+
+        _run_fleet('deploy', items, parallelism, deploy_one)
+        return
+
     try:
         # Setup stack and provisioner
         target_instance, infrastructure_provisioner = _setup_stack_and_provisioner(
             stack, target, project_id, region
         )
+        if use_plan and not infrastructure_provisioner.supports_saved_plan:
+            raise Exception(f"The {infrastructure_provisioner.__class__.__name__} does not support --use-plan")
         
         # Print deployment header
         print("=" * 60)
@@ -66,11 +129,11 @@ def deploy(stack: str, target: str, project_id: str, region: str):
         # Print deployment information
         print(f"\n📋 Deployment Information:")
         print(f"   Stack: {stack}")
-        print(f"   Target: {target.upper()}")
+        print(f"   Target: {target_instance.name.upper()}")
         print(f"   Region: {target_instance.region}")
         
         print(f"\n⚡ Starting deployment...\n")
-        outputs = infrastructure_provisioner.apply()
+        outputs = infrastructure_provisioner.apply(use_plan=True) if use_plan else infrastructure_provisioner.apply()
         
         # Print success summary
         print(f"\n✅ Deployment completed successfully!")
@@ -98,12 +161,21 @@ def deploy(stack: str, target: str, project_id: str, region: str):
         raise click.ClickException(str(e))
 
 @cli.command()
-@click.option('--stack', required=True, help='Name of the stack (e.g. gcp-web)')
+@click.option('--stack', help='Name of the stack (e.g. gcp-web)')
+@_fleet_options
 @click.option('--target', help='Deployment target (gcp, onprem). Defaults to stack\'s default target if not provided.')
 @click.option('--project-id', help='GCP Project ID (required for GCP target)')
 @click.option('--region', help='Region to deploy to (overrides stack config)')
-def plan(stack: str, target: str, project_id: str, region: str):
+def plan(stack: str, stacks: str, manifest: str, targets: str, regions: str, parallelism: int, target: str, project_id: str, region: str):
     """Show what will be deployed (Terraform plan)."""
+    items = _fleet_items(stack, stacks, manifest, targets, regions, target, project_id, region)
+    if items is not None:
+        def plan_one(item):
+            _, infrastructure_provisioner = _setup_stack_and_provisioner(item.stack, item.target, item.project_id, item.region)
+            infrastructure_provisioner.plan()
+
+        _run_fleet('plan', items, parallelism, plan_one)
+        return
     
     try:
         # Setup stack and provisioner
@@ -117,7 +189,7 @@ def plan(stack: str, target: str, project_id: str, region: str):
         
         print(f"\n📋 Plan Information:")
         print(f"   Stack: {stack}")
-        print(f"   Target: {target.upper()}")
+        print(f"   Target: {target_instance.name.upper()}")
         print(f"   Region: {target_instance.region}")
         
         print(f"\n🔎 Generating deployment plan...")
@@ -129,16 +201,33 @@ def plan(stack: str, target: str, project_id: str, region: str):
         raise click.ClickException(str(e))
 
 @cli.command()
-@click.option('--stack', required=True, help='Name of the stack to destroy (e.g. gcp-web)')
+@click.option('--stack', help='Name of the stack to destroy (e.g. gcp-web)')
+@_fleet_options
 @click.option('--target', help='Deployment target (gcp, aws). Defaults to stack\'s default target if not provided.')
 @click.option('--project-id', help='GCP Project ID (required for GCP target)')
 @click.option('--region', help='Region to deploy to (overrides stack config)')
 # @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output during destruction')
 @click.option('--force', '-f', is_flag=True, help='Skip confirmation prompt')
-def destroy(stack: str, target: str, project_id: str, region: str, force: bool):
-    """Destroy a deployed stack."""
+def destroy(stack: str, stacks: str, manifest: str, targets: str, regions: str, parallelism: int, target: str, project_id: str, region: str, force: bool):
+    """Destroy a deployed stack, or several with --stacks/--manifest."""
     start_time = time.time()
 
+    items = _fleet_items(stack, stacks, manifest, targets, regions, target, project_id, region)
+    if items is not None:
+        if not force:
+            print(f"\n⚠️  WARNING: This will destroy all resources in {len(items)} stacks: {', '.join(item.label for item in items)}!")
+            print(f"   This action cannot be undone!")
+            if not click.confirm("Are you sure you want to continue?"):
+                print(f"\n❌ Destruction cancelled.")
+                return
+
+        def destroy_one(item):
+            _, infrastructure_provisioner = _setup_stack_and_provisioner(item.stack, item.target, item.project_id, item.region)
+            infrastructure_provisioner.destroy()
+
+        _run_fleet('destroy', items, parallelism, destroy_one)
+        return
+
     try:
         # Setup stack and provisioner
         target_instance, infrastructure_provisioner = _setup_stack_and_provisioner(
@@ -153,7 +242,7 @@ def destroy(stack: str, target: str, project_id: str, region: str, force: bool):
         # Print destruction information
         print(f"\n📋 Destruction Information:")
         print(f"   Stack: {stack}")
-        print(f"   Target: {target.upper()}")
+        print(f"   Target: {target_instance.name.upper()}")
         print(f"   Region: {target_instance.region}")
 
         # Confirmation prompt
@@ -181,5 +270,69 @@ def destroy(stack: str, target: str, project_id: str, region: str, force: bool):
         print(f"   Total time: {round(time.time() - start_time)} seconds")
         raise click.ClickException(str(e))
 
+@cli.command()
+@click.option('--stack', required=True, help='Name of the stack (e.g. gcp-web)')
+@click.option('--target', help='Deployment target (gcp, aws). Defaults to stack\'s default target if not provided.')
+@click.option('--project-id', help='GCP Project ID (required for GCP target)')
+@click.option('--region', help='Region the stack is deployed to (overrides stack config)')
+def status(stack: str, target: str, project_id: str, region: str):
+    """Show what is running for a stack and any drift from the last deployment."""
+    start_time = time.time()
+
+    try:
+        from deploybot.core.stack import get_stack
+        from deploybot.provisioners.factory import ProvisionerFactory
+
+        # Checked before credentials are set up, so unsupported stacks fail fast
+        stack_obj = get_stack(stack)
+        if not ProvisionerFactory.provisioner_class(stack_obj.default_provisioner).supports_status:
+            raise Exception(
+                f"Status is only available for native recipes; stack '{stack}' uses the "
+                f"{stack_obj.default_provisioner.value} provisioner"
+            )
+
+        # Setup stack and provisioner
+        target_instance, infrastructure_provisioner = _setup_stack_and_provisioner(
+            stack, target, project_id, region
+        )
+
+        print("=" * 60)
+        print("📡 DeployBot - Stack Status")
+        print("=" * 60)
+
+        print(f"\n📋 Status Information:")
+        print(f"   Stack: {stack}")
+        print(f"   Target: {target_instance.name.upper()}")
+        print(f"   Region: {target_instance.region}")
+
+        infrastructure_provisioner.status()
+        print(f"   Checked in {time.time() - start_time:.1f} seconds")
+
+    except Exception as e:
+        print(f"\n❌ Status check failed!")
+        print(f"   Error: {str(e)}")
+        raise click.ClickException(str(e))
+
+@cli.command(name='list')
+def list_stacks():
+    """List available stacks with their targets and provisioners."""
+    from deploybot.core.stack import get_catalog
+
+    entries = get_catalog().entries()
+    if not entries:
+        print("No stacks found.")
+        return
+
+    print(f"{'STACK':<28} {'TARGET':<8} PROVISIONERS (* = default)")
+    for entry in entries:
+        if entry.config is None:
+            print(f"{entry.name:<28} ⚠️  invalid stack.yaml: {entry.error}")
+            continue
+        provisioners = ', '.join(
+            f"{p.value}*" if p == entry.config.default_provisioner else p.value
+            for p in entry.config.provisioners
+        )
+        print(f"{entry.name:<28} {entry.config.target.value:<8} {provisioners}")
+
 if __name__ == '__main__':
     cli()
\ No newline at end of file
@@ -13,3 +13,28 @@ class GCPArtifactRegistry:
     def get_package(self, project_id: str, region: str, repository_name: str, package_name: str) -> artifactregistry_v1.types.Package:
         name = f"projects/{project_id}/locations/{region}/repositories/{repository_name}/packages/{package_name}"
         return self.client.get_package(name=name)
+
+    def get_tag(self, project_id: str, region: str, repository_name: str, package_name: str, tag: str) -> artifactregistry_v1.types.Tag:
+        name = f"projects/{project_id}/locations/{region}/repositories/{repository_name}/packages/{package_name}/tags/{tag}"
+        return self.client.get_tag(name=name)
+
+
+class GCPArtifactRegistryAsync:
+    """Asyncio counterpart of GCPArtifactRegistry built on ArtifactRegistryAsyncClient."""
+
+    @property
+    def client(self) -> artifactregistry_v1.ArtifactRegistryAsyncClient:
+        return GCPClientFactory().get_artifact_registry_async_client()
+
+    async def delete_package(self, project_id: str, region: str, repository_name: str, package_name: str) -> None:
+        name = f"projects/{project_id}/locations/{region}/repositories/{repository_name}/packages/{package_name}"
+        operation = await self.client.delete_package(name=name)
+        await operation.result()
+
+    async def get_package(self, project_id: str, region: str, repository_name: str, package_name: str) -> artifactregistry_v1.types.Package:
+        name = f"projects/{project_id}/locations/{region}/repositories/{repository_name}/packages/{package_name}"
+        return await self.client.get_package(name=name)
+
+    async def get_tag(self, project_id: str, region: str, repository_name: str, package_name: str, tag: str) -> artifactregistry_v1.types.Tag:
+        name = f"projects/{project_id}/locations/{region}/repositories/{repository_name}/packages/{package_name}/tags/{tag}"
+        return await self.client.get_tag(name=name)
@@ -1,4 +1,13 @@
+import asyncio
+import atexit
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 from .credentials import get_credentials
+from google.auth.credentials import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+import httplib2
 from google.cloud import service_usage_v1
 from googleapiclient import discovery
 from google.cloud import storage
@@ -7,21 +16,86 @@ from google.cloud import run_v2
 from google.cloud import artifactregistry_v1
 from deploybot.core.global_state import global_state_manager
 
+
+# Keep-alive connections per host in a shared session; matches the default thread pool size
+_HTTP_POOL_SIZE = 32
+_HTTP_TIMEOUT = 60
+
+
+def credential_identity(credentials: Credentials) -> str:
+    """Hash who a credentials object authenticates as (never its token) into a pool key."""
+    parts = [type(credentials).__name__]
+    for attr in ('service_account_email', '_target_principal', 'client_id', 'refresh_token', 'quota_project_id'):
+        parts.append(str(getattr(credentials, attr, None) or ''))
+    if not any(parts[1:5]):
+        # Nothing identifies the principal; fall back to the object itself
+        parts.append(str(id(credentials)))
+    return hashlib.sha256('\0'.join(parts).encode()).hexdigest()[:16]
+
+
+class AuthorizedSessionHttp:
+    """httplib2.Http look-alike that sends googleapiclient requests over an AuthorizedSession.
+
+    httplib2 is not thread-safe and opens its own connections per Http
+    object; the requests session keeps a thread-safe pool of keep-alive
+    connections and refreshes the token itself.
+    """
+
+    def __init__(self, session: AuthorizedSession, timeout: float = _HTTP_TIMEOUT):
+        self.session = session
+        self.timeout = timeout
+
+    def request(self, uri, method='GET', body=None, headers=None, redirections=None, connection_type=None):
+        response = self.session.request(method, uri, data=body, headers=headers, timeout=self.timeout)
+        info = dict(response.headers)
+        info['status'] = str(response.status_code)
+        return httplib2.Response(info), response.content
+
+    def close(self):
+        # The session is shared and closed by GCPClientFactory
+        pass
+
+
 class GCPClientFactory:
-    """Factory for GCP clients using global state credentials."""
-    
+    """Thread- and asyncio-safe pool of GCP clients using global state credentials.
+
+    Clients are keyed by client type and credential identity, so one process
+    can serve several identities. Channels are keyed by API endpoint rather
+    than by client, so gRPC clients of the same identity on the same host
+    (e.g. Cloud Run services and jobs) share one channel. HTTP clients share
+    one authorized session. Async clients are bound to the event loop that
+    created them.
+    """
+
     _instance = None
-    _clients = {}
-    
+    _instance_lock = threading.Lock()
+
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(GCPClientFactory, cls).__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(GCPClientFactory, cls).__new__(cls)
+                    instance._setup()
+                    cls._instance = instance
         return cls._instance
-    
-    def __init__(self):
-        # No initialization needed - credentials come from global state
-        pass
-    
+
+    def _setup(self):
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        # key -> (client, event loop or None)
+        self._clients: Dict[Hashable, Tuple[Any, Optional[asyncio.AbstractEventLoop]]] = {}
+        self._channels: Dict[Hashable, Tuple[Any, Optional[asyncio.AbstractEventLoop]]] = {}
+        self._sessions: Dict[str, AuthorizedSession] = {}
+        self._stats = {
+            'clients_created': 0,
+            'clients_reused': 0,
+            'channels_created': 0,
+            'channels_reused': 0,
+            'sessions_created': 0,
+            'sessions_reused': 0
+        }
+        atexit.register(self.close)
+
     def _get_credentials(self):
         """Get credentials from global state or fallback to direct loading."""
         credentials = global_state_manager.gcp_credentials
@@ -29,50 +103,160 @@ class GCPClientFactory:
             # Fallback to direct credential loading (for backward compatibility)
             credentials = get_credentials()
         return credentials
-        
-    def get_service_usage_client(self) -> service_usage_v1.ServiceUsageClient:
-        if 'service_usage' not in self._clients:
-            self._clients['service_usage'] = service_usage_v1.ServiceUsageClient(
-                credentials=self._get_credentials()
-            )
-        return self._clients['service_usage']
-        
-    def get_sql_admin_client(self) -> discovery.Resource:
-        if 'sql_admin' not in self._clients:
-            self._clients['sql_admin'] = discovery.build(
-                'sqladmin', 'v1beta4', 
-                credentials=self._get_credentials()
-            )
-        return self._clients['sql_admin']
-
-    def get_storage_client(self) -> storage.Client:
-        if 'storage' not in self._clients:
-            self._clients['storage'] = storage.Client(
-                credentials=self._get_credentials()
-            )
-        return self._clients['storage']
-
-    def get_cloud_build_client(self) -> cloudbuild_v1.CloudBuildClient:
-        if 'cloud_build' not in self._clients:
-            self._clients['cloud_build'] = cloudbuild_v1.CloudBuildClient(
-                credentials=self._get_credentials()
-            )
-        return self._clients['cloud_build']
-
-    def get_cloud_run_client(self) -> run_v2.ServicesClient:
-        if 'cloud_run' not in self._clients:
-            self._clients['cloud_run'] = run_v2.ServicesClient(
-                credentials=self._get_credentials()
-            )
-        return self._clients['cloud_run']
-
-    def get_artifact_registry_client(self) -> artifactregistry_v1.ArtifactRegistryClient:
-        if 'artifact_registry' not in self._clients:
-            self._clients['artifact_registry'] = artifactregistry_v1.ArtifactRegistryClient(
-                credentials=self._get_credentials()
-            )
-        return self._clients['artifact_registry']
-    
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Counters of client, channel and session creations and reuses."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _pooled(self, pool: Dict, key: Hashable, build: Callable[[], Any], counter: str, loop=None) -> Any:
+        """Return pool[key], building it at most once even under concurrent calls."""
+        entry = pool.get(key)
+        if entry is not None and entry[1] is loop:
+            self._count(f"{counter}_reused")
+            return entry[0]
+        with self._lock:
+            key_lock = self._key_locks.setdefault((id(pool), key), threading.Lock())
+        # Per-key lock: different clients can still be built in parallel
+        with key_lock:
+            entry = pool.get(key)
+            if entry is not None and entry[1] is loop:
+                self._count(f"{counter}_reused")
+                return entry[0]
+            value = build()
+            with self._lock:
+                pool[key] = (value, loop)
+                self._stats[f"{counter}_created"] += 1
+        return value
+
+    def _channel(self, transport_class: type, host: str, identity: str, credentials: Credentials, loop=None):
+        # Keyed by endpoint, not transport class: a gRPC channel is not tied to one API's stubs.
+        # Sync and asyncio channels differ in type, and asyncio ones are per loop
+        key = (host, identity, 'grpc_asyncio' if loop else 'grpc', id(loop) if loop else None)
+        return self._pooled(
+            self._channels, key,
+            lambda: transport_class.create_channel(f"{host}:443", credentials=credentials),
+            'channels', loop
+        )
+
+    def _grpc_client(self, name: str, client_class: type, credentials: Optional[Credentials], transport: str = 'grpc'):
+        credentials = credentials or self._get_credentials()
+        identity = credential_identity(credentials)
+        # Async clients are bound to the event loop they were created on, so pool them per loop
+        loop = asyncio.get_running_loop() if transport == 'grpc_asyncio' else None
+
+        def build():
+            transport_class = client_class.get_transport_class(transport)
+            channel = self._channel(transport_class, client_class.DEFAULT_ENDPOINT, identity, credentials, loop)
+            return client_class(transport=transport_class(channel=channel))
+
+        return self._pooled(self._clients, (name, identity, id(loop) if loop else None), build, 'clients', loop)
+
+    def get_http_session(self, credentials: Optional[Credentials] = None) -> AuthorizedSession:
+        """Shared authorized requests session (connection pool) for one identity."""
+        credentials = credentials or self._get_credentials()
+        identity = credential_identity(credentials)
+        with self._lock:
+            session = self._sessions.get(identity)
+            if session is not None:
+                self._stats['sessions_reused'] += 1
+                return session
+            session = self._sessions[identity] = AuthorizedSession(credentials)
+            adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+            session.mount('https://', adapter)
+            self._stats['sessions_created'] += 1
+            return session
+
+    def get_service_usage_client(self, credentials: Optional[Credentials] = None) -> service_usage_v1.ServiceUsageClient:
+        return self._grpc_client('service_usage', service_usage_v1.ServiceUsageClient, credentials)
+
+    def get_sql_admin_client(self, credentials: Optional[Credentials] = None) -> discovery.Resource:
+        credentials = credentials or self._get_credentials()
+        return self._pooled(
+            self._clients, ('sql_admin', credential_identity(credentials), None),
+            # Built from the discovery document bundled with googleapiclient, so no network at build time
+            lambda: discovery.build(
+                'sqladmin', 'v1beta4',
+                http=AuthorizedSessionHttp(self.get_http_session(credentials)),
+                static_discovery=True
+            ),
+            'clients'
+        )
+
+    def get_storage_client(self, credentials: Optional[Credentials] = None) -> storage.Client:
+        credentials = credentials or self._get_credentials()
+        return self._pooled(
+            self._clients, ('storage', credential_identity(credentials), None),
+            lambda: storage.Client(credentials=credentials, _http=self.get_http_session(credentials)),
+            'clients'
+        )
+
+    def get_cloud_build_client(self, credentials: Optional[Credentials] = None) -> cloudbuild_v1.CloudBuildClient:
+        return self._grpc_client('cloud_build', cloudbuild_v1.CloudBuildClient, credentials)
+
+    def get_cloud_run_client(self, credentials: Optional[Credentials] = None) -> run_v2.ServicesClient:
+        return self._grpc_client('cloud_run', run_v2.ServicesClient, credentials)
+
+    def get_artifact_registry_client(self, credentials: Optional[Credentials] = None) -> artifactregistry_v1.ArtifactRegistryClient:
+        return self._grpc_client('artifact_registry', artifactregistry_v1.ArtifactRegistryClient, credentials)
+
+    def get_service_usage_async_client(self, credentials: Optional[Credentials] = None) -> service_usage_v1.ServiceUsageAsyncClient:
+        return self._grpc_client('service_usage_async', service_usage_v1.ServiceUsageAsyncClient, credentials, 'grpc_asyncio')
+
+    def get_cloud_build_async_client(self, credentials: Optional[Credentials] = None) -> cloudbuild_v1.CloudBuildAsyncClient:
+        return self._grpc_client('cloud_build_async', cloudbuild_v1.CloudBuildAsyncClient, credentials, 'grpc_asyncio')
+
+    def get_cloud_run_async_client(self, credentials: Optional[Credentials] = None) -> run_v2.ServicesAsyncClient:
+        return self._grpc_client('cloud_run_async', run_v2.ServicesAsyncClient, credentials, 'grpc_asyncio')
+
+    def get_artifact_registry_async_client(self, credentials: Optional[Credentials] = None) -> artifactregistry_v1.ArtifactRegistryAsyncClient:
+        return self._grpc_client('artifact_registry_async', artifactregistry_v1.ArtifactRegistryAsyncClient, credentials, 'grpc_asyncio')
+
+    def _take(self, loop_filter: Callable[[Optional[asyncio.AbstractEventLoop]], bool]):
+        """Remove and return pooled clients and channels whose loop matches the filter."""
+        with self._lock:
+            clients = [(k, v) for k, v in self._clients.items() if loop_filter(v[1])]
+            channels = [(k, v) for k, v in self._channels.items() if loop_filter(v[1])]
+            for key, _ in clients:
+                del self._clients[key]
+            for key, _ in channels:
+                del self._channels[key]
+        return [client for _, (client, _) in clients], [channel for _, (channel, _) in channels]
+
+    def close(self) -> None:
+        """Close synchronous clients, shared channels and HTTP sessions.
+
+        Async channels cannot be closed outside their event loop; call
+        aclose() from inside it. Those left behind are dropped from the pool.
+        """
+        clients, channels = self._take(lambda loop: True)
+        for client in clients:
+            close = getattr(client, 'close', None)
+            # Async clients and gRPC clients on shared channels are closed through their channel
+            if close is not None and not asyncio.iscoroutinefunction(close) and not hasattr(client, 'transport'):
+                try:
+                    close()
+                except Exception as e:
+                    print(f"Warning: could not close {type(client).__name__}: {e}")
+        for channel in channels:
+            if not asyncio.iscoroutinefunction(channel.close):
+                channel.close()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    async def aclose(self) -> None:
+        """Close the async clients and channels bound to the running event loop."""
+        current = asyncio.get_running_loop()
+        _, channels = self._take(lambda loop: loop is current)
+        await asyncio.gather(*(channel.close() for channel in channels), return_exceptions=True)
+
     def reset(self):
-        """Reset all cached clients (useful for testing or credential rotation)."""
-        self._clients.clear()
+        """Close and drop all cached clients (useful for testing or credential rotation)."""
+        self.close()
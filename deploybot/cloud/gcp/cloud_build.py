@@ -1,9 +1,22 @@
 from .client_factory import GCPClientFactory
 from google.cloud.devtools import cloudbuild_v1
 from google.api_core.operation import Operation
-import time
+from google.api_core.operation_async import AsyncOperation
+from concurrent.futures import Future
+from .operation_poller import operation_poller, poll_async
 
 class GCPCloudBuild:
+    # Timeouts in seconds
+    _BUILD_START_TIMEOUT = 2 * 60
+    _BUILD_TIMEOUT = 60 * 60
+    _FAILED_STATUSES = (
+        cloudbuild_v1.Build.Status.FAILURE,
+        cloudbuild_v1.Build.Status.INTERNAL_ERROR,
+        cloudbuild_v1.Build.Status.TIMEOUT,
+        cloudbuild_v1.Build.Status.CANCELLED,
+        cloudbuild_v1.Build.Status.EXPIRED,
+    )
+
     def __init__(self):
         self.client = GCPClientFactory().get_cloud_build_client()
         # self.operations_client = GCPClientFactory().get_operations_client()
@@ -15,25 +28,82 @@ class GCPCloudBuild:
     def get_build(self, project_id: str, build_id: str) -> cloudbuild_v1.Build:
         return self.client.get_build(project_id=project_id, id=build_id)
 
+    @staticmethod
+    def _build_id(operation: Operation) -> str:
+        metadata = operation.metadata
+        if metadata is None or metadata.build is None:
+            return ""
+        return metadata.build.id
+
     def create_build(self, project_id: str, build: cloudbuild_v1.Build) -> cloudbuild_v1.Build:
         operation = self.create_build_async(project_id, build)
-        while operation.metadata is None or operation.metadata.build is None:
-            print("Waiting for build metadata to be available...")
-            time.sleep(2)
-        build_id = operation.metadata.build.id
+
+        def check_started():
+            if not self._build_id(operation):
+                # done() refreshes the operation, populating its metadata
+                operation.done()
+            build_id = self._build_id(operation)
+            return bool(build_id), build_id
+
+        build_id = self._build_id(operation) or operation_poller.wait(
+            check_started, "Cloud Build metadata", timeout=self._BUILD_START_TIMEOUT
+        )
         print(f"Cloud Build started: {build_id}")
         return self.wait_for_build(project_id, build_id)
 
-    def wait_for_build(self, project_id: str, build_id: str, wait_time: int = 10) -> cloudbuild_v1.Build:
-        while True:
-            build = self.get_build(project_id, build_id)
-            status = build.status
-            print(f"Waiting for build {build_id} to finish...")
-            if status == cloudbuild_v1.Build.Status.SUCCESS:
-                print(f"Build {build_id} finished successfully")
-                return build
-            elif build.status == cloudbuild_v1.Build.Status.FAILURE:
-                raise Exception(f"Build {build_id} failed")
-            time.sleep(wait_time)
+    @classmethod
+    def _check_build(cls, build: cloudbuild_v1.Build):
+        """Return (done, build) for a build, raising if it failed."""
+        if build.status == cloudbuild_v1.Build.Status.SUCCESS:
+            print(f"Build {build.id} finished successfully")
+            return True, build
+        if build.status in cls._FAILED_STATUSES:
+            raise Exception(f"Build {build.id} failed with status {build.status.name}")
+        return False, None
+
+    def watch_build(self, project_id: str, build_id: str, timeout: float = _BUILD_TIMEOUT) -> Future:
+        """Track a build on the shared poller and return a future for the finished build."""
+        def check():
+            return self._check_build(self.get_build(project_id, build_id))
+
+        print(f"Waiting for build {build_id} to finish...")
+        return operation_poller.submit(check, f"build {build_id}", timeout)
+
+    def wait_for_build(self, project_id: str, build_id: str, timeout: float = _BUILD_TIMEOUT) -> cloudbuild_v1.Build:
+        return self.watch_build(project_id, build_id, timeout).result()
+
+
+class GCPCloudBuildAsync:
+    """Asyncio counterpart of GCPCloudBuild built on cloudbuild_v1.CloudBuildAsyncClient."""
+
+    @property
+    def client(self) -> cloudbuild_v1.CloudBuildAsyncClient:
+        return GCPClientFactory().get_cloud_build_async_client()
+
+    async def create_build_async(self, project_id: str, build: cloudbuild_v1.Build) -> AsyncOperation:
+        return await self.client.create_build(project_id=project_id, build=build)
+
+    async def get_build(self, project_id: str, build_id: str) -> cloudbuild_v1.Build:
+        return await self.client.get_build(project_id=project_id, id=build_id)
+
+    async def create_build(self, project_id: str, build: cloudbuild_v1.Build) -> cloudbuild_v1.Build:
+        operation = await self.create_build_async(project_id, build)
+
+        async def check_started():
+            if not GCPCloudBuild._build_id(operation):
+                await operation.done()
+            build_id = GCPCloudBuild._build_id(operation)
+            return bool(build_id), build_id
+
+        build_id = GCPCloudBuild._build_id(operation) or await poll_async(
+            check_started, "Cloud Build metadata", GCPCloudBuild._BUILD_START_TIMEOUT
+        )
+        print(f"Cloud Build started: {build_id}")
+        return await self.wait_for_build(project_id, build_id)
 
+    async def wait_for_build(self, project_id: str, build_id: str, timeout: float = GCPCloudBuild._BUILD_TIMEOUT) -> cloudbuild_v1.Build:
+        async def check():
+            return GCPCloudBuild._check_build(await self.get_build(project_id, build_id))
 
+        print(f"Waiting for build {build_id} to finish...")
+        return await poll_async(check, f"build {build_id}", timeout)
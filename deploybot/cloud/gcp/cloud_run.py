@@ -1,10 +1,14 @@
 from .client_factory import GCPClientFactory
 from google.cloud import run_v2
-import time
+from concurrent.futures import Future
 from google.iam.v1.iam_policy_pb2 import GetIamPolicyRequest, SetIamPolicyRequest
 from google.iam.v1.policy_pb2 import Policy
+from .operation_poller import operation_poller, poll_async
 
 class GCPCloudRun:
+    # Timeout in seconds for a revision to become ready
+    _SERVICE_TIMEOUT = 15 * 60
+
     def __init__(self):
         self.client = GCPClientFactory().get_cloud_run_client()
 
@@ -35,19 +39,30 @@ class GCPCloudRun:
         operation = self.client.delete_service(name=name)
         operation.result()
 
-    def wait_for_service(self, project_id: str, region: str, service_name: str, wait_time: int = 10) -> run_v2.Service:
-        while True:
-            service = self.get_service(project_id, region, service_name)
-            terminal_condition = service.terminal_condition
-            print(f"Waiting for service {service_name} to finish...")
-            if terminal_condition is not None:
-                status = terminal_condition.state
-                if status == run_v2.types.Condition.State.CONDITION_SUCCEEDED:
-                    print(f"Service {service_name} finished successfully")
-                    return service
-                elif status == run_v2.types.Condition.State.CONDITION_FAILED:
-                    raise Exception(f"Service {service_name} failed")
-            time.sleep(wait_time)
+    @staticmethod
+    def _check_service(service_name: str, service: run_v2.Service):
+        """Return (done, service) for a rollout, raising if it failed."""
+        terminal_condition = service.terminal_condition
+        if service.reconciling or terminal_condition is None:
+            return False, None
+        status = terminal_condition.state
+        if status == run_v2.types.Condition.State.CONDITION_SUCCEEDED:
+            print(f"Service {service_name} finished successfully")
+            return True, service
+        elif status == run_v2.types.Condition.State.CONDITION_FAILED:
+            raise Exception(f"Service {service_name} failed: {terminal_condition.message}")
+        return False, None
+
+    def watch_service(self, project_id: str, region: str, service_name: str, timeout: float = _SERVICE_TIMEOUT) -> Future:
+        """Track a service rollout on the shared poller and return a future for the ready service."""
+        def check():
+            return self._check_service(service_name, self.get_service(project_id, region, service_name))
+
+        print(f"Waiting for service {service_name} to finish...")
+        return operation_poller.submit(check, f"Cloud Run service {service_name}", timeout)
+
+    def wait_for_service(self, project_id: str, region: str, service_name: str, timeout: float = _SERVICE_TIMEOUT) -> run_v2.Service:
+        return self.watch_service(project_id, region, service_name, timeout).result()
 
     def get_iam_policy(self, project_id: str, region: str, service_name: str) -> Policy:
         name=f"projects/{project_id}/locations/{region}/services/{service_name}"
@@ -57,4 +72,47 @@ class GCPCloudRun:
     def set_iam_policy(self, project_id: str, region: str, service_name: str, policy: Policy) -> Policy:
         name=f"projects/{project_id}/locations/{region}/services/{service_name}"
         request = SetIamPolicyRequest(resource=name, policy=policy)
-        return self.client.set_iam_policy(request)
\ No newline at end of file
+        return self.client.set_iam_policy(request)
+
+
+class GCPCloudRunAsync:
+    """Asyncio counterpart of GCPCloudRun built on run_v2.ServicesAsyncClient."""
+
+    @property
+    def client(self) -> run_v2.ServicesAsyncClient:
+        return GCPClientFactory().get_cloud_run_async_client()
+
+    async def get_service(self, project_id: str, region: str, service_name: str) -> run_v2.Service:
+        name=f"projects/{project_id}/locations/{region}/services/{service_name}"
+        return await self.client.get_service(name=name)
+
+    async def create_service(self, project_id: str, region: str, service_name: str, service_body: run_v2.Service) -> run_v2.Service:
+        parent=f"projects/{project_id}/locations/{region}"
+        await self.client.create_service(parent=parent, service_id=service_name, service=service_body)
+        print(f"Cloud Run deployment started: {service_name}")
+        return await self.wait_for_service(project_id, region, service_name)
+
+    async def update_service(self, project_id: str, region: str, service_name: str, service_body: run_v2.Service) -> run_v2.Service:
+        service_body.name = f"projects/{project_id}/locations/{region}/services/{service_name}"
+        await self.client.update_service(service=service_body)
+        return await self.wait_for_service(project_id, region, service_name)
+
+    async def delete_service(self, project_id: str, region: str, service_name: str) -> None:
+        name=f"projects/{project_id}/locations/{region}/services/{service_name}"
+        operation = await self.client.delete_service(name=name)
+        await operation.result()
+
+    async def wait_for_service(self, project_id: str, region: str, service_name: str, timeout: float = GCPCloudRun._SERVICE_TIMEOUT) -> run_v2.Service:
+        async def check():
+            return GCPCloudRun._check_service(service_name, await self.get_service(project_id, region, service_name))
+
+        print(f"Waiting for service {service_name} to finish...")
+        return await poll_async(check, f"Cloud Run service {service_name}", timeout)
+
+    async def get_iam_policy(self, project_id: str, region: str, service_name: str) -> Policy:
+        name=f"projects/{project_id}/locations/{region}/services/{service_name}"
+        return await self.client.get_iam_policy(GetIamPolicyRequest(resource=name))
+
+    async def set_iam_policy(self, project_id: str, region: str, service_name: str, policy: Policy) -> Policy:
+        name=f"projects/{project_id}/locations/{region}/services/{service_name}"
+        return await self.client.set_iam_policy(SetIamPolicyRequest(resource=name, policy=policy))
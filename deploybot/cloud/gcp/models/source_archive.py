@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SourceArchive:
+    """A source archive in Cloud Storage, keyed by the digest of the tree it was built from."""
+    bucket_name: str
+    object_name: str
+    digest: str
+    # Name of the codec in deploybot.utils.compression used to build the archive
+    compression: str = 'gzip'
+    uploaded: bool = False
+    # Size of the files packaged and of those left out by ignore rules (skipped directories are not sized)
+    included_bytes: int = 0
+    excluded_bytes: int = 0
+
+    @property
+    def uri(self) -> str:
+        return f"gs://{self.bucket_name}/{self.object_name}"
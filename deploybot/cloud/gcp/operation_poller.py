@@ -0,0 +1,136 @@
+import asyncio
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+# A check returns (done, result) and raises if the operation has failed
+OperationCheck = Callable[[], Tuple[bool, Any]]
+AsyncOperationCheck = Callable[[], Awaitable[Tuple[bool, Any]]]
+
+
+class Backoff:
+    """Exponential backoff delays with proportional jitter."""
+
+    def __init__(self, initial_delay: float = 1.0, max_delay: float = 30.0, multiplier: float = 2.0, jitter: float = 0.2):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._delay = initial_delay
+
+    def next_delay(self) -> float:
+        delay = self._delay
+        self._delay = min(self._delay * self.multiplier, self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class _PendingOperation:
+    def __init__(self, check: OperationCheck, description: str, timeout: Optional[float], backoff: Backoff):
+        self.check = check
+        self.description = description
+        self.timeout = timeout
+        self.backoff = backoff
+        self.future: Future = Future()
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + timeout if timeout is not None else None
+
+
+class OperationPoller:
+    """Polls many long-running operations from a single background thread.
+
+    Each operation is polled quickly at first, then with exponentially growing,
+    jittered delays, and fails with TimeoutError once its deadline passes.
+    """
+
+    def __init__(self, initial_delay: float = 1.0, max_delay: float = 30.0, multiplier: float = 2.0, jitter: float = 0.2):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._queue = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, check: OperationCheck, description: str, timeout: Optional[float] = None) -> Future:
+        """Start tracking an operation and return a future for its result."""
+        backoff = Backoff(self.initial_delay, self.max_delay, self.multiplier, self.jitter)
+        operation = _PendingOperation(check, description, timeout, backoff)
+        with self._condition:
+            self._schedule(operation, operation.started_at + backoff.next_delay())
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='gcp-operation-poller', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return operation.future
+
+    def wait(self, check: OperationCheck, description: str, timeout: Optional[float] = None) -> Any:
+        """Block until the operation completes and return its result."""
+        return self.submit(check, description, timeout).result()
+
+    def _schedule(self, operation: _PendingOperation, poll_at: float) -> None:
+        heapq.heappush(self._queue, (poll_at, next(self._sequence), operation))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                poll_at, _, operation = self._queue[0]
+                delay = poll_at - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                heapq.heappop(self._queue)
+            self._poll(operation)
+
+    def _poll(self, operation: _PendingOperation) -> None:
+        if operation.future.cancelled():
+            return
+        try:
+            done, result = operation.check()
+        except Exception as e:
+            operation.future.set_exception(e)
+            return
+        if done:
+            operation.future.set_result(result)
+            return
+
+        now = time.monotonic()
+        if operation.deadline is not None and now >= operation.deadline:
+            operation.future.set_exception(TimeoutError(
+                f"Timed out after {operation.timeout} seconds waiting for {operation.description}"
+            ))
+            return
+
+        delay = operation.backoff.next_delay()
+        if operation.deadline is not None:
+            delay = min(delay, operation.deadline - now)
+        with self._condition:
+            self._schedule(operation, now + delay)
+
+# Shared instance used by all GCP wrappers
+operation_poller = OperationPoller()
+
+
+async def poll_async(check: AsyncOperationCheck, description: str, timeout: Optional[float] = None) -> Any:
+    """Await an operation on the running event loop, using the shared poller's backoff policy."""
+    backoff = Backoff(operation_poller.initial_delay, operation_poller.max_delay, operation_poller.multiplier, operation_poller.jitter)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout is not None else None
+    delay = backoff.next_delay()
+    while True:
+        await asyncio.sleep(delay)
+        done, result = await check()
+        if done:
+            return result
+        now = loop.time()
+        if deadline is not None and now >= deadline:
+            raise TimeoutError(f"Timed out after {timeout} seconds waiting for {description}")
+        delay = backoff.next_delay()
+        if deadline is not None:
+            delay = min(delay, deadline - now)
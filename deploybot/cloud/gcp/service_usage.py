@@ -1,7 +1,13 @@
+import asyncio
+from typing import List
 from .client_factory import GCPClientFactory
 from google.cloud import service_usage_v1
 from .enums.services import GoogleCloudService
 
+# Service Usage API limits on the number of services per batch request
+_BATCH_GET_LIMIT = 30
+_BATCH_ENABLE_LIMIT = 20
+
 class GCPServiceUsage:
     def __init__(self) -> None:
         self.client = GCPClientFactory().get_service_usage_client()
@@ -36,4 +42,62 @@ class GCPServiceUsage:
             )
             return self.client.get_service(request)
         except Exception as e:
-            print(f"Error getting API {api_name}: {e}")
\ No newline at end of file
+            print(f"Error getting API {api_name}: {e}")
+
+    def batch_get_apis(self, project_id: str, api_names: List[GoogleCloudService]) -> List[service_usage_v1.Service]:
+        parent = f"projects/{project_id}"
+        services = []
+        for i in range(0, len(api_names), _BATCH_GET_LIMIT):
+            request = service_usage_v1.BatchGetServicesRequest(
+                parent=parent,
+                names=[f"{parent}/services/{api_name.value}" for api_name in api_names[i:i + _BATCH_GET_LIMIT]]
+            )
+            services.extend(self.client.batch_get_services(request).services)
+        return services
+
+    def batch_enable_apis(self, project_id: str, api_names: List[GoogleCloudService]) -> None:
+        parent = f"projects/{project_id}"
+        operations = []
+        for i in range(0, len(api_names), _BATCH_ENABLE_LIMIT):
+            request = service_usage_v1.BatchEnableServicesRequest(
+                parent=parent,
+                service_ids=[api_name.value for api_name in api_names[i:i + _BATCH_ENABLE_LIMIT]]
+            )
+            operations.append(self.client.batch_enable_services(request))
+        for operation in operations:
+            operation.result()
+
+
+class GCPServiceUsageAsync:
+    """Asyncio counterpart of GCPServiceUsage built on ServiceUsageAsyncClient."""
+
+    @property
+    def client(self) -> service_usage_v1.ServiceUsageAsyncClient:
+        return GCPClientFactory().get_service_usage_async_client()
+
+    async def get_api(self, project_id: str, api_name: GoogleCloudService) -> service_usage_v1.Service:
+        request = service_usage_v1.GetServiceRequest(name=f"projects/{project_id}/services/{api_name.value}")
+        return await self.client.get_service(request)
+
+    async def batch_get_apis(self, project_id: str, api_names: List[GoogleCloudService]) -> List[service_usage_v1.Service]:
+        parent = f"projects/{project_id}"
+        requests = [
+            service_usage_v1.BatchGetServicesRequest(
+                parent=parent,
+                names=[f"{parent}/services/{api_name.value}" for api_name in api_names[i:i + _BATCH_GET_LIMIT]]
+            )
+            for i in range(0, len(api_names), _BATCH_GET_LIMIT)
+        ]
+        responses = await asyncio.gather(*(self.client.batch_get_services(request) for request in requests))
+        return [service for response in responses for service in response.services]
+
+    async def batch_enable_apis(self, project_id: str, api_names: List[GoogleCloudService]) -> None:
+        parent = f"projects/{project_id}"
+        operations = await asyncio.gather(*(
+            self.client.batch_enable_services(service_usage_v1.BatchEnableServicesRequest(
+                parent=parent,
+                service_ids=[api_name.value for api_name in api_names[i:i + _BATCH_ENABLE_LIMIT]]
+            ))
+            for i in range(0, len(api_names), _BATCH_ENABLE_LIMIT)
+        ))
+        await asyncio.gather(*(operation.result() for operation in operations))
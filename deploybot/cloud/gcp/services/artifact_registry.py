@@ -1,4 +1,11 @@
-from deploybot.cloud.gcp.artifact_registry import GCPArtifactRegistry
+from typing import Optional
+from google.api_core.exceptions import NotFound
+from google.cloud import artifactregistry_v1
+from deploybot.cloud.gcp.artifact_registry import GCPArtifactRegistry, GCPArtifactRegistryAsync
+
+def _tag_digest(tag: artifactregistry_v1.types.Tag) -> Optional[str]:
+    # Tag versions are named .../packages/<package>/versions/sha256:<digest>
+    return tag.version.rsplit('/', 1)[-1] or None
 
 class GCPArtifactRegistryService:
     def __init__(self):
@@ -11,4 +18,36 @@ class GCPArtifactRegistryService:
             print(f"Package {package_name} not found, skipping deletion...")
             return
         self.client.delete_package(project_id, region, repository_name, package_name)
-        print(f"Deleted package: {package_name}")
\ No newline at end of file
+        print(f"Deleted package: {package_name}")
+
+    def find_image_digest(self, project_id: str, region: str, repository_name: str, package_name: str, tag: str) -> Optional[str]:
+        """Return the digest of the image carrying the tag, or None if there is none; other errors propagate."""
+        try:
+            tag_obj = self.client.get_tag(project_id, region, repository_name, package_name, tag)
+        except NotFound:
+            return None
+        return _tag_digest(tag_obj)
+
+
+class GCPArtifactRegistryAsyncService:
+    """Asyncio counterpart of GCPArtifactRegistryService."""
+
+    def __init__(self):
+        self.client = GCPArtifactRegistryAsync()
+
+    async def delete_package(self, project_id: str, region: str, repository_name: str, package_name: str) -> None:
+        try:
+            await self.client.get_package(project_id, region, repository_name, package_name)
+        except Exception:
+            print(f"Package {package_name} not found, skipping deletion...")
+            return
+        await self.client.delete_package(project_id, region, repository_name, package_name)
+        print(f"Deleted package: {package_name}")
+
+    async def find_image_digest(self, project_id: str, region: str, repository_name: str, package_name: str, tag: str) -> Optional[str]:
+        """Return the digest of the image carrying the tag, or None if there is none; other errors propagate."""
+        try:
+            tag_obj = await self.client.get_tag(project_id, region, repository_name, package_name, tag)
+        except NotFound:
+            return None
+        return _tag_digest(tag_obj)
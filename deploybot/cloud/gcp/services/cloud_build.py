@@ -0,0 +1,99 @@
+import hashlib
+import os
+from deploybot.cloud.gcp.cloud_build import GCPCloudBuild
+from deploybot.cloud.gcp.models.source_archive import SourceArchive
+from deploybot.cloud.gcp.services.artifact_registry import GCPArtifactRegistryService
+from deploybot.utils.compression import GzipCodec, ZstdCodec, get_codec
+
+# gcr.io images are stored in the 'gcr.io' Artifact Registry repository in the 'us' multi-region
+GCR_REPOSITORY = 'gcr.io'
+GCR_LOCATION = 'us'
+
+def build_cache_key(source_archive: SourceArchive, dockerfile_path: str) -> str:
+    """Return the key identifying an image built from this source and Dockerfile."""
+    digest = hashlib.sha256(source_archive.digest.encode())
+    if os.path.isfile(dockerfile_path):
+        with open(dockerfile_path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def build_cache_tag(source_archive: SourceArchive, dockerfile_path: str) -> str:
+    """Return the image tag marking an image built from this source and Dockerfile."""
+    return f"src-{build_cache_key(source_archive, dockerfile_path)[:40]}"
+
+def source_build_config(source_archive: SourceArchive) -> dict:
+    """Return the build 'source' and initial 'steps' that unpack the archive into /workspace.
+
+    Cloud Build only unpacks .tar.gz (and .zip) storage sources itself; other
+    codecs are fetched and extracted by explicit steps.
+    """
+    codec = get_codec(source_archive.compression)
+    if isinstance(codec, GzipCodec):
+        return {
+            'source': {
+                'storage_source': {
+                    'bucket': source_archive.bucket_name,
+                    'object': source_archive.object_name
+                }
+            },
+            'steps': []
+        }
+
+    archive_file = f"source.{codec.extension}"
+    extract_command = codec.extract_command.replace('ARCHIVE', archive_file)
+    if isinstance(codec, ZstdCodec):
+        image, extract_command = 'alpine', f"apk add --no-cache zstd >/dev/null && {extract_command}"
+    else:
+        image = 'gcr.io/cloud-builders/gsutil'
+    return {
+        'steps': [
+            {
+                'name': 'gcr.io/cloud-builders/gsutil',
+                'args': ['cp', source_archive.uri, archive_file]
+            },
+            {
+                'name': image,
+                'entrypoint': 'sh',
+                'args': ['-c', f"{extract_command} && rm {archive_file}"]
+            }
+        ]
+    }
+
+class GCPCloudBuildService:
+    def __init__(self):
+        self.client = GCPCloudBuild()
+        self.artifact_registry_service = GCPArtifactRegistryService()
+
+    def build_image(self, project_id: str, image_name: str, image_tag: str, source_archive: SourceArchive, dockerfile_path: str) -> str:
+        """Build a Docker image from the archive unless one already exists for the same inputs.
+
+        Images are additionally tagged with the build cache key; a tag hit in
+        Artifact Registry short-circuits the build. Returns the image URL pinned by digest.
+        """
+        image_repo = f"gcr.io/{project_id}/{image_name}"
+        cache_tag = build_cache_tag(source_archive, dockerfile_path)
+
+        digest = self.artifact_registry_service.find_image_digest(
+            project_id, GCR_LOCATION, GCR_REPOSITORY, image_name, cache_tag
+        )
+        if digest:
+            print(f"Reusing image {image_repo}@{digest} built from the same source ({cache_tag})")
+            return f"{image_repo}@{digest}"
+
+        image_path = f"{image_repo}:{image_tag}"
+        cache_path = f"{image_repo}:{cache_tag}"
+        build_body = {
+            **source_build_config(source_archive),
+            'images': [image_path, cache_path]
+        }
+        build_body['steps'].append({
+            'name': 'gcr.io/cloud-builders/docker',
+            'args': [
+                'build', '-t', image_path, '-t', cache_path, '.'
+            ]
+        })
+        build = self.client.create_build(project_id, build_body)
+
+        image = build.results.images[0]
+        # image.name carries the tag; pin the bare repository so a cache hit yields the same reference
+        return f"{image_repo}@{image.digest}"
@@ -1,19 +1,38 @@
-from deploybot.cloud.gcp.cloud_run import GCPCloudRun
+from deploybot.cloud.gcp.cloud_run import GCPCloudRun, GCPCloudRunAsync
 from google.cloud.run_v2 import Service
-from google.iam.v1.policy_pb2 import Binding    
+from google.iam.v1.policy_pb2 import Binding, Policy
+import json
+from typing import Optional
+
+def _print_binding(binding: Binding) -> None:
+    print("Adding new binding:")
+    print(json.dumps({
+        'role': binding.role,
+        'members': list(binding.members)
+    }, indent=2))
+
+def _binding_exists(policy: Policy, binding: Binding) -> bool:
+    for b in policy.bindings:
+        if b.role == binding.role and set(b.members) == set(binding.members):
+            return True
+    return False
 
 class GCPCloudRunService:
     def __init__(self):
         self.client = GCPCloudRun()
 
-    def deploy(self, project_id: str, region: str, service_name: str, service_body: Service) -> Service:
+    def deploy(self, project_id: str, region: str, service_name: str, service_body: Service, exists: Optional[bool] = None) -> Service:
+        """Create or update the service; pass `exists` when already known to skip the lookup."""
         print(f"Deploying to Cloud Run: {service_name}")
-        try:
-            service = self.client.get_service(project_id, region, service_name)
-            service = self.client.update_service(project_id, region, service_name, service_body)
-        except Exception:
-            service = self.client.create_service(project_id, region, service_name, service_body)
-        return service
+        if exists is None:
+            try:
+                self.client.get_service(project_id, region, service_name)
+                exists = True
+            except Exception:
+                exists = False
+        if exists:
+            return self.client.update_service(project_id, region, service_name, service_body)
+        return self.client.create_service(project_id, region, service_name, service_body)
 
     def delete_service(self, project_id: str, region: str, service_name: str) -> None:
         try:
@@ -28,24 +47,12 @@ class GCPCloudRunService:
 
 
     def set_iam_policy(self, project_id: str, region: str, service_name: str, binding: Binding) -> None:
-        import json
         print(f"Fetching current IAM policy for service: {service_name} in {region}, project: {project_id}")
         policy = self.client.get_iam_policy(project_id, region, service_name)
-        
-        print("Adding new binding:")
-        print(json.dumps({
-            'role': binding.role,
-            'members': list(binding.members)
-        }, indent=2))
+        _print_binding(binding)
 
         # Validation: check if binding already exists
-        binding_exists = False
-        for b in policy.bindings:
-            if b.role == binding.role and set(b.members) == set(binding.members):
-                binding_exists = True
-                break
-        
-        if binding_exists:
+        if _binding_exists(policy, binding):
             print("Binding already exists in the policy. Skipping append.")
             return
 
@@ -53,3 +60,47 @@ class GCPCloudRunService:
         print("Setting updated IAM policy...")
         self.client.set_iam_policy(project_id, region, service_name, policy)
         print("IAM policy updated successfully.")
+
+
+class GCPCloudRunAsyncService:
+    """Asyncio counterpart of GCPCloudRunService."""
+
+    def __init__(self):
+        self.client = GCPCloudRunAsync()
+
+    async def deploy(self, project_id: str, region: str, service_name: str, service_body: Service, exists: Optional[bool] = None) -> Service:
+        print(f"Deploying to Cloud Run: {service_name}")
+        if exists is None:
+            try:
+                await self.client.get_service(project_id, region, service_name)
+                exists = True
+            except Exception:
+                exists = False
+        if exists:
+            return await self.client.update_service(project_id, region, service_name, service_body)
+        return await self.client.create_service(project_id, region, service_name, service_body)
+
+    async def delete_service(self, project_id: str, region: str, service_name: str) -> None:
+        try:
+            await self.client.get_service(project_id, region, service_name)
+        except Exception:
+            print(f"Service {service_name} not found in {region}, project: {project_id}")
+            print("Skipping deletion...")
+            return
+        print(f"Deleting service: {service_name} in {region}, project: {project_id}")
+        await self.client.delete_service(project_id, region, service_name)
+        print(f"Deleted service: {service_name} in {region}, project: {project_id}")
+
+    async def set_iam_policy(self, project_id: str, region: str, service_name: str, binding: Binding) -> None:
+        print(f"Fetching current IAM policy for service: {service_name} in {region}, project: {project_id}")
+        policy = await self.client.get_iam_policy(project_id, region, service_name)
+        _print_binding(binding)
+
+        if _binding_exists(policy, binding):
+            print("Binding already exists in the policy. Skipping append.")
+            return
+
+        policy.bindings.append(binding)
+        print("Setting updated IAM policy...")
+        await self.client.set_iam_policy(project_id, region, service_name, policy)
+        print("IAM policy updated successfully.")
@@ -1,14 +1,73 @@
-from deploybot.cloud.gcp.service_usage import GCPServiceUsage
+from typing import List
+from deploybot.cloud.gcp.service_usage import GCPServiceUsage, GCPServiceUsageAsync
 from deploybot.cloud.gcp.enums.services import GoogleCloudService
+from deploybot.utils.cache import JsonFileCache
 from google.cloud import service_usage_v1
 
+# How long an API seen as enabled is trusted before it is checked again
+_ENABLED_APIS_TTL = 6 * 60 * 60
+
+def _unknown_apis(cache: JsonFileCache, project_id: str, api_names: List[GoogleCloudService]) -> List[GoogleCloudService]:
+    """Return the APIs not already recorded as enabled for the project."""
+    known_enabled = set(cache.get(project_id) or [])
+    unknown = [api_name for api_name in api_names if api_name.value not in known_enabled]
+    if not unknown:
+        print(f"APIs already enabled for project {project_id} (cached)")
+    return unknown
+
+def _missing_apis(api_names: List[GoogleCloudService], services: List[service_usage_v1.Service]) -> List[GoogleCloudService]:
+    """Return the APIs whose fetched service state is not ENABLED."""
+    enabled = {
+        service.name.rsplit('/', 1)[-1]
+        for service in services
+        if service.state == service_usage_v1.State.ENABLED
+    }
+    return [api_name for api_name in api_names if api_name.value not in enabled]
+
+def _record_enabled(cache: JsonFileCache, project_id: str, api_names: List[GoogleCloudService]) -> None:
+    known_enabled = set(cache.get(project_id) or [])
+    known_enabled.update(api_name.value for api_name in api_names)
+    cache.set(project_id, sorted(known_enabled))
+
 class GCPServiceUsageService:
     def __init__(self):
         self.service_usage = GCPServiceUsage()
+        self.enabled_apis_cache = JsonFileCache('enabled_apis', ttl=_ENABLED_APIS_TTL)
 
     def enable_api(self, project_id: str, api_name: GoogleCloudService):
-        api = self.service_usage.get_api(project_id, api_name)
-        if api.state == service_usage_v1.State.ENABLED:
+        self.enable_apis(project_id, [api_name])
+
+    def enable_apis(self, project_id: str, api_names: List[GoogleCloudService]) -> None:
+        """Ensure all given APIs are enabled using one batch check and one batch enable."""
+        unknown = _unknown_apis(self.enabled_apis_cache, project_id, api_names)
+        if not unknown:
             return
-        print(f"Enabling API {api_name} for project {project_id}")
-        self.service_usage.enable_api(project_id, api_name)
+
+        missing = _missing_apis(unknown, self.service_usage.batch_get_apis(project_id, unknown))
+        if missing:
+            print(f"Enabling APIs {', '.join(api_name.value for api_name in missing)} for project {project_id}")
+            self.service_usage.batch_enable_apis(project_id, missing)
+
+        _record_enabled(self.enabled_apis_cache, project_id, unknown)
+
+class GCPServiceUsageAsyncService:
+    """Asyncio counterpart of GCPServiceUsageService sharing the same enabled-API cache."""
+
+    def __init__(self):
+        self.service_usage = GCPServiceUsageAsync()
+        self.enabled_apis_cache = JsonFileCache('enabled_apis', ttl=_ENABLED_APIS_TTL)
+
+    async def enable_api(self, project_id: str, api_name: GoogleCloudService):
+        await self.enable_apis(project_id, [api_name])
+
+    async def enable_apis(self, project_id: str, api_names: List[GoogleCloudService]) -> None:
+        unknown = _unknown_apis(self.enabled_apis_cache, project_id, api_names)
+        if not unknown:
+            return
+
+        missing = _missing_apis(unknown, await self.service_usage.batch_get_apis(project_id, unknown))
+        if missing:
+            print(f"Enabling APIs {', '.join(api_name.value for api_name in missing)} for project {project_id}")
+            await self.service_usage.batch_enable_apis(project_id, missing)
+
+        _record_enabled(self.enabled_apis_cache, project_id, unknown)
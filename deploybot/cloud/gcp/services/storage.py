@@ -1,25 +1,70 @@
-import tarfile
+import asyncio
 import os
-from deploybot.cloud.gcp.storage import GCPStorage
-
+import tempfile
+from typing import Tuple
+from deploybot.cloud.gcp.storage import GCPStorage, GCPStorageAsync
+from deploybot.cloud.gcp.models.source_archive import SourceArchive
+from deploybot.utils.archive import SourceTree, hash_source_tree, write_deterministic_tar
+from deploybot.utils.compression import CompressionCodec, get_codec
+from deploybot.utils.stream import BoundedPipe
 
 class GCPStorageService:
     def __init__(self):
         self.client = GCPStorage()
 
+    @staticmethod
+    def _describe_source(bucket_name: str, source_dir: str, object_prefix: str, codec: CompressionCodec) -> Tuple[SourceArchive, SourceTree]:
+        tree = SourceTree(source_dir)
+        digest = hash_source_tree(tree)
+        archive = SourceArchive(
+            bucket_name,
+            f"{object_prefix}/{digest}.{codec.extension}",
+            digest,
+            compression=codec.name,
+            included_bytes=tree.included_bytes,
+            excluded_bytes=tree.excluded_bytes
+        )
+        return archive, tree
+
+    def describe_source(self, bucket_name: str, source_dir: str, object_prefix: str, compression: str = 'gzip') -> SourceArchive:
+        """Return the archive upload_source would produce for source_dir, without uploading it."""
+        return self._describe_source(bucket_name, source_dir, object_prefix, get_codec(compression))[0]
+
+    def upload_source(self, bucket_name: str, source_dir: str, object_prefix: str, streaming: bool = True, compression: str = 'gzip') -> SourceArchive:
+        """Upload source_dir as a content-addressed archive, skipping work if it already exists.
+
+        In streaming mode the archive is compressed on a producer thread straight
+        into a chunked resumable upload, so no temporary file is written and
+        memory use does not grow with the size of the tree. `compression` names
+        a codec from deploybot.utils.compression and is recorded on the archive.
+        Paths matched by the directory's .dockerignore/.gcloudignore are left out.
+        """
+        codec = get_codec(compression)
+        archive, tree = self._describe_source(bucket_name, source_dir, object_prefix, codec)
+        print(f"Packaging {source_dir}: {tree.summary()}")
+        if self.client.file_exists(bucket_name, archive.object_name):
+            print(f"Source unchanged, reusing {archive.uri}")
+            return archive
+
+        if streaming:
+            with BoundedPipe(lambda writer: write_deterministic_tar(tree, writer, codec)) as stream:
+                self.client.upload_stream(bucket_name, stream, archive.object_name)
+        else:
+            fd, tar_path = tempfile.mkstemp(prefix=f"{object_prefix}-", suffix=f".{codec.extension}")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    write_deterministic_tar(tree, f, codec)
+                self.client.upload_file(bucket_name, tar_path, archive.object_name)
+            finally:
+                # Clean up temporary tar file
+                os.remove(tar_path)
+        print(f"Uploaded source to {archive.uri}")
+
+        archive.uploaded = True
+        return archive
+
     def upload_directory_as_tar(self, bucket_name: str, source_dir: str, object_name: str) -> str:
-        tar_path = f"/tmp/{object_name}.tar.gz"
-        with tarfile.open(tar_path, "w:gz") as tar:
-            tar.add(source_dir, arcname=".")
-
-        # Upload to GCS
-        self.client.upload_file(bucket_name, tar_path, f"{object_name}.tar.gz")
-        print(f"Uploaded source to gs://{bucket_name}/{object_name}.tar.gz")
-        
-        # Clean up temporary tar file
-        os.remove(tar_path)
-        
-        return f"{object_name}.tar.gz"
+        return self.upload_source(bucket_name, source_dir, object_name).object_name
 
     def delete_file(self, bucket_name: str, object_name: str) -> None:
         file = self.client.get_file(bucket_name, object_name)
@@ -30,3 +75,40 @@ class GCPStorageService:
 
         print(f"File not found: gs://{bucket_name}/{object_name}")
         print("Skipping deletion...")
+
+    def delete_files_with_prefix(self, bucket_name: str, prefix: str) -> None:
+        deleted = 0
+        for blob in self.client.list_files(bucket_name, prefix):
+            blob.delete()
+            deleted += 1
+        print(f"Deleted {deleted} file(s) under gs://{bucket_name}/{prefix}")
+
+
+class GCPStorageAsyncService:
+    """Asyncio counterpart of GCPStorageService."""
+
+    def __init__(self):
+        self.sync = GCPStorageService()
+        self.client = GCPStorageAsync()
+
+    async def upload_source(self, bucket_name: str, source_dir: str, object_prefix: str, streaming: bool = True, compression: str = 'gzip') -> SourceArchive:
+        # Hashing and archiving are CPU and disk bound, so they run off the event loop along with the upload
+        return await asyncio.to_thread(self.sync.upload_source, bucket_name, source_dir, object_prefix, streaming, compression)
+
+    async def describe_source(self, bucket_name: str, source_dir: str, object_prefix: str, compression: str = 'gzip') -> SourceArchive:
+        return await asyncio.to_thread(self.sync.describe_source, bucket_name, source_dir, object_prefix, compression)
+
+    async def upload_directory_as_tar(self, bucket_name: str, source_dir: str, object_name: str) -> str:
+        return (await self.upload_source(bucket_name, source_dir, object_name)).object_name
+
+    async def delete_file(self, bucket_name: str, object_name: str) -> None:
+        if await self.client.file_exists(bucket_name, object_name):
+            await self.client.delete_file(bucket_name, object_name)
+            print(f"Deleted file: gs://{bucket_name}/{object_name}")
+            return
+
+        print(f"File not found: gs://{bucket_name}/{object_name}")
+        print("Skipping deletion...")
+
+    async def delete_files_with_prefix(self, bucket_name: str, prefix: str) -> None:
+        await asyncio.to_thread(self.sync.delete_files_with_prefix, bucket_name, prefix)
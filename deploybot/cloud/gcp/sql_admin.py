@@ -1,45 +1,55 @@
+import asyncio
+from concurrent.futures import Future
 from .client_factory import GCPClientFactory
+from .operation_poller import operation_poller, poll_async
 import time
 
 class GCPCloudSQLAdmin:
-    _INSTANCE_CREATION_TIMEOUT = 60
+    # Timeouts in seconds; instance creation and deletion routinely take several minutes
+    _INSTANCE_CREATION_TIMEOUT = 30 * 60
+    _OPERATION_TIMEOUT = 15 * 60
     _INSTANCE_OPERATION_MESSAGE_TEMPLATE = "Cloud SQL instance '{instance_name}'"
     _DATABASE_OPERATION_MESSAGE_TEMPLATE = "Cloud SQL database '{database_name}'"
     _USER_OPERATION_MESSAGE_TEMPLATE = "Cloud SQL user '{user_name}'"
     
     def __init__(self) -> None:
         self.client = GCPClientFactory().get_sql_admin_client()
+        # Each collection call builds a new Resource with all its methods; build them once
+        self._instances = self.client.instances()
+        self._databases = self.client.databases()
+        self._users = self.client.users()
+        self._operations = self.client.operations()
         
     # Instance API
     def create_instance_async(self, project_id: str, instance_body: dict) -> str:
-        request = self.client.instances().insert(project=project_id, body=instance_body)
+        request = self._instances.insert(project=project_id, body=instance_body)
         response = request.execute()
         return response['name']
         
     def create_instance(self, project_id: str, instance_name: str, instance_body: dict) -> dict:
         operation_name = self.create_instance_async(project_id, instance_body)
         message = self._INSTANCE_OPERATION_MESSAGE_TEMPLATE.format(instance_name=instance_name)
-        self.wait_for_operation(project_id, operation_name, message, self._INSTANCE_CREATION_TIMEOUT)
+        self.wait_for_operation(project_id, operation_name, message, timeout=self._INSTANCE_CREATION_TIMEOUT)
         return self.get_instance(project_id, instance_name)
 
     def get_instance(self, project_id: str, instance_name: str) -> dict:
-        request = self.client.instances().get(project=project_id, instance=instance_name)
+        request = self._instances.get(project=project_id, instance=instance_name)
         response = request.execute()
         return response
 
     def delete_instance_async(self, project_id: str, instance_name: str) -> str:
-        request = self.client.instances().delete(project=project_id, instance=instance_name)
+        request = self._instances.delete(project=project_id, instance=instance_name)
         response = request.execute()
         return response['name']
 
     def delete_instance(self, project_id: str, instance_name: str) -> None:
         operation_name = self.delete_instance_async(project_id, instance_name)
         message = self._INSTANCE_OPERATION_MESSAGE_TEMPLATE.format(instance_name=instance_name)
-        self.wait_for_operation(project_id, operation_name, message)
+        self.wait_for_operation(project_id, operation_name, message, timeout=self._INSTANCE_CREATION_TIMEOUT)
 
     # Database API
     def create_database_async(self, project_id: str, instance_name: str, database_body: dict) -> str:
-        request = self.client.databases().insert(project=project_id, instance=instance_name, body=database_body)
+        request = self._databases.insert(project=project_id, instance=instance_name, body=database_body)
         response = request.execute()
         return response['name']
     
@@ -50,13 +60,13 @@ class GCPCloudSQLAdmin:
         return self.get_database(project_id, instance_name, database_name)
     
     def get_database(self, project_id: str, instance_name: str, database_name: str) -> dict:
-        request = self.client.databases().get(project=project_id, instance=instance_name, database=database_name)
+        request = self._databases.get(project=project_id, instance=instance_name, database=database_name)
         response = request.execute()
         return response
     
     # User API
     def create_user_async(self, project_id: str, instance_name: str, user_body: dict) -> str:
-        request = self.client.users().insert(project=project_id, instance=instance_name, body=user_body)
+        request = self._users.insert(project=project_id, instance=instance_name, body=user_body)
         response = request.execute()
         return response['name']
     
@@ -67,28 +77,85 @@ class GCPCloudSQLAdmin:
         return self.get_user(project_id, instance_name, user_name)
     
     def get_user(self, project_id: str, instance_name: str, user_name: str) -> dict:    
-        request = self.client.users().get(project=project_id, instance=instance_name, name=user_name)
+        request = self._users.get(project=project_id, instance=instance_name, name=user_name)
         response = request.execute()
         return response
 
     # Operation API
     def get_operation(self, project_id: str, operation_name: str) -> dict:
-        request = self.client.operations().get(project=project_id, operation=operation_name)
+        request = self._operations.get(project=project_id, operation=operation_name)
         response = request.execute()
         return response
     
-    def wait_for_operation(self, project_id: str, operation_name: str, resource_message:str, wait_time: int = 10) -> dict:
-        total_time = 0
-        while True:
-            operation = self.get_operation(project_id, operation_name)
-            
-            operation_type = operation['operationType']
-            print(f"Waiting for operation {operation_type} of {resource_message} to complete... [{total_time}s]")
-            
-            if operation['status'] == 'DONE':
-                print(f"Operation {operation_type} of {resource_message} completed successfully in {total_time} seconds")
-                return operation
-            
-            print(f"Waiting for {wait_time} seconds before checking again...")
-            total_time += wait_time
-            time.sleep(wait_time)
+    @staticmethod
+    def _check_operation(resource_message: str, operation: dict, start_time: float):
+        """Return (done, operation) for a Cloud SQL operation, raising if it failed."""
+        if operation['status'] != 'DONE':
+            return False, None
+        operation_type = operation['operationType']
+        if 'error' in operation:
+            raise Exception(f"Operation {operation_type} of {resource_message} failed: {operation['error']}")
+        print(f"Operation {operation_type} of {resource_message} completed successfully in {round(time.monotonic() - start_time)} seconds")
+        return True, operation
+
+    def watch_operation(self, project_id: str, operation_name: str, resource_message: str, timeout: float = _OPERATION_TIMEOUT) -> Future:
+        """Track an operation on the shared poller and return a future for the finished operation."""
+        start_time = time.monotonic()
+
+        def check():
+            return self._check_operation(resource_message, self.get_operation(project_id, operation_name), start_time)
+
+        print(f"Waiting for operation on {resource_message} to complete...")
+        return operation_poller.submit(check, f"operation on {resource_message}", timeout)
+
+    def wait_for_operation(self, project_id: str, operation_name: str, resource_message: str, timeout: float = _OPERATION_TIMEOUT) -> dict:
+        return self.watch_operation(project_id, operation_name, resource_message, timeout).result()
+
+
+class GCPCloudSQLAdminAsync:
+    """Asyncio counterpart of GCPCloudSQLAdmin.
+
+    SQL Admin has no gRPC async client, so each REST call runs on the default
+    executor while operation polling stays on the event loop.
+    """
+
+    def __init__(self) -> None:
+        self.sync = GCPCloudSQLAdmin()
+
+    async def get_instance(self, project_id: str, instance_name: str) -> dict:
+        return await asyncio.to_thread(self.sync.get_instance, project_id, instance_name)
+
+    async def create_instance(self, project_id: str, instance_name: str, instance_body: dict) -> dict:
+        operation_name = await asyncio.to_thread(self.sync.create_instance_async, project_id, instance_body)
+        message = GCPCloudSQLAdmin._INSTANCE_OPERATION_MESSAGE_TEMPLATE.format(instance_name=instance_name)
+        await self.wait_for_operation(project_id, operation_name, message, timeout=GCPCloudSQLAdmin._INSTANCE_CREATION_TIMEOUT)
+        return await self.get_instance(project_id, instance_name)
+
+    async def delete_instance(self, project_id: str, instance_name: str) -> None:
+        operation_name = await asyncio.to_thread(self.sync.delete_instance_async, project_id, instance_name)
+        message = GCPCloudSQLAdmin._INSTANCE_OPERATION_MESSAGE_TEMPLATE.format(instance_name=instance_name)
+        await self.wait_for_operation(project_id, operation_name, message, timeout=GCPCloudSQLAdmin._INSTANCE_CREATION_TIMEOUT)
+
+    async def get_database(self, project_id: str, instance_name: str, database_name: str) -> dict:
+        return await asyncio.to_thread(self.sync.get_database, project_id, instance_name, database_name)
+
+    async def create_database_async(self, project_id: str, instance_name: str, database_body: dict) -> str:
+        return await asyncio.to_thread(self.sync.create_database_async, project_id, instance_name, database_body)
+
+    async def get_user(self, project_id: str, instance_name: str, user_name: str) -> dict:
+        return await asyncio.to_thread(self.sync.get_user, project_id, instance_name, user_name)
+
+    async def create_user_async(self, project_id: str, instance_name: str, user_body: dict) -> str:
+        return await asyncio.to_thread(self.sync.create_user_async, project_id, instance_name, user_body)
+
+    async def get_operation(self, project_id: str, operation_name: str) -> dict:
+        return await asyncio.to_thread(self.sync.get_operation, project_id, operation_name)
+
+    async def wait_for_operation(self, project_id: str, operation_name: str, resource_message: str, timeout: float = GCPCloudSQLAdmin._OPERATION_TIMEOUT) -> dict:
+        start_time = time.monotonic()
+
+        async def check():
+            return GCPCloudSQLAdmin._check_operation(resource_message, await self.get_operation(project_id, operation_name), start_time)
+
+        print(f"Waiting for operation on {resource_message} to complete...")
+        return await poll_async(check, f"operation on {resource_message}", timeout)
@@ -1,6 +1,11 @@
+import asyncio
+from typing import BinaryIO, List
 from .client_factory import GCPClientFactory
 from google.cloud.storage import Blob
 
+# Resumable upload chunk size; must be a multiple of 256 KiB
+_STREAM_CHUNK_SIZE = 8 * 1024 * 1024
+
 class GCPStorage:
     def __init__(self):
         self.client = GCPClientFactory().get_storage_client()
@@ -11,6 +16,13 @@ class GCPStorage:
         blob.upload_from_filename(file_path)
         return blob
     
+    def upload_stream(self, bucket_name: str, stream: BinaryIO, destination_path: str, chunk_size: int = _STREAM_CHUNK_SIZE) -> Blob:
+        """Upload a forward-only stream of unknown length as a chunked resumable upload."""
+        bucket = self.client.bucket(bucket_name)
+        blob = bucket.blob(destination_path, chunk_size=chunk_size)
+        blob.upload_from_file(stream, rewind=False)
+        return blob
+
     def delete_file(self, bucket_name: str, file_path: str) -> None:
         bucket = self.client.bucket(bucket_name)
         blob = bucket.blob(file_path)
@@ -26,3 +38,30 @@ class GCPStorage:
         blob = bucket.blob(file_path)
         return blob
 
+    def list_files(self, bucket_name: str, prefix: str) -> List[Blob]:
+        return list(self.client.list_blobs(bucket_name, prefix=prefix))
+
+
+class GCPStorageAsync:
+    """Asyncio counterpart of GCPStorage.
+
+    google-cloud-storage has no async client, so calls run on the default executor.
+    """
+
+    def __init__(self):
+        self.sync = GCPStorage()
+
+    async def upload_file(self, bucket_name: str, file_path: str, destination_path: str) -> Blob:
+        return await asyncio.to_thread(self.sync.upload_file, bucket_name, file_path, destination_path)
+
+    async def delete_file(self, bucket_name: str, file_path: str) -> None:
+        await asyncio.to_thread(self.sync.delete_file, bucket_name, file_path)
+
+    async def file_exists(self, bucket_name: str, file_path: str) -> bool:
+        return await asyncio.to_thread(self.sync.file_exists, bucket_name, file_path)
+
+    async def get_file(self, bucket_name: str, file_path: str) -> Blob:
+        return self.sync.get_file(bucket_name, file_path)
+
+    async def list_files(self, bucket_name: str, prefix: str) -> List[Blob]:
+        return await asyncio.to_thread(self.sync.list_files, bucket_name, prefix)
@@ -1,13 +1,20 @@
-from .stack import Stack, get_stack
-from .enums import Target, Provisioner
-from .config import StackConfig
-from .parameters import DeployParameters
-
-__all__ = [
-    'Stack',
-    'get_stack',
-    'Target',
-    'Provisioner',
-    'StackConfig',
-    'DeployParameters'
-] 
\ No newline at end of file
+import importlib
+
+# Exports are resolved on first access so importing a light submodule
+# (e.g. deploybot.core.enums) does not pull in pydantic and yaml
+_EXPORTS = {
+    'Stack': '.stack',
+    'get_stack': '.stack',
+    'Target': '.enums',
+    'Provisioner': '.enums',
+    'StackConfig': '.config',
+    'DeployParameters': '.parameters',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,199 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class FleetItem:
+    """One stack of a fleet run, with optional per-stack overrides."""
+    stack: str
+    target: Optional[str] = None
+    project_id: Optional[str] = None
+    region: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        placement = '/'.join(part for part in (self.target, self.region) if part)
+        return f"{self.stack}@{placement}" if placement else self.stack
+
+
+@dataclass
+class FleetResult:
+    """Outcome and timing of one stack in a fleet run."""
+    item: FleetItem
+    succeeded: bool
+    seconds: float
+    error: Optional[str] = None
+    outputs: Optional[Dict[str, Any]] = None
+
+
+def load_manifest(path: str) -> List[Dict[str, Any]]:
+    """Read a fleet manifest.
+
+    The manifest is a YAML list, or a mapping with a 'stacks' list. Each entry
+    is a stack name or a mapping with 'stack' and optional 'target',
+    'project_id' and 'region'.
+    """
+    import yaml
+
+    with open(path, 'r') as f:
+        content = yaml.safe_load(f)
+    if isinstance(content, dict):
+        content = content.get('stacks')
+    if not isinstance(content, list):
+        raise ValueError(f"Manifest '{path}' must be a list of stacks or contain a 'stacks' list")
+
+    entries = []
+    for entry in content:
+        if isinstance(entry, str):
+            entry = {'stack': entry}
+        if not isinstance(entry, dict) or not entry.get('stack'):
+            raise ValueError(f"Invalid manifest entry in '{path}': {entry!r}")
+        unknown = set(entry) - {'stack', 'target', 'project_id', 'region'}
+        if unknown:
+            raise ValueError(f"Unknown keys {sorted(unknown)} for stack '{entry['stack']}' in '{path}'")
+        entries.append(entry)
+    return entries
+
+
+def split_list(value: Optional[str]) -> List[str]:
+    """Split a comma-separated option value, dropping blanks."""
+    return [part.strip() for part in (value or '').split(',') if part.strip()]
+
+
+def _regions_for(target: Optional[str], regions: List[str]) -> List[Optional[str]]:
+    """Regions that apply to a target; 'gcp:europe-west1' only applies to gcp, plain names to every target."""
+    selected = []
+    for region in regions:
+        region_target, _, name = region.rpartition(':')
+        if not region_target or region_target == target:
+            selected.append(name)
+    return selected
+
+
+def _check_plain_regions(entries: List[Dict[str, Any]], fan_targets: List[Optional[str]], regions: List[str]) -> None:
+    """Refuse a region without a target prefix when the regions are applied to more than one target.
+
+    Region names are per cloud, so 'us-central1' next to '--targets gcp,aws'
+    would also schedule a GCP region on AWS.
+    """
+    plain = [region for region in regions if ':' not in region]
+    if not plain:
+        return
+    region_targets = {entry['target'] for entry in entries if entry.get('target') and not entry.get('region')}
+    if any(not entry.get('target') and not entry.get('region') for entry in entries):
+        region_targets.update(fan_targets)
+    if len(region_targets) > 1:
+        raise ValueError(
+            f"Region(s) {', '.join(plain)} would apply to every target ({', '.join(sorted(t or 'default' for t in region_targets))}); "
+            f"prefix each region with its target, e.g. gcp:{plain[0]}"
+        )
+
+
+def resolve_fleet(stacks: Optional[str], manifest: Optional[str], target: Optional[str] = None,
+                  project_id: Optional[str] = None, region: Optional[str] = None,
+                  targets: Optional[str] = None, regions: Optional[str] = None) -> List[FleetItem]:
+    """Build the fleet from --stacks and/or --manifest; command-line options are defaults for every stack.
+
+    --targets and --regions fan each stack out to every target/region pair.
+    With more than one target, every region needs a 'target:' prefix.
+    Targets or regions set on a manifest entry are not fanned out.
+    """
+    entries = [{'stack': name} for name in split_list(stacks)]
+    if manifest:
+        entries.extend(load_manifest(manifest))
+    fan_targets = split_list(targets) or [target]
+    fan_regions = split_list(regions)
+    _check_plain_regions(entries, fan_targets, fan_regions)
+
+    items = []
+    seen = set()
+    for entry in entries:
+        for item_target in ([entry['target']] if entry.get('target') else fan_targets):
+            if entry.get('region'):
+                item_regions = [entry['region']]
+            elif fan_regions:
+                item_regions = _regions_for(item_target, fan_regions)
+                if not item_regions:
+                    raise ValueError(f"None of --regions applies to target '{item_target or 'default'}' of stack '{entry['stack']}'")
+            else:
+                item_regions = [region]
+            for item_region in item_regions:
+                item = FleetItem(
+                    stack=entry['stack'],
+                    target=item_target,
+                    project_id=entry.get('project_id') or project_id,
+                    region=item_region
+                )
+                key = (item.stack, item.target, item.project_id, item.region)
+                if key not in seen:
+                    seen.add(key)
+                    items.append(item)
+    if not items:
+        raise ValueError("No stacks given")
+    return items
+
+
+def run_fleet(items: List[FleetItem], operation: Callable[[FleetItem], Optional[Dict[str, Any]]],
+              parallelism: int = 4) -> List[FleetResult]:
+    """Run operation for every stack, at most `parallelism` at once; results keep the input order.
+
+    A failing stack does not stop the others.
+    """
+    if parallelism < 1:
+        raise ValueError("parallelism must be at least 1")
+    print_lock = threading.Lock()
+
+    def run_one(item: FleetItem) -> FleetResult:
+        start_time = time.time()
+        with print_lock:
+            print(f"▶️  [{item.label}] started")
+        try:
+            outputs = operation(item)
+            result = FleetResult(item, True, time.time() - start_time, outputs=outputs)
+        except Exception as e:
+            result = FleetResult(item, False, time.time() - start_time, error=str(e))
+        with print_lock:
+            icon = '✅' if result.succeeded else '❌'
+            print(f"{icon} [{item.label}] finished in {result.seconds:.1f} seconds")
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(parallelism, len(items))) as executor:
+        return list(executor.map(run_one, items))
+
+
+def print_fleet_summary(action: str, results: List[FleetResult], total_seconds: float) -> int:
+    """Print per-stack status and timings; returns the number of failed stacks."""
+    failed = [result for result in results if not result.succeeded]
+    width = max(len(result.item.label) for result in results)
+
+    print("\n" + "=" * 60)
+    print(f"📊 Fleet {action} summary")
+    print("=" * 60)
+    for result in results:
+        icon = '✅' if result.succeeded else '❌'
+        line = f"{icon} {result.item.label:<{width}}  {result.seconds:>7.1f}s"
+        if result.error:
+            line += f"  {result.error}"
+        print(line)
+    print(f"\n{len(results) - len(failed)} succeeded, {len(failed)} failed in {round(total_seconds)} seconds")
+    return len(failed)
+
+
+def print_outputs_table(results: List[FleetResult]) -> None:
+    """Print the outputs of every successful stack as one table, one row per stack."""
+    rows = [result for result in results if result.succeeded and result.outputs]
+    if not rows:
+        return
+    columns = []
+    for result in rows:
+        columns.extend(key for key in result.outputs if key not in columns)
+    cells = [[result.item.label] + [str(result.outputs.get(key, '-')) for key in columns] for result in rows]
+    header = ['STACK'] + [key.upper() for key in columns]
+    widths = [max(len(row[i]) for row in cells + [header]) for i in range(len(header))]
+
+    print("\n📊 Outputs:")
+    for row in [header] + cells:
+        print('   ' + '  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
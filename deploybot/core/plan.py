@@ -0,0 +1,96 @@
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class ChangeAction(str, Enum):
+    """What deploy will do to a resource."""
+    CREATE = "create"
+    UPDATE = "update"
+    NOOP = "no-op"
+
+
+_SYMBOLS = {
+    ChangeAction.CREATE: '+',
+    ChangeAction.UPDATE: '~',
+    ChangeAction.NOOP: '=',
+}
+
+
+@dataclass
+class ResourceChange:
+    """The planned change for the resource managed by one recipe step.
+
+    No-op changes carry the step's input fingerprint and outputs, so deploy
+    can skip the step without probing the resource again.
+    """
+    step: str
+    kind: str
+    name: str
+    action: ChangeAction
+    reasons: List[str] = field(default_factory=list)
+    fingerprint: Optional[str] = None
+    outputs: Any = None
+
+
+@dataclass
+class DeploymentPlan:
+    """Per-resource diff between the desired stack and what is live."""
+    stack: str
+    variables_fingerprint: str
+    changes: List[ResourceChange]
+    created_at: float = field(default_factory=time.time)
+
+    def change_for(self, step: str) -> Optional[ResourceChange]:
+        for change in self.changes:
+            if change.step == step:
+                return change
+        return None
+
+    def precomputed_steps(self) -> Dict[str, Dict[str, Any]]:
+        """Return {step: {'fingerprint', 'outputs'}} for every step the plan found unchanged."""
+        return {
+            change.step: {'fingerprint': change.fingerprint, 'outputs': change.outputs}
+            for change in self.changes
+            if change.action == ChangeAction.NOOP and change.fingerprint is not None
+        }
+
+    def counts(self) -> Dict[ChangeAction, int]:
+        counts = {action: 0 for action in ChangeAction}
+        for change in self.changes:
+            counts[change.action] += 1
+        return counts
+
+    def print(self) -> None:
+        print(f"\n📝 Planned changes for {self.stack}:")
+        for change in self.changes:
+            print(f"   {_SYMBOLS[change.action]} {change.action.value:<7} {change.kind}: {change.name}")
+            for reason in change.reasons:
+                print(f"      └─ {reason}")
+        counts = self.counts()
+        print(
+            f"\nPlan: {counts[ChangeAction.CREATE]} to create, "
+            f"{counts[ChangeAction.UPDATE]} to update, "
+            f"{counts[ChangeAction.NOOP]} unchanged."
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(asdict(self), f, indent=2, default=str)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'DeploymentPlan':
+        with open(path, 'r') as f:
+            data = json.load(f)
+        changes = [
+            ResourceChange(**{**change, 'action': ChangeAction(change['action'])})
+            for change in data.pop('changes')
+        ]
+        return cls(changes=changes, **data)
@@ -1,12 +1,28 @@
 import os
 import json
+import time
 import inspect
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from deploybot.core.scheduler import Step, StepScheduler
+from deploybot.core.state import DeploymentState, compute_fingerprint
+from deploybot.core.plan import DeploymentPlan
 
 class BaseRecipe(ABC):
-    def __init__(self):
-        self.variables = self._load_variables()
+    # Upper bound on steps running at once; overridable via the 'max_parallel_steps' variable
+    max_parallel_steps = 4
+    # Saved plans older than this (seconds) are refused; overridable via 'plan_max_age'
+    plan_max_age = 15 * 60
+    # Whether the recipe implements status()
+    supports_status = False
+
+    def __init__(self, variables: Optional[Dict[str, Any]] = None):
+        # Provisioners pass variables directly, so concurrent deployments of one recipe
+        # (e.g. several regions) never read each other's variables.json
+        self.variables = variables if variables is not None else self._load_variables()
+        self.state = self._load_state()
 
     def _load_variables(self):
         child_file = inspect.getfile(self.__class__)
@@ -15,8 +31,55 @@ class BaseRecipe(ABC):
         with open(var_file, 'r') as f:
             return json.load(f)
 
+    def _load_state(self) -> DeploymentState:
+        # Recipes live at stacks/<stack>/native/<target>/recipe.py
+        recipe_dir = Path(inspect.getfile(self.__class__)).parent
+        return DeploymentState(
+            str(recipe_dir.parent.parent),
+            recipe_dir.name,
+            self.variables.get('project_id'),
+            self.variables.get('region')
+        )
+
+    def run_steps(self, steps: List[Step], plan: Optional[DeploymentPlan] = None) -> Dict[str, Any]:
+        """Run the given steps concurrently, honouring their declared dependencies.
+
+        Steps with a fingerprint are skipped when their inputs match the last
+        deploy, or when the plan found their resource unchanged.
+        """
+        max_workers = int(self.variables.get('max_parallel_steps', self.max_parallel_steps))
+        precomputed = plan.precomputed_steps() if plan else None
+        return StepScheduler(steps, max_workers=max_workers, state=self.state, precomputed=precomputed).run()
+
+    @property
+    def plan_path(self) -> Path:
+        return self.state.directory / 'plans' / f"{self.state.key}.json"
+
+    def new_plan(self, changes) -> DeploymentPlan:
+        return DeploymentPlan(self.state.stack_name, compute_fingerprint(self.variables), changes)
+
+    def save_plan(self, plan: DeploymentPlan) -> None:
+        plan.save(self.plan_path)
+
+    def load_plan(self) -> DeploymentPlan:
+        """Load the saved plan, refusing it if it is stale or the variables have changed."""
+        if not self.plan_path.exists():
+            raise Exception("No saved plan found for this stack, target, project and region. Run 'plan' first.")
+        plan = DeploymentPlan.load(self.plan_path)
+        age = time.time() - plan.created_at
+        max_age = float(self.variables.get('plan_max_age', self.plan_max_age))
+        if age > max_age:
+            raise Exception(f"Saved plan is {age:.0f} seconds old (limit {max_age:.0f}). Run 'plan' again.")
+        if plan.variables_fingerprint != compute_fingerprint(self.variables):
+            raise Exception("Stack variables changed since the plan was made. Run 'plan' again.")
+        return plan
+
+    def discard_plan(self) -> None:
+        if self.plan_path.exists():
+            self.plan_path.unlink()
+
     @abstractmethod
-    def deploy(self):
+    def deploy(self, plan: Optional[DeploymentPlan] = None):
         pass
 
     @abstractmethod
@@ -24,5 +87,9 @@ class BaseRecipe(ABC):
         pass
 
     @abstractmethod
-    def plan(self):
+    def plan(self) -> DeploymentPlan:
         pass
+
+    def status(self) -> Dict[str, Any]:
+        """Compare live resources with the recorded deployment; optional for recipes."""
+        raise Exception(f"The {self.__class__.__name__} recipe does not support status")
@@ -1,20 +1,127 @@
-from stacks.fastapi_postgres.native.gcp.recipe import FastAPIPostgresRecipe
+import importlib
+import importlib.util
+import inspect
+import os
+import sys
+from typing import Dict, Optional, Tuple
+
+from deploybot.core.stack import STACKS_DIR, normalize_name
+
+# Installed packages can ship recipes as entry points named '<stack>' or '<stack>:<target>'
+ENTRY_POINT_GROUP = 'deploybot.recipes'
+
 
 class RecipeRegistry:
-    _registry = {
-        'fastapi_postgres': FastAPIPostgresRecipe
-    }
+    """Finds native recipes without importing them.
+
+    Recipes are discovered from each stack's native/<target>/recipe.py and from
+    the 'deploybot.recipes' entry point group. The index maps stack (and
+    target) to a module path or file; a recipe module is imported only when
+    its stack is actually used. Explicit register() calls take precedence;
+    one registered without a target serves every target.
+    """
+
+    _registry: Dict[Tuple[str, Optional[str]], type] = {}
+    # Discovered recipe classes by recipe file or entry point value, kept apart
+    # from _registry so a lookup without a target never becomes a catch-all
+    _loaded: Dict[str, type] = {}
+    _index: Optional[Dict[Tuple[str, str], str]] = None
+    _entry_points: Optional[Dict[Tuple[str, Optional[str]], str]] = None
+
+    @classmethod
+    def register(cls, recipe_name: str, recipe_class: type, target: Optional[str] = None):
+        cls._registry[(normalize_name(recipe_name), target)] = recipe_class
 
     @classmethod
-    def register(cls, recipe_name: str, recipe_class: type):
-        cls._registry[recipe_name] = recipe_class
+    def _scan_stacks(cls) -> Dict[Tuple[str, str], str]:
+        """Index stacks/<stack>/native/<target>/recipe.py; stat calls only, nothing is imported."""
+        if cls._index is None:
+            index = {}
+            if STACKS_DIR.is_dir():
+                for stack_entry in os.scandir(STACKS_DIR):
+                    native_dir = os.path.join(stack_entry.path, 'native')
+                    if not stack_entry.is_dir() or not os.path.isdir(native_dir):
+                        continue
+                    for target_entry in os.scandir(native_dir):
+                        recipe_file = os.path.join(target_entry.path, 'recipe.py')
+                        if target_entry.is_dir() and os.path.isfile(recipe_file):
+                            index[(normalize_name(stack_entry.name), target_entry.name)] = recipe_file
+            cls._index = index
+        return cls._index
 
     @classmethod
-    def get(cls, recipe_name: str) -> type:
-        if recipe_name not in cls._registry:
-            raise ValueError(f"Recipe {recipe_name} not found in registry")
-        return cls._registry[recipe_name]
-    
+    def _scan_entry_points(cls) -> Dict[Tuple[str, Optional[str]], str]:
+        if cls._entry_points is None:
+            from importlib.metadata import entry_points
+            found = {}
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                stack_name, _, target = entry_point.name.partition(':')
+                found[(normalize_name(stack_name), target or None)] = entry_point.value
+            cls._entry_points = found
+        return cls._entry_points
+
+    @staticmethod
+    def _load_file(recipe_file: str) -> type:
+        relative = os.path.relpath(recipe_file, STACKS_DIR.parent)
+        module_name = os.path.splitext(relative)[0].replace(os.sep, '.')
+        if all(part.isidentifier() for part in module_name.split('.')):
+            module = importlib.import_module(module_name)
+        else:
+            # Stack directories like 'simple-web-server' are not importable by name
+            module_name = f"deploybot_recipes.{normalize_name(module_name)}"
+            if module_name not in sys.modules:
+                spec = importlib.util.spec_from_file_location(module_name, recipe_file)
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+            module = sys.modules[module_name]
+
+        from deploybot.core.recipie import BaseRecipe
+        recipes = [
+            obj for obj in vars(module).values()
+            if inspect.isclass(obj) and issubclass(obj, BaseRecipe) and obj is not BaseRecipe and obj.__module__ == module.__name__
+        ]
+        if len(recipes) != 1:
+            raise ValueError(f"Expected exactly one recipe class in {recipe_file}, found {len(recipes)}")
+        return recipes[0]
+
+    @staticmethod
+    def _load_entry_point(value: str) -> type:
+        module_name, _, class_name = value.partition(':')
+        return getattr(importlib.import_module(module_name), class_name)
+
+    @classmethod
+    def get(cls, recipe_name: str, target: Optional[str] = None) -> type:
+        """Return the recipe class for a stack, importing only that recipe's module."""
+        name = normalize_name(recipe_name)
+        for key in ((name, target), (name, None)):
+            if key in cls._registry:
+                return cls._registry[key]
+
+        index = cls._scan_stacks()
+        recipe_file = index.get((name, target)) if target else None
+        if recipe_file is None and target is None:
+            matches = [path for (stack, _), path in index.items() if stack == name]
+            if len(matches) > 1:
+                raise ValueError(f"Recipe {recipe_name} has several targets; specify one")
+            recipe_file = matches[0] if matches else None
+        if recipe_file is not None:
+            source, load = recipe_file, cls._load_file
+        else:
+            # Only consult installed packages when the stacks directory has no match
+            entry_points = cls._scan_entry_points()
+            source = entry_points.get((name, target)) or entry_points.get((name, None))
+            if source is None:
+                raise ValueError(f"Recipe {recipe_name} not found in registry")
+            load = cls._load_entry_point
+
+        if source not in cls._loaded:
+            cls._loaded[source] = load(source)
+        return cls._loaded[source]
+
     @classmethod
     def list(cls) -> list[str]:
-        return list(cls._registry.keys())
+        names = {name for name, _ in cls._registry}
+        names.update(name for name, _ in cls._scan_stacks())
+        names.update(name for name, _ in cls._scan_entry_points())
+        return sorted(names)
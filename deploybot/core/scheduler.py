@@ -0,0 +1,129 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from deploybot.core.state import DeploymentState, compute_fingerprint
+
+
+@dataclass
+class Step:
+    """A unit of recipe work and the names of the steps it depends on.
+
+    ``func`` is called with a dict mapping each dependency name to its result.
+    ``fingerprint``, when set, receives the same dict and returns the inputs
+    the step depends on; if they match the last recorded run, the step is
+    skipped and its recorded (JSON-serializable) result is reused.
+    """
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    depends_on: Tuple[str, ...] = ()
+    fingerprint: Optional[Callable[[Dict[str, Any]], Any]] = None
+
+
+class StepScheduler:
+    """Runs recipe steps as soon as their dependencies have completed."""
+
+    def __init__(self, steps: List[Step], max_workers: int = 4, state: Optional[DeploymentState] = None,
+                 precomputed: Optional[Dict[str, Dict[str, Any]]] = None):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
+        self.state = state
+        # {step: {'fingerprint', 'outputs'}} from a plan; used like state entries
+        self.precomputed = precomputed or {}
+        self.steps: Dict[str, Step] = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise ValueError(f"Duplicate step '{step.name}'")
+            self.steps[step.name] = step
+        self.durations: Dict[str, float] = {}
+        self.skipped: List[str] = []
+        self._validate()
+
+    def _validate(self) -> None:
+        """Reject unknown dependencies and dependency cycles."""
+        for step in self.steps.values():
+            for dependency in step.depends_on:
+                if dependency not in self.steps:
+                    raise ValueError(f"Step '{step.name}' depends on unknown step '{dependency}'")
+
+        remaining = {name: set(step.depends_on) for name, step in self.steps.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependency cycle between steps: {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def _run_step(self, step: Step, inputs: Dict[str, Any]) -> Any:
+        start_time = time.monotonic()
+        try:
+            if step.fingerprint is None or (self.state is None and not self.precomputed):
+                return step.func(inputs)
+
+            fingerprint = compute_fingerprint(step.fingerprint(inputs))
+            planned = self.precomputed.get(step.name)
+            if planned is not None and planned['fingerprint'] == fingerprint:
+                self.skipped.append(step.name)
+                if self.state is not None:
+                    self.state.record_step(step.name, fingerprint, planned['outputs'])
+                return planned['outputs']
+            recorded = self.state.get_step(step.name) if self.state is not None else None
+            if recorded is not None and recorded['fingerprint'] == fingerprint:
+                self.skipped.append(step.name)
+                return recorded['outputs']
+            result = step.func(inputs)
+            if self.state is not None:
+                self.state.record_step(step.name, fingerprint, result)
+            return result
+        finally:
+            self.durations[step.name] = time.monotonic() - start_time
+
+    def run(self) -> Dict[str, Any]:
+        """Run every step, starting each one the moment its dependencies are done.
+
+        Once a step fails no new steps are started; steps already running are
+        allowed to finish and the first failure is raised.
+        """
+        results: Dict[str, Any] = {}
+        pending = dict(self.steps)
+        waiting_on = {name: set(step.depends_on) for name, step in self.steps.items()}
+        running = {}
+        failure = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                if failure is None:
+                    for name in [name for name in pending if not waiting_on[name]]:
+                        if len(running) >= self.max_workers:
+                            break
+                        step = pending.pop(name)
+                        inputs = {dependency: results[dependency] for dependency in step.depends_on}
+                        running[executor.submit(self._run_step, step, inputs)] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        if failure is None:
+                            failure = (name, e)
+                        continue
+                    if name in self.skipped:
+                        print(f"Step {name} unchanged, skipped")
+                    else:
+                        print(f"Step {name} completed in {self.durations[name]:.1f} seconds")
+                    for deps in waiting_on.values():
+                        deps.discard(name)
+
+        if failure is not None:
+            name, error = failure
+            raise Exception(f"Step '{name}' failed: {error}") from error
+        return results
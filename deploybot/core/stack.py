@@ -1,10 +1,27 @@
 import os
+import hashlib
+import threading
 import yaml
-from typing import List
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 from deploybot.core.config import StackConfig
 from deploybot.core.enums import Provisioner, Target
+from deploybot.utils.cache import JsonFileCache
+
+try:
+    # libyaml-backed loader, several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+STACKS_DIR = Path(__file__).parent.parent.parent / 'stacks'
+
+
+def normalize_name(name: str) -> str:
+    """Stack names match regardless of case and '-' vs '_' (fastapi-postgres == fastapi_postgres)."""
+    return name.strip().lower().replace('-', '_')
 
 class Stack:
     def __init__(self, name: str, path: str):
@@ -17,11 +34,9 @@ class Stack:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Stack configuration file '{config_path}' not found for stack '{self.name}'.")
         
-        with open(config_path, 'r') as f:
-            yaml_content = yaml.safe_load(f)
-        
         try:
-            return StackConfig(**yaml_content)
+            # The cached config is shared; each Stack gets its own copy to modify
+            return get_catalog().load_config(config_path).model_copy(deep=True)
         except Exception as e:
             raise ValueError(f"Invalid configuration for stack '{self.name}' in '{config_path}': {e}")
     
@@ -45,12 +60,128 @@ class Stack:
             raise FileNotFoundError(f"{provisioner.value.title()} directory for target '{target_name}' not found at {provisioner_target_dir}")
         return provisioner_target_dir
 
+@dataclass
+class CatalogEntry:
+    """A stack directory and its validated config, or why it failed to load."""
+    name: str
+    path: str
+    config: Optional[StackConfig] = None
+    error: Optional[str] = None
+
+
+class StackCatalog:
+    """Index of every stacks/<name>/stack.yaml.
+
+    Validated configs are cached in memory and on disk, keyed by stack.yaml
+    path, mtime and size, so an unchanged file is never read or parsed
+    again; listing hundreds of stacks costs one stat per stack. Safe to use
+    from several threads (fleet runs load stacks concurrently).
+    """
+
+    def __init__(self, stacks_dir: Path = STACKS_DIR):
+        self.stacks_dir = Path(stacks_dir)
+        self._configs: Dict[str, Tuple[int, int, StackConfig]] = {}
+        self._disk_cache = JsonFileCache('stack-catalog', ttl=float('inf'))
+        self._disk_key = hashlib.sha256(str(self.stacks_dir.absolute()).encode()).hexdigest()[:32]
+        self._disk_entries: Optional[Dict[str, dict]] = None
+        self._dirty = False
+        # Guards _configs, _disk_entries and _dirty; files are read and parsed outside it
+        self._lock = threading.Lock()
+        # Orders snapshot-and-write, so an older snapshot never overwrites a newer one on disk
+        self._save_lock = threading.Lock()
+
+    def _stored(self) -> Dict[str, dict]:
+        # Callers hold self._lock
+        if self._disk_entries is None:
+            self._disk_entries = self._disk_cache.get(self._disk_key) or {}
+        return self._disk_entries
+
+    def save(self) -> None:
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                # Entries are replaced, never mutated, so a shallow copy is a stable snapshot
+                snapshot = dict(self._stored())
+                self._dirty = False
+            self._disk_cache.set(self._disk_key, snapshot)
+
+    def load_config(self, config_path: str, save: bool = True) -> StackConfig:
+        """Return the validated config for a stack.yaml, parsing it only if it changed."""
+        stat = os.stat(config_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._configs.get(config_path)
+            if cached is not None and cached[:2] == signature:
+                return cached[2]
+            stored = self._stored().get(config_path)
+
+        if stored is not None and (stored['mtime_ns'], stored['size']) == signature:
+            config = StackConfig.model_validate(stored['config'])
+        else:
+            with open(config_path, 'r') as f:
+                yaml_content = yaml.load(f, Loader=_YamlLoader)
+            config = StackConfig(**(yaml_content or {}))
+            with self._lock:
+                self._stored()[config_path] = {
+                    'mtime_ns': signature[0],
+                    'size': signature[1],
+                    'config': config.model_dump(mode='json')
+                }
+                self._dirty = True
+            if save:
+                self.save()
+        with self._lock:
+            self._configs[config_path] = (*signature, config)
+        return config
+
+    def entries(self) -> List[CatalogEntry]:
+        """Return every stack, sorted by name; invalid stacks carry their error."""
+        entries = []
+        if not self.stacks_dir.is_dir():
+            return entries
+        for stack_entry in sorted(os.scandir(self.stacks_dir), key=lambda e: e.name):
+            config_path = os.path.join(stack_entry.path, 'stack.yaml')
+            if not stack_entry.is_dir() or not os.path.isfile(config_path):
+                continue
+            entry = CatalogEntry(stack_entry.name, stack_entry.path)
+            try:
+                entry.config = self.load_config(config_path, save=False)
+            except Exception as e:
+                entry.error = str(e).splitlines()[0]
+            entries.append(entry)
+        self.save()
+        return entries
+
+    def find(self, stack_name: str) -> Optional[Path]:
+        """Resolve a stack by directory name, or by normalized directory or config name."""
+        stack_path = self.stacks_dir / stack_name
+        if stack_path.is_dir():
+            return stack_path
+        wanted = normalize_name(stack_name)
+        for entry in self.entries():
+            if normalize_name(entry.name) == wanted or (entry.config and normalize_name(entry.config.name) == wanted):
+                return Path(entry.path)
+        return None
+
+
+_catalog: Optional[StackCatalog] = None
+_catalog_lock = threading.Lock()
+
+def get_catalog() -> StackCatalog:
+    """Return the process-wide catalog of the bundled stacks directory."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = StackCatalog()
+    return _catalog
+
 def get_stack(stack_name: str) -> Stack:
     """Get a stack instance by name."""
-    stacks_dir = Path(__file__).parent.parent.parent / 'stacks'
-    stack_path = stacks_dir / stack_name
+    stack_path = get_catalog().find(stack_name)
     
-    if not stack_path.is_dir():
+    if stack_path is None:
         raise ValueError(f"Stack '{stack_name}' not found.")
     
-    return Stack(stack_name, str(stack_path.absolute())) 
\ No newline at end of file
+    return Stack(stack_path.name, str(stack_path.absolute())) 
\ No newline at end of file
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def compute_fingerprint(inputs: Any) -> str:
+    """Return a stable sha256 of JSON-compatible step inputs."""
+    encoded = json.dumps(inputs, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def deployment_key(target: str, project_id: Optional[str], region: Optional[str]) -> str:
+    """Name one deployment of a stack: its target, project and region (e.g. gcp-my-project-us-central1)."""
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', f"{target}-{project_id or 'default'}-{region or 'default'}")
+
+
+class DeploymentState:
+    """Local record of what the last deployment did, one JSON file per stack/target/project/region.
+
+    For each step it stores the fingerprint of the inputs it ran with and the
+    outputs it produced, so unchanged steps can be skipped on the next deploy.
+    The file lives under <stack>/.deploybot/state/ and is rewritten atomically
+    after every recorded step, so an interrupted deploy keeps its progress.
+    """
+
+    VERSION = 1
+
+    def __init__(self, stack_dir: str, target: str, project_id: Optional[str], region: Optional[str]):
+        self.stack_name = os.path.basename(os.path.normpath(stack_dir))
+        self.target = target
+        self.project_id = project_id or 'default'
+        self.region = region or 'default'
+        self.key = deployment_key(target, project_id, region)
+        self.directory = Path(stack_dir) / '.deploybot'
+        self.path = self.directory / 'state' / f"{self.key}.json"
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _empty(self) -> Dict[str, Any]:
+        return {
+            'version': self.VERSION,
+            'stack': self.stack_name,
+            'target': self.target,
+            'project_id': self.project_id,
+            'region': self.region,
+            'steps': {}
+        }
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return self._empty()
+        except (OSError, ValueError) as e:
+            print(f"Warning: ignoring unreadable state file {self.path}: {e}")
+            return self._empty()
+        if data.get('version') != self.VERSION:
+            return self._empty()
+        return data
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self._data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def get_step(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._data['steps'].get(name)
+
+    def record_step(self, name: str, fingerprint: str, outputs: Any) -> None:
+        try:
+            json.dumps(outputs)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Outputs of step '{name}' must be JSON-serializable to be recorded: {e}")
+        with self._lock:
+            self._data['steps'][name] = {
+                'fingerprint': fingerprint,
+                'outputs': outputs,
+                'updated_at': time.time()
+            }
+            self._save()
+
+    def forget_step(self, name: str) -> None:
+        with self._lock:
+            if self._data['steps'].pop(name, None) is not None:
+                self._save()
+
+    @property
+    def steps(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return dict(self._data['steps'])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data = self._empty()
+            if self.path.exists():
+                self.path.unlink()
@@ -0,0 +1,78 @@
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+
+def is_not_found(error: BaseException) -> bool:
+    """Return whether an API error means the resource does not exist.
+
+    Covers google-api-core exceptions (gRPC clients) and googleapiclient
+    HttpError (discovery clients such as SQL Admin).
+    """
+    if getattr(error, 'code', None) == 404:
+        return True
+    response = getattr(error, 'resp', None)
+    return getattr(response, 'status', None) == 404
+
+
+@dataclass
+class ResourceStatus:
+    """Live state of one stack resource compared with the recorded deployment.
+
+    ``expected`` is None when there is no recorded deployment to compare with.
+    """
+    kind: str
+    name: str
+    exists: bool = False
+    expected: Optional[bool] = True
+    details: List[str] = field(default_factory=list)
+    drift: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @classmethod
+    def from_result(cls, kind: str, name: str, result: Any, expected: Optional[bool] = True) -> 'ResourceStatus':
+        """Build a status from a probe result or the exception it raised."""
+        status = cls(kind, name, expected=expected)
+        if isinstance(result, BaseException):
+            if not is_not_found(result):
+                status.error = str(result)
+            elif expected is True:
+                status.drift.append("recorded as deployed but not found")
+        else:
+            status.exists = True
+            if expected is False:
+                status.drift.append("exists but is not recorded in the deployment state")
+        return status
+
+    @property
+    def icon(self) -> str:
+        if self.error:
+            return '❓'
+        if self.drift:
+            return '⚠️ '
+        return '✅' if self.exists else '➖'
+
+
+def print_status(stack_name: str, statuses: List[ResourceStatus]) -> int:
+    """Print one line per resource plus any drift, and return the number of drifted resources."""
+    print(f"\n📦 Resources for {stack_name}:")
+    for status in statuses:
+        state = 'present' if status.exists else 'absent'
+        if status.error:
+            state = 'unknown'
+        print(f"   {status.icon} {status.kind}: {status.name} ({state})")
+        for detail in status.details:
+            print(f"      ├─ {detail}")
+        for drift in status.drift:
+            print(f"      ├─ drift: {drift}")
+        if status.error:
+            print(f"      ├─ error: {status.error}")
+
+    drifted = sum(1 for status in statuses if status.drift)
+    errors = sum(1 for status in statuses if status.error)
+    if drifted:
+        print(f"\n⚠️  Drift detected in {drifted} resource(s). Run 'deploy' to reconcile.")
+    elif errors:
+        print(f"\n❓ Could not check {errors} resource(s).")
+    else:
+        print("\n✅ Live resources match the recorded deployment.")
+    return drifted
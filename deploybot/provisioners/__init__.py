@@ -1,3 +1,14 @@
-from .terraform import TerraformProvisioner
+import importlib
 
-__all__ = ['TerraformProvisioner'] 
\ No newline at end of file
+# Resolved on first access so only the chosen provisioner's dependencies are loaded
+_EXPORTS = {
+    'TerraformProvisioner': '.terraform',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,10 @@ from typing import Dict, Any
 
 class BaseProvisioner(ABC):
     """Base class for all provisioners."""
+    # Whether apply(use_plan=True) can execute the diff saved by plan()
+    supports_saved_plan = False
+    # Whether status() can compare live resources with the last deployment
+    supports_status = False
     
     def __init__(self, stack_path: str, config: Dict[str, Any]):
         self.stack_path = stack_path
@@ -31,4 +35,8 @@ class BaseProvisioner(ABC):
     @abstractmethod
     def plan(self) -> None:
         """Generate a deployment plan."""
-        pass
\ No newline at end of file
+        pass
+
+    def status(self) -> Dict[str, Any]:
+        """Compare live resources with the last deployment and report drift."""
+        raise Exception(f"The {self.__class__.__name__} does not support status")
@@ -0,0 +1,112 @@
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class EventKind(Enum):
+    """Kinds of provisioning events shared by every provisioner."""
+    RESOURCE_START = "resource_start"
+    RESOURCE_PROGRESS = "resource_progress"
+    RESOURCE_COMPLETE = "resource_complete"
+    RESOURCE_ERRORED = "resource_errored"
+    PLANNED_CHANGE = "planned_change"
+    DIAGNOSTIC = "diagnostic"
+    CHANGE_SUMMARY = "change_summary"
+    OUTPUTS = "outputs"
+
+
+@dataclass(slots=True)
+class ProvisionEvent:
+    """One typed event from a provisioner's machine-readable output."""
+    kind: EventKind
+    resource: Optional[str] = None
+    action: Optional[str] = None
+    elapsed: Optional[float] = None
+    severity: Optional[str] = None
+    message: Optional[str] = None
+    changes: Optional[Dict[str, int]] = None
+    outputs: Optional[Dict[str, Any]] = None
+
+
+# action -> (in progress, done)
+_ACTION_WORDS = {
+    'create': ('Creating', 'Created'),
+    'update': ('Modifying', 'Modified'),
+    'delete': ('Destroying', 'Destroyed'),
+    'replace': ('Replacing', 'Replaced'),
+    'read': ('Reading', 'Read'),
+}
+
+_START_ICONS = {'create': '🔨', 'update': '🔧', 'delete': '🗑️', 'replace': '♻️', 'read': '🔎'}
+
+_SEVERITY_ICONS = {'error': '❌', 'warning': '⚠️'}
+
+_PLAN_SYMBOLS = {'create': '+', 'update': '~', 'delete': '-', 'replace': '-/+', 'read': '<='}
+
+
+def _words(action: Optional[str]) -> Tuple[str, str]:
+    return _ACTION_WORDS.get(action or '', ((action or 'Processing').capitalize(), 'Done'))
+
+
+def format_event(event: ProvisionEvent) -> Optional[str]:
+    """Format an event as a progress line; None for events not worth showing."""
+    if event.kind == EventKind.RESOURCE_START:
+        return f"{_START_ICONS.get(event.action, '⚙️')} {_words(event.action)[0]} {event.resource}..."
+    if event.kind == EventKind.RESOURCE_PROGRESS:
+        return f"⏳ Still {_words(event.action)[0].lower()} {event.resource} ({event.elapsed:.0f}s elapsed)"
+    if event.kind == EventKind.RESOURCE_COMPLETE:
+        duration_text = f" ({event.elapsed:.0f}s)" if event.elapsed is not None else ""
+        return f"✅ {_words(event.action)[1]} {event.resource}{duration_text}"
+    if event.kind == EventKind.RESOURCE_ERRORED:
+        return f"❌ Failed {_words(event.action)[0].lower()} {event.resource}"
+    if event.kind == EventKind.PLANNED_CHANGE:
+        return f"   {_PLAN_SYMBOLS.get(event.action, '?')} {event.action} {event.resource}"
+    if event.kind == EventKind.DIAGNOSTIC:
+        icon = _SEVERITY_ICONS.get(event.severity, 'ℹ️')
+        return f"{icon} {event.message}"
+    if event.kind == EventKind.CHANGE_SUMMARY and event.changes:
+        return f"📝 {event.message}" if event.message else None
+    return None
+
+
+class EventStats:
+    """Aggregates a stream of events in memory bounded by the number of resources, not log length.
+
+    Tracks per-resource durations, the last diagnostics, the change summary
+    and outputs.
+    """
+
+    MAX_DIAGNOSTICS = 50
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        self.failed: List[str] = []
+        self.diagnostics: Deque[ProvisionEvent] = deque(maxlen=self.MAX_DIAGNOSTICS)
+        self.changes: Optional[Dict[str, int]] = None
+        self.outputs: Optional[Dict[str, Any]] = None
+
+    def record(self, event: ProvisionEvent) -> None:
+        if event.kind == EventKind.RESOURCE_COMPLETE and event.resource and event.elapsed is not None:
+            self.durations[event.resource] = event.elapsed
+        elif event.kind == EventKind.RESOURCE_ERRORED and event.resource:
+            self.failed.append(event.resource)
+        elif event.kind == EventKind.DIAGNOSTIC:
+            self.diagnostics.append(event)
+        elif event.kind == EventKind.CHANGE_SUMMARY:
+            self.changes = event.changes
+        elif event.kind == EventKind.OUTPUTS:
+            self.outputs = event.outputs
+
+    def errors(self) -> List[str]:
+        return [event.message for event in self.diagnostics if event.severity == 'error']
+
+    def slowest(self, count: int = 5) -> List[Tuple[str, float]]:
+        return sorted(self.durations.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    def print_timings(self, count: int = 5) -> None:
+        if not self.durations:
+            return
+        print(f"\n⏱️  Slowest resources ({len(self.durations)} completed in total):")
+        for resource, elapsed in self.slowest(count):
+            print(f"   {elapsed:>6.0f}s  {resource}")
@@ -2,13 +2,27 @@ from typing import Dict, Any
 
 from deploybot.core.enums import Target
 from deploybot.core.stack import Stack
+from deploybot.core.state import deployment_key
 from deploybot.core.enums import Provisioner
 from deploybot.provisioners.base import BaseProvisioner
-# from .terraform import TerraformProvisioner
-from .native import NativeProvisioner
-# from .pulumi import PulumiProvisioner
 
 class ProvisionerFactory:   
+    @classmethod
+    def provisioner_class(cls, provisioner: Provisioner) -> type:
+        """The provisioner's class, so its capabilities can be checked before any cloud setup."""
+        # Each provisioner is imported only when chosen, so e.g. a Terraform
+        # stack never loads the Pulumi SDK or the native recipes' cloud clients
+        if provisioner == Provisioner.NATIVE:
+            from .native import NativeProvisioner
+            return NativeProvisioner
+        elif provisioner == Provisioner.TERRAFORM:
+            from .terraform import TerraformProvisioner
+            return TerraformProvisioner
+        elif provisioner == Provisioner.PULUMI:
+            from .pulumi import PulumiProvisioner
+            return PulumiProvisioner
+        raise ValueError(f"Invalid provisioner: {provisioner}")
+
     @classmethod
     def create(cls, provisioner: Provisioner, stack_obj: Stack, target: Target, target_config: Dict[str, Any]) -> BaseProvisioner:
         provisioner_dir = stack_obj.get_provisioner_dir(provisioner, target.value)
@@ -20,34 +34,28 @@ class ProvisionerFactory:
             }
         }
 
+        provisioner_class = cls.provisioner_class(provisioner)
+
         if provisioner == Provisioner.NATIVE:
             provisioner_config['stack_name'] = stack_obj.name
-            
-            return NativeProvisioner(
-                recipe_dir=provisioner_dir,
-                config=provisioner_config
+            return provisioner_class(recipe_dir=provisioner_dir, config=provisioner_config)
+
+        if provisioner == Provisioner.TERRAFORM:
+            return provisioner_class(tf_dir=provisioner_dir, config=provisioner_config)
+
+        # Pulumi; provisioner_class() has already rejected anything else
+        provisioner_config['project_name'] = stack_obj.name
+        # One Pulumi stack per target/project/region keeps regional deployments apart
+        provisioner_config['stack_name'] = deployment_key(target.value, target_config.get('project_id'), target_config.get('region'))
+        # The provider setting Pulumi needs per target; it is passed as provider config, not a stack variable
+        provider_keys = {Target.GCP: ('project_id', 'gcp:project'), Target.AWS: ('region', 'aws:region')}
+        if target not in provider_keys:
+            raise ValueError(f"Invalid target: {target}")
+        key, provider_key = provider_keys[target]
+        if not target_config.get(key):
+            raise ValueError(
+                f"Pulumi on {target.value} needs '{key}'; set it in stack '{stack_obj.name}' or pass --{key.replace('_', '-')}"
             )
-        
-        # elif provisioner == Provisioner.TERRAFORM:            
-        #     return TerraformProvisioner(
-        #         tf_dir=provisioner_dir,
-        #         config=provisioner_config
-        #     )
-        
-        # elif provisioner == Provisioner.PULUMI:
-        #     provisioner_config['project_name'] = stack_obj.name
-        #     if target == Target.GCP:
-        #         provisioner_config['provider_variables'] = {'gcp:project': target_config['project_id']}
-        #         target_config.pop('project_id')
-        #     elif target == Target.AWS:
-        #         provisioner_config['provider_variables'] = {'aws:region': target_config['region']}
-        #         target_config.pop('region')
-        #     else:
-        #         raise ValueError(f"Invalid target: {target}")
-            
-        #     return PulumiProvisioner(
-        #         work_dir=provisioner_dir,
-        #         config=provisioner_config
-        #     )
-        else:
-            raise ValueError(f"Invalid provisioner: {provisioner}")
\ No newline at end of file
+        provisioner_config['provider_variables'] = {provider_key: target_config[key]}
+        provisioner_config['variables'].pop(key, None)
+        return provisioner_class(work_dir=provisioner_dir, config=provisioner_config)
@@ -2,14 +2,17 @@ import os
 import json
 from typing import Dict, Any
 from .base import BaseProvisioner
-from deploybot.core.recipie_registry import RecipeRegistry
 
 class NativeProvisioner(BaseProvisioner):
+    supports_saved_plan = True
+    supports_status = True
+
     def __init__(self, recipe_dir: str, config: Dict[str, Any]):
         super().__init__(stack_path=os.path.dirname(recipe_dir), config=config)
         self.recipe_dir = recipe_dir
         self.variables = config.get('variables', {})
         self.stack_name = config.get('stack_name', '')
+        self.target = config.get('provider')
 
     def validate(self) -> None:
         if not os.path.isfile(os.path.join(self.recipe_dir, 'recipe.py')):
@@ -23,17 +26,34 @@ class NativeProvisioner(BaseProvisioner):
     def init(self) -> None:
         self._write_variables()
 
-    def apply(self) -> Dict[str, Any]:
-        recipe_cls = RecipeRegistry.get(self.stack_name)
-        recipe = recipe_cls()
-        return recipe.deploy()
+    def _load_recipe(self):
+        # Imported here: recipes load their cloud client libraries
+        from deploybot.core.recipie_registry import RecipeRegistry
+        recipe_cls = RecipeRegistry.get(self.stack_name, self.target)
+        return recipe_cls(variables=self.variables)
+
+    def apply(self, use_plan: bool = False) -> Dict[str, Any]:
+        recipe = self._load_recipe()
+        if not use_plan:
+            return recipe.deploy()
+
+        # Execute the saved diff; steps it found unchanged are not probed again
+        outputs = recipe.deploy(plan=recipe.load_plan())
+        recipe.discard_plan()
+        return outputs
 
     def destroy(self) -> None:
-        recipe_cls = RecipeRegistry.get(self.stack_name)
-        recipe = recipe_cls()
+        recipe = self._load_recipe()
         recipe.destroy()
 
     def plan(self) -> None:
-        recipe_cls = RecipeRegistry.get(self.stack_name)
-        recipe = recipe_cls()
-        recipe.plan()
\ No newline at end of file
+        recipe = self._load_recipe()
+        plan = recipe.plan()
+        recipe.save_plan(plan)
+        print(f"\nPlan saved to {recipe.plan_path}. Run 'deploy --use-plan' to apply exactly this diff.")
+
+    def status(self) -> Dict[str, Any]:
+        recipe = self._load_recipe()
+        if not recipe.supports_status:
+            raise Exception(f"The {self.stack_name} recipe for {self.target} does not support status")
+        return recipe.status()
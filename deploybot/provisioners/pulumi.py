@@ -4,7 +4,8 @@ import subprocess
 import pulumi.automation as auto
 from typing import Dict, Any, Optional, Callable
 from deploybot.provisioners.base import BaseProvisioner
-from deploybot.provisioners.pulumi_parser import PulumiOutputParser
+from deploybot.provisioners.events import EventStats
+from deploybot.provisioners.pulumi_parser import PulumiEngineEventParser
 
 class PulumiProvisioner(BaseProvisioner):
     def __init__(self, work_dir: str, config: Dict[str, Any]):
@@ -15,7 +16,6 @@ class PulumiProvisioner(BaseProvisioner):
         self.variables = config.get('variables', {})
         self.stack_name = config.get('stack_name', 'dev')
         self.project_name = config.get('project_name', 'deploybot-project')
-        self.parser = PulumiOutputParser()
         
         # Set environment variables for Pulumi
         os.environ["PULUMI_CONFIG_PASSPHRASE"] = "deploybot-local"
@@ -51,71 +51,75 @@ class PulumiProvisioner(BaseProvisioner):
         except Exception as e:
             raise Exception(f"Pulumi init failed: {str(e)}")
     
-    def _create_parsed_callback(self, progress_callback: Callable) -> Callable:
-        """Create a callback that parses and formats Pulumi output."""
-        def parsed_callback(output: str):
-            event = self.parser.parse_line(output)
-            if event:
-                formatted_event = self.parser.format_event(event)
+    def _create_event_callback(self, parser: PulumiEngineEventParser, stats: EventStats, verbose: bool = False,
+                               progress_callback: Optional[Callable] = None) -> Callable:
+        """Create an `on_event` callback that records engine events and shows them as progress."""
+        def event_callback(engine_event):
+            event = parser.parse_event(engine_event)
+            if event is None:
+                return
+            stats.record(event)
+            formatted_event = parser.format_event(event)
+            if not formatted_event:
+                return
+            if progress_callback:
                 progress_callback(formatted_event)
-            else:
-                progress_callback(output)
-        return parsed_callback
+            elif verbose:
+                print(formatted_event)
+        return event_callback
 
-    def _run_pulumi_command(self, command: str, verbose: bool = False, progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
-        """Generic method to run Pulumi commands with optional verbose output."""
+    def _run_pulumi_command(self, command: str, verbose: bool = False, progress_callback: Optional[Callable] = None):
+        """Run a Pulumi command, following its structured engine events rather than its rendered text.
+
+        Returns the command's result and the EventStats aggregated from its events.
+        """
+        stats = EventStats()
+        parser = PulumiEngineEventParser(operation=command)
+        on_event = self._create_event_callback(parser, stats, verbose, progress_callback)
         try:
             self.init()
             
             if command == "up":
-                if verbose and progress_callback:
-                    parsed_callback = self._create_parsed_callback(progress_callback)
-                    results = self.stack.up(on_output=parsed_callback)
-                else:
-                    results = self.stack.up()
-                return results.outputs
-            
+                return self.stack.up(on_event=on_event), stats
             elif command == "destroy":
-                if verbose and progress_callback:
-                    parsed_callback = self._create_parsed_callback(progress_callback)
-                    self.stack.destroy(on_output=parsed_callback)
-                else:
-                    self.stack.destroy()
-                return {}
-            
+                return self.stack.destroy(on_event=on_event), stats
             elif command == "preview":
-                if verbose and progress_callback:
-                    parsed_callback = self._create_parsed_callback(progress_callback)
-                    preview = self.stack.preview(on_output=parsed_callback)
-                else:
-                    preview = self.stack.preview()
-                return {"preview": preview}
+                return self.stack.preview(on_event=on_event), stats
+            raise ValueError(f"Unknown Pulumi command: {command}")
             
         except Exception as e:
-            raise Exception(f"Pulumi {command} failed: {str(e)}")
+            # Engine diagnostics name the failing resource; the exception carries Pulumi's whole stderr
+            error_output = '\n'.join(stats.errors()) or str(e)
+            raise Exception(f"Pulumi {command} failed: {error_output}")
     
     def apply(self, verbose: bool = False, progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
-        """Apply Pulumi configuration with optional verbose output parsing."""
+        """Apply Pulumi configuration, reporting resource progress from engine events."""
         try:
-            return self._run_pulumi_command("up", verbose, progress_callback)
+            results, stats = self._run_pulumi_command("up", verbose, progress_callback)
+            stats.print_timings()
+            return results.outputs
         except Exception as e:
             raise Exception(f"Pulumi apply failed: {str(e)}")
     
     def destroy(self, verbose: bool = False, progress_callback: Optional[Callable] = None) -> None:
-        """Destroy Pulumi infrastructure with optional verbose output parsing."""
+        """Destroy Pulumi infrastructure, reporting resource progress from engine events."""
         try:
-            self._run_pulumi_command("destroy", verbose, progress_callback)
+            _, stats = self._run_pulumi_command("destroy", verbose, progress_callback)
+            stats.print_timings()
             self.remove_stack()
         except Exception as e:
             raise Exception(f"Pulumi destroy failed: {str(e)}")
     
     def plan(self) -> str:
         """Show what will be deployed (Pulumi preview)."""
+        lines = []
         try:
-            preview_result = self._run_pulumi_command("preview", verbose=False)
-            return str(preview_result.get("preview", "No preview available"))
+            self._run_pulumi_command("preview", progress_callback=lines.append)
         except Exception as e:
             raise Exception(f"Pulumi plan failed: {str(e)}")
+        plan_output = '\n'.join(lines) or "No changes."
+        print(f"\n📝 Planned changes:\n{plan_output}")
+        return plan_output
     
     def refresh(self) -> None:
         """Refresh Pulumi state to match real-world resources."""
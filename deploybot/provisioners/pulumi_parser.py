@@ -1,7 +1,8 @@
 import re
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from .events import EventKind, ProvisionEvent, format_event
 
 class PulumiEventType(Enum):
     """Types of Pulumi events."""
@@ -15,7 +16,7 @@ class PulumiEventType(Enum):
     OUTPUT = "output"
     UNKNOWN = "unknown"
 
-@dataclass
+@dataclass(slots=True)
 class PulumiEvent:
     """Represents a parsed Pulumi event."""
     event_type: PulumiEventType
@@ -27,85 +28,99 @@ class PulumiEvent:
     message: Optional[str] = None
     raw_line: str = ""
 
+
+# Pattern families in the order they are tried; the first that matches wins
+_PATTERN_FAMILIES = [
+    ('resource', [
+        # + pulumi:providers:gcp default_8_36_0 creating (0s)
+        r'([+\-~])\s+([^:]+):([^:]+):([^\s]+)\s+([^\s]+)\s+\(([^)]+)\)',
+        # + pulumi:pulumi:Stack simple-web-server-gcp-dev creating (0s)
+        r'([+\-~])\s+([^:]+):([^:]+):([^\s]+)\s+([^\s]+)',
+        # @ updating..........
+        r'@\s+([^\s]+)',
+    ]),
+    ('diagnostic', [
+        # error: pulumi:providers:gcp resource 'default_8_36_0' has a problem
+        r'(error|warning|info):\s+([^:]+):([^:]+):([^:]+)\s+(.+)',
+        # error: Program failed with an unhandled exception
+        r'(error|warning|info):\s+(.+)',
+    ]),
+    ('output', [
+        # Project ID: coldlab-central
+        r'([^:]+):\s+(.+)',
+    ]),
+    ('stack', [
+        # Updating (dev):
+        r'(Updating|Creating|Destroying)\s+\(([^)]+)\):',
+        # Resources: + 1 created
+        r'Resources:\s+(.+)',
+        # Duration: 23s
+        r'Duration:\s+(.+)',
+    ]),
+]
+
+
+def _combine(families):
+    """Join every pattern into one alternation of named groups.
+
+    Returns the compiled pattern and, per group name, its family and the
+    slice of group numbers holding that pattern's own groups.
+    """
+    alternatives = []
+    spans = {}
+    offset = 1
+    for family, patterns in families:
+        for index, pattern in enumerate(patterns):
+            name = f"{family}{index}"
+            width = re.compile(pattern).groups
+            alternatives.append(f"(?P<{name}>{pattern})")
+            spans[name] = (family, offset + 1, offset + 1 + width)
+            offset += width + 1
+    return re.compile('|'.join(alternatives)), spans
+
+
+_LINE_PATTERN, _GROUP_SPANS = _combine(_PATTERN_FAMILIES)
+
+
 class PulumiOutputParser:
-    """Parser for Pulumi command output."""
-    
-    def __init__(self):
-        # Resource operation patterns
-        self.resource_patterns = [
-            # + pulumi:providers:gcp default_8_36_0 creating (0s)
-            r'^\s*([+\-~])\s+([^:]+):([^:]+):([^\s]+)\s+([^\s]+)\s+\(([^)]+)\)',
-            # + pulumi:pulumi:Stack simple-web-server-gcp-dev creating (0s)
-            r'^\s*([+\-~])\s+([^:]+):([^:]+):([^\s]+)\s+([^\s]+)',
-            # @ updating..........
-            r'^\s*@\s+([^\s]+)',
-        ]
-        
-        # Diagnostic patterns
-        self.diagnostic_patterns = [
-            # error: pulumi:providers:gcp resource 'default_8_36_0' has a problem
-            r'^\s*(error|warning|info):\s+([^:]+):([^:]+):([^:]+)\s+(.+)',
-            # error: Program failed with an unhandled exception
-            r'^\s*(error|warning|info):\s+(.+)',
-        ]
-        
-        # Output patterns
-        self.output_patterns = [
-            # Project ID: coldlab-central
-            r'^\s*([^:]+):\s+(.+)',
-        ]
-        
-        # Stack update patterns
-        self.stack_patterns = [
-            # Updating (dev):
-            r'^\s*(Updating|Creating|Destroying)\s+\(([^)]+)\):',
-            # Resources: + 1 created
-            r'^\s*Resources:\s+(.+)',
-            # Duration: 23s
-            r'^\s*Duration:\s+(.+)',
-        ]
-    
+    """Parser for Pulumi command output.
+
+    All patterns are compiled once into a single alternation, so each line
+    is matched in one pass; which alternative matched selects the handler.
+    Lines that cannot match any pattern skip the regex entirely.
+    """
+
     def parse_line(self, line: str) -> Optional[PulumiEvent]:
         """Parse a single line of Pulumi output."""
         line = line.strip()
         if not line:
             return None
-        
-        # Try resource patterns first
-        for pattern in self.resource_patterns:
-            match = re.match(pattern, line)
-            if match:
-                return self._parse_resource_event(match, line)
-        
-        # Try diagnostic patterns
-        for pattern in self.diagnostic_patterns:
-            match = re.match(pattern, line)
-            if match:
-                return self._parse_diagnostic_event(match, line)
-        
-        # Try output patterns
-        for pattern in self.output_patterns:
-            match = re.match(pattern, line)
-            if match:
-                return self._parse_output_event(match, line)
-        
-        # Try stack patterns
-        for pattern in self.stack_patterns:
-            match = re.match(pattern, line)
-            if match:
-                return self._parse_stack_event(match, line)
-        
+
+        # Every pattern needs a ':' except '@ updating...'
+        if ':' in line or line.startswith('@'):
+            match = _LINE_PATTERN.match(line)
+            if match is not None:
+                family, first, last = _GROUP_SPANS[match.lastgroup]
+                groups = match.group(*range(first, last)) if last - first > 1 else (match.group(first),)
+                return self._handlers[family](self, groups, line)
+
         # Unknown event
         return PulumiEvent(
             event_type=PulumiEventType.UNKNOWN,
             message=line,
             raw_line=line
         )
+
+    def iter_events(self, lines: Iterable[str]) -> Iterator[PulumiEvent]:
+        """Lazily parse an iterable of lines (e.g. an open log file or a process' stdout)."""
+        parse_line = self.parse_line
+        for line in lines:
+            event = parse_line(line)
+            if event is not None:
+                yield event
     
-    def _parse_resource_event(self, match: re.Match, line: str) -> PulumiEvent:
+    def _parse_resource_event(self, groups: Tuple[Optional[str], ...], line: str) -> PulumiEvent:
         """Parse a resource operation event."""
-        groups = match.groups()
-        
         if len(groups) >= 6:
             # Full resource pattern
             operation, provider, resource_type, resource_name, status, duration = groups[:6]
@@ -140,10 +155,8 @@ class PulumiOutputParser:
             raw_line=line
         )
     
-    def _parse_diagnostic_event(self, match: re.Match, line: str) -> PulumiEvent:
+    def _parse_diagnostic_event(self, groups: Tuple[Optional[str], ...], line: str) -> PulumiEvent:
         """Parse a diagnostic event (error, warning, info)."""
-        groups = match.groups()
-        
         if len(groups) >= 5:
             # Full diagnostic pattern
             level, provider, resource_type, resource_name, message = groups[:5]
@@ -161,9 +174,9 @@ class PulumiOutputParser:
             raw_line=line
         )
     
-    def _parse_output_event(self, match: re.Match, line: str) -> PulumiEvent:
+    def _parse_output_event(self, groups: Tuple[Optional[str], ...], line: str) -> PulumiEvent:
         """Parse an output event."""
-        key, value = match.groups()
+        key, value = groups
         
         return PulumiEvent(
             event_type=PulumiEventType.OUTPUT,
@@ -172,10 +185,8 @@ class PulumiOutputParser:
             raw_line=line
         )
     
-    def _parse_stack_event(self, match: re.Match, line: str) -> PulumiEvent:
+    def _parse_stack_event(self, groups: Tuple[Optional[str], ...], line: str) -> PulumiEvent:
         """Parse a stack-level event."""
-        groups = match.groups()
-        
         if len(groups) >= 2:
             operation, stack_name = groups[:2]
         else:
@@ -190,6 +201,13 @@ class PulumiOutputParser:
             raw_line=line
         )
     
+    _handlers = {
+        'resource': _parse_resource_event,
+        'diagnostic': _parse_diagnostic_event,
+        'output': _parse_output_event,
+        'stack': _parse_stack_event,
+    }
+    
     def format_event(self, event: PulumiEvent) -> str:
         """Format a Pulumi event for display."""
         if event.event_type == PulumiEventType.RESOURCE_CREATE:
@@ -216,9 +234,133 @@ class PulumiOutputParser:
     
     def parse_output(self, output: str) -> List[PulumiEvent]:
         """Parse entire Pulumi output and return list of events."""
-        events = []
-        for line in output.split('\n'):
-            event = self.parse_line(line)
-            if event:
-                events.append(event)
-        return events 
\ No newline at end of file
+        return list(self.iter_events(output.split('\n')))
+
+
+# Pulumi step operations -> shared event actions; operations not listed (same, discard, ...) are not shown
+_ENGINE_ACTIONS = {
+    'create': 'create',
+    'update': 'update',
+    'delete': 'delete',
+    'replace': 'replace',
+    'create-replacement': 'replace',
+    'delete-replaced': 'delete',
+    'read': 'read',
+    'read-replacement': 'read',
+    'refresh': 'read',
+    'import': 'create',
+    'import-replacement': 'replace',
+}
+
+# Summary counts by operation, in Terraform's change_summary keys
+_SUMMARY_KEYS = {'create': 'add', 'update': 'change', 'replace': 'change', 'delete': 'remove', 'import': 'import'}
+
+# Color directives such as <{%reset%}> left in engine event messages
+_COLOR_TAG_PATTERN = re.compile(r'<\{%[^%]*%\}>')
+
+_STACK_TYPE = 'pulumi:pulumi:Stack'
+
+# Automation API command -> how its summary line starts
+_COMPLETION_WORDS = {'up': 'Update', 'destroy': 'Destroy', 'refresh': 'Refresh'}
+
+
+def _value(op) -> str:
+    # OpType is a str enum in step metadata but a plain string in summary counts
+    return getattr(op, 'value', op)
+
+
+def _resource_name(urn: Optional[str]) -> Optional[str]:
+    """'urn:pulumi:dev::proj::gcp:sql/databaseInstance:DatabaseInstance::db' -> 'db'"""
+    return urn.rsplit('::', 1)[-1] if urn else None
+
+
+class PulumiEngineEventParser:
+    """Maps Automation API engine events (`on_event`) onto the shared event model.
+
+    Resource timings come from the engine's own timestamps between a
+    resource's pre and outputs events, not from rendered text. One parser
+    per operation (up, preview, destroy, refresh); it remembers when each
+    resource step started.
+    """
+
+    def __init__(self, operation: str = 'up'):
+        self.operation = operation
+        self.preview = operation == 'preview'
+        self._started: Dict[tuple, int] = {}
+
+    def parse_event(self, event: Any) -> Optional[ProvisionEvent]:
+        """Translate one EngineEvent; None for events with nothing to show (stdout, prelude, same steps)."""
+        if event.resource_pre_event is not None:
+            return self._resource_pre(event.resource_pre_event, event.timestamp)
+        if event.res_outputs_event is not None:
+            return self._resource_outputs(event.res_outputs_event, event.timestamp)
+        if event.res_op_failed_event is not None:
+            metadata = event.res_op_failed_event.metadata
+            return ProvisionEvent(
+                EventKind.RESOURCE_ERRORED,
+                resource=_resource_name(metadata.urn),
+                action=_ENGINE_ACTIONS.get(_value(metadata.op), _value(metadata.op))
+            )
+        if event.diagnostic_event is not None:
+            return self._diagnostic(event.diagnostic_event)
+        if event.summary_event is not None:
+            return self._summary(event.summary_event)
+        return None
+
+    def _step(self, metadata: Any) -> Optional[tuple]:
+        action = _ENGINE_ACTIONS.get(_value(metadata.op))
+        # The root stack resource spans the whole run; it is not a resource worth timing
+        if action is None or metadata.type == _STACK_TYPE:
+            return None
+        return action, metadata.urn
+
+    def _resource_pre(self, pre_event: Any, timestamp: int) -> Optional[ProvisionEvent]:
+        step = self._step(pre_event.metadata)
+        if step is None:
+            return None
+        action, urn = step
+        if self.preview or pre_event.planning:
+            return ProvisionEvent(EventKind.PLANNED_CHANGE, resource=_resource_name(urn), action=action)
+        # A replacement has several steps on the same urn, so steps are keyed by operation too
+        self._started[(_value(pre_event.metadata.op), urn)] = timestamp
+        return ProvisionEvent(EventKind.RESOURCE_START, resource=_resource_name(urn), action=action)
+
+    def _resource_outputs(self, outputs_event: Any, timestamp: int) -> Optional[ProvisionEvent]:
+        step = self._step(outputs_event.metadata)
+        if step is None or self.preview or outputs_event.planning:
+            return None
+        action, urn = step
+        started = self._started.pop((_value(outputs_event.metadata.op), urn), None)
+        return ProvisionEvent(
+            EventKind.RESOURCE_COMPLETE,
+            resource=_resource_name(urn),
+            action=action,
+            elapsed=float(timestamp - started) if started is not None else None
+        )
+
+    def _diagnostic(self, diagnostic: Any) -> Optional[ProvisionEvent]:
+        message = _COLOR_TAG_PATTERN.sub('', diagnostic.message or '').strip()
+        if not message or diagnostic.severity == 'debug':
+            return None
+        if diagnostic.urn:
+            message = f"{_resource_name(diagnostic.urn)}: {message}"
+        # 'info#err' is program output written to stderr
+        severity = 'info' if diagnostic.severity == 'info#err' else diagnostic.severity
+        return ProvisionEvent(EventKind.DIAGNOSTIC, severity=severity, message=message)
+
+    def _summary(self, summary: Any) -> ProvisionEvent:
+        changes = {'add': 0, 'change': 0, 'remove': 0}
+        for op, count in (summary.resource_changes or {}).items():
+            key = _SUMMARY_KEYS.get(_value(op))
+            if key and count:
+                changes[key] = changes.get(key, 0) + count
+        if self.preview:
+            message = f"Preview: {changes['add']} to add, {changes['change']} to change, {changes['remove']} to destroy."
+        else:
+            word = _COMPLETION_WORDS.get(self.operation, self.operation.capitalize())
+            message = (f"{word} complete in {summary.duration_seconds}s! Resources: {changes['add']} added, "
+                       f"{changes['change']} changed, {changes['remove']} destroyed.")
+        return ProvisionEvent(EventKind.CHANGE_SUMMARY, message=message, changes=changes)
+
+    def format_event(self, event: ProvisionEvent) -> Optional[str]:
+        return format_event(event)
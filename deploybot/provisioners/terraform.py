@@ -1,84 +1,245 @@
 import os
 import json
+from collections import deque
+import hashlib
 import subprocess
+import threading
+import time
+from pathlib import Path
 from typing import Dict, Any
+from deploybot.core.state import compute_fingerprint, deployment_key
+from deploybot.utils.cache import get_cache_dir
 from .base import BaseProvisioner
-from .terraform_parser import TerraformOutputParser
+from .events import EventStats
+from .terraform_parser import TerraformJsonParser
+
+# `terraform init` writes .terraform.lock.hcl next to the configuration, which every
+# workspace of a stack shares, and the plugin cache is not safe for concurrent
+# installs; concurrent runs initialise one at a time
+_init_lock = threading.Lock()
+
+# Files whose changes require a new `terraform init`: providers, modules and backend
+_INIT_INPUT_PATTERNS = ('*.tf', '*.tf.json', '.terraform.lock.hcl')
 
 class TerraformProvisioner(BaseProvisioner):
+    supports_saved_plan = True
+    # Saved plans older than this (seconds) are not applied; cloud resources may have drifted
+    plan_max_age = 15 * 60
+
     def __init__(self, tf_dir: str, config: Dict[str, Any]):
         super().__init__(stack_path=os.path.dirname(tf_dir), config=config)
         self.tf_dir = tf_dir
         self.provider = config.get('provider', 'aws')
         self.variables = config.get('variables', {})
-        self.parser = TerraformOutputParser()
+        self.parser = TerraformJsonParser()
+
+        # Each target/project/region is its own Terraform workspace with its own data dir
+        # and variables file, so several regions of one stack can run at the same time
+        self.workspace = deployment_key(self.provider, self.variables.get('project_id'), self.variables.get('region'))
+        self.work_dir = Path(tf_dir).parent.parent / '.deploybot' / 'terraform' / self.workspace
+        self.tfvars_path = self.work_dir / 'terraform.tfvars.json'
+        self.data_dir = self.work_dir / '.terraform'
+        self.init_marker = self.work_dir / 'init.fingerprint'
+        self.plan_file = self.work_dir / 'tfplan'
+        self.plan_meta_file = self.work_dir / 'tfplan.json'
+        self.env = {**os.environ, 'TF_DATA_DIR': str(self.data_dir)}
+        # Providers are downloaded once per version and linked into every stack's data dir
+        self.env.setdefault('TF_PLUGIN_CACHE_DIR', str(get_cache_dir() / 'terraform-plugins'))
     
     def validate(self) -> None:
         if not os.path.isfile(os.path.join(self.tf_dir, 'main.tf')):
             raise FileNotFoundError(f"No Terraform main.tf found in {self.tf_dir}")
+        self._migrate_legacy_state()
+
+    def _migrate_legacy_state(self) -> None:
+        """Move state from before per-region workspaces into this deployment's workspace.
+
+        The state is adopted when the variables it was last applied with
+        name this target/project/region, or, if those were not kept, when
+        no workspace has state yet (the stack was only ever deployed once).
+        Anything else is ambiguous and left for the user to resolve.
+        """
+        tf_dir = Path(self.tf_dir)
+        legacy_state = tf_dir / 'terraform.tfstate'
+        workspaces_dir = tf_dir / 'terraform.tfstate.d'
+        workspace_state = workspaces_dir / self.workspace / 'terraform.tfstate'
+        if not legacy_state.is_file() or workspace_state.is_file():
+            return
+
+        # Before workspaces, variables were written next to main.tf
+        legacy_tfvars = tf_dir / 'terraform.tfvars.json'
+        owner = None
+        if legacy_tfvars.is_file():
+            with open(legacy_tfvars, 'r') as f:
+                legacy_variables = json.load(f)
+            owner = deployment_key(self.provider, legacy_variables.get('project_id'), legacy_variables.get('region'))
+        elif not any(workspaces_dir.glob('*/terraform.tfstate')):
+            owner = self.workspace
+
+        if owner != self.workspace:
+            raise Exception(
+                f"Found Terraform state from before per-region workspaces at {legacy_state}"
+                + (f", last applied for {owner}" if owner else "")
+                + f". Move it to {workspace_state} if it belongs to {self.workspace}, or remove it if it is obsolete."
+            )
+        workspace_state.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(legacy_state, workspace_state)
+        if legacy_tfvars.is_file():
+            legacy_tfvars.unlink()
+        print(f"📦 Moved Terraform state from before per-region workspaces into workspace {self.workspace}")
     
     def _write_tfvars(self) -> None:
         """Write terraform.tfvars.json file with provider-specific variables."""
-        tfvars_path = os.path.join(self.tf_dir, 'terraform.tfvars.json')
-        with open(tfvars_path, 'w') as f:
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.tfvars_path, 'w') as f:
             json.dump(self.variables, f, indent=2)
     
+    def _init_fingerprint(self) -> str:
+        """Fingerprint the configuration files init depends on (module sources, backend, lock file)."""
+        tf_dir = Path(self.tf_dir)
+        files = {}
+        for pattern in _INIT_INPUT_PATTERNS:
+            for path in tf_dir.rglob(pattern):
+                relative = path.relative_to(tf_dir)
+                if '.terraform' not in relative.parts and path.is_file():
+                    files[str(relative)] = hashlib.sha256(path.read_bytes()).hexdigest()
+        return compute_fingerprint({'workspace': self.workspace, 'files': files})
+
+    def _is_initialized(self) -> bool:
+        try:
+            recorded = self.init_marker.read_text().strip()
+        except OSError:
+            return False
+        return self.data_dir.is_dir() and recorded == self._init_fingerprint()
+
     def init(self) -> None:
         self._write_tfvars()
+        if self._is_initialized():
+            print("Terraform configuration unchanged since last init, skipping init")
+            return
+        Path(self.env['TF_PLUGIN_CACHE_DIR']).mkdir(parents=True, exist_ok=True)
         try:
-            subprocess.run(['terraform', 'init'], cwd=self.tf_dir, check=True, capture_output=True, text=True)
+            with _init_lock:
+                subprocess.run(['terraform', 'init', '-input=false'], cwd=self.tf_dir, env=self.env, check=True, capture_output=True, text=True)
+                subprocess.run(
+                    ['terraform', 'workspace', 'select', '-or-create=true', self.workspace],
+                    cwd=self.tf_dir, env=self.env, check=True, capture_output=True, text=True
+                )
+                # Recorded after init, so a lock file it just created is part of the fingerprint
+                self.init_marker.write_text(self._init_fingerprint())
         except subprocess.CalledProcessError as e:
             raise Exception(f"Terraform init failed: {e.stderr.strip() if e.stderr else str(e)}")
     
-    def _run_terraform_command(self, command: list, verbose: bool = False, progress_callback=None) -> None:
-        """Generic method to run any Terraform command with optional verbose output parsing."""
-        if not verbose:
-            subprocess.run(command, cwd=self.tf_dir, check=True, capture_output=True, text=True)
-            return
+    def _run_terraform_command(self, command: list, verbose: bool = False, progress_callback=None) -> EventStats:
+        """Run a Terraform command with `-json` and decode its event stream as it arrives.
+
+        Events are shown through progress_callback (or printed when verbose)
+        and aggregated into the returned EventStats; the output is never
+        buffered whole, so memory stays flat on very long runs.
+        """
+        # Options must precede a saved plan file, so -json goes right after the subcommand
+        command = command[:2] + ['-json'] + command[2:]
+        stats = EventStats()
+        # Output that is not JSON (e.g. a crash before the UI starts) is kept for the error message
+        other_output = deque(maxlen=20)
 
-        # Run terraform command with streaming output
         process = subprocess.Popen(
             command,
             cwd=self.tf_dir,
+            env=self.env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
-            bufsize=1,
-            universal_newlines=True
+            bufsize=1
         )
-        
-        # Stream and parse output in real-time
-        if process.stdout:
-            for line in iter(process.stdout.readline, ''):
-                if not line:
-                    continue
-                
-                # Parse the line for resource events
-                event = self.parser.parse_line(line)
-                if not event:
-                    continue
-                
-                formatted_event = self.parser.format_event(event)
-                if progress_callback:
-                    progress_callback(formatted_event)
-        
-        process.wait()
-        if process.returncode == 0:
-            return
+        for line in process.stdout:
+            event = self.parser.parse_line(line)
+            if event is None:
+                if line.strip() and not line.lstrip().startswith('{'):
+                    other_output.append(line.rstrip())
+                continue
 
-        raise subprocess.CalledProcessError(process.returncode, ' '.join(command))
+            stats.record(event)
+            formatted_event = self.parser.format_event(event)
+            if not formatted_event:
+                continue
+            if progress_callback:
+                progress_callback(formatted_event)
+            elif verbose:
+                print(formatted_event)
+
+        process.wait()
+        if process.returncode != 0:
+            message = '\n'.join(stats.errors() or other_output)
+            raise subprocess.CalledProcessError(process.returncode, ' '.join(command), stderr=message)
+        return stats
     
-    def apply(self, verbose: bool = False, progress_callback=None) -> Dict[str, Any]:
-        """Apply Terraform configuration with optional verbose output parsing."""
+    def _plan_inputs_fingerprint(self) -> str:
+        """Everything a saved plan was computed from: variables, configuration and workspace."""
+        return compute_fingerprint({'variables': self.variables, 'config': self._init_fingerprint()})
+
+    def _saved_plan(self):
+        """Return the saved plan file if it matches the current inputs, else None (with the reason)."""
+        try:
+            with open(self.plan_meta_file, 'r') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None, "no saved plan"
+        if not self.plan_file.is_file():
+            return None, "no saved plan"
+        age = time.time() - meta.get('created_at', 0)
+        if age > self.plan_max_age:
+            return None, f"saved plan is {age:.0f} seconds old (limit {self.plan_max_age})"
+        if meta.get('fingerprint') != self._plan_inputs_fingerprint():
+            return None, "variables or configuration changed since the plan was made"
+        return self.plan_file, None
+
+    def discard_plan(self) -> None:
+        for path in (self.plan_file, self.plan_meta_file):
+            if path.exists():
+                path.unlink()
+
+    def apply(self, use_plan: bool = False, verbose: bool = False, progress_callback=None) -> Dict[str, Any]:
+        """Apply Terraform configuration with optional verbose output parsing.
+
+        A plan saved by plan() is applied as is when its inputs still match,
+        skipping the second refresh and plan; otherwise this is a full apply.
+        With use_plan the saved plan is required.
+        """
         try:
             self.init()
-            
-            self._run_terraform_command(['terraform', 'apply', '-auto-approve'], verbose, progress_callback)
-            
-            # Get outputs
+
+            plan_file, reason = self._saved_plan()
+            if use_plan and plan_file is None:
+                raise Exception(f"Cannot use the saved plan: {reason}. Run 'plan' again.")
+            stats = None
+            if plan_file is not None:
+                print(f"Applying saved plan {plan_file}")
+                try:
+                    # A plan file already carries its variables; -var-file is not allowed with it
+                    stats = self._run_terraform_command(['terraform', 'apply', '-auto-approve', '-input=false', str(plan_file)], verbose, progress_callback)
+                except subprocess.CalledProcessError as e:
+                    # Terraform refuses a plan whose state changed since it was made
+                    if use_plan or 'Saved plan is stale' not in (e.stderr or ''):
+                        raise
+                    print("Saved plan is stale, running a full apply")
+                finally:
+                    # A saved plan can only be applied once, whatever the outcome
+                    self.discard_plan()
+            elif reason != "no saved plan":
+                print(f"Not using the saved plan: {reason}")
+
+            if stats is None:
+                stats = self._run_terraform_command(['terraform', 'apply', '-auto-approve', '-input=false', f'-var-file={self.tfvars_path}'], verbose, progress_callback)
+            stats.print_timings()
+
+            # The event stream ends with the outputs; older Terraform versions may not send them
+            if stats.outputs is not None:
+                return parse_terraform_outputs(stats.outputs)
             result = subprocess.run(
                 ['terraform', 'output', '-json'],
                 cwd=self.tf_dir,
+                env=self.env,
                 check=True,
                 capture_output=True,
                 text=True
@@ -94,28 +255,36 @@ class TerraformProvisioner(BaseProvisioner):
         """Destroy Terraform infrastructure with optional verbose output parsing."""
         try:
             self.init()
+            self.discard_plan()
             
-            self._run_terraform_command(['terraform', 'destroy', '-auto-approve'], verbose, progress_callback)
+            stats = self._run_terraform_command(['terraform', 'destroy', '-auto-approve', f'-var-file={self.tfvars_path}'], verbose, progress_callback)
+            stats.print_timings()
             
         except subprocess.CalledProcessError as e:
             error_output = e.stderr.strip() if e.stderr else str(e)
             raise Exception(f"Terraform destroy failed: {error_output}")
     
     def plan(self) -> str:
+        """Plan the changes and save them, tagged with their inputs, for the next deploy."""
         self.init()  # Make sure tfvars and init are done
+        self.discard_plan()
+        lines = []
         try:
-            result = subprocess.run(
-                ['terraform', 'plan', '-no-color'],
-                cwd=self.tf_dir,
-                check=True,
-                capture_output=True,
-                text=True
+            self._run_terraform_command(
+                ['terraform', 'plan', '-input=false', f'-var-file={self.tfvars_path}', f'-out={self.plan_file}'],
+                progress_callback=lines.append
             )
-            return result.stdout
         except subprocess.CalledProcessError as e:
             error_output = e.stderr.strip() if e.stderr else str(e)
             raise Exception(f"Terraform plan failed: {error_output}")
 
+        with open(self.plan_meta_file, 'w') as f:
+            json.dump({'fingerprint': self._plan_inputs_fingerprint(), 'created_at': time.time()}, f)
+        plan_output = '\n'.join(lines)
+        print(f"\n📝 Planned changes:\n{plan_output}")
+        print(f"\nPlan saved to {self.plan_file}. 'deploy' applies exactly this plan while the inputs are unchanged.")
+        return plan_output
+
 def parse_terraform_outputs(raw_outputs):
     """Flatten terraform output dict to key: value, hiding sensitive if needed."""
     parsed = {}
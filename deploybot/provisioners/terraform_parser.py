@@ -1,7 +1,9 @@
 import re
-from typing import Optional
+import json
+from typing import Iterable, Iterator, Optional
 from dataclasses import dataclass
 from enum import Enum
+from .events import EventKind, ProvisionEvent, format_event
 
 
 class ResourceEventType(Enum):
@@ -13,7 +15,7 @@ class ResourceEventType(Enum):
     DESTROYED = "destroyed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceEvent:
     """Represents a resource event from Terraform output."""
     event_type: ResourceEventType
@@ -22,41 +24,57 @@ class ResourceEvent:
     raw_line: str = ""
 
 
+# All six resource events in one pattern: '<type>.<name>: <what happened>'. The named
+# group that matched gives the event type and, for completions, the duration
+_RESOURCE_EVENT_PATTERN = re.compile(
+    r'(\w+\.\w+):\s*(?:'
+    r'(?P<creating>Creating\.\.\.)'
+    r'|Creation complete after (?P<created>\d+[ms])'
+    r'|(?P<modifying>Modifying\.\.\.)'
+    r'|Modifications complete after (?P<modified>\d+[ms])'
+    r'|(?P<destroying>Destroying\.\.\.)'
+    r'|Destruction complete after (?P<destroyed>\d+[ms])'
+    r')'
+)
+
+_EVENT_TYPES = {event_type.value: event_type for event_type in ResourceEventType}
+_COMPLETIONS = {'created', 'modified', 'destroyed'}
+
+
 class TerraformOutputParser:
-    """Parses Terraform output to extract resource events and format them nicely."""
-    
-    def __init__(self):
-        # Patterns to match different Terraform output events
-        self.patterns = {
-            ResourceEventType.CREATING: r'(\w+\.\w+):\s*Creating\.\.\.',
-            ResourceEventType.CREATED: r'(\w+\.\w+):\s*Creation complete after (\d+[ms])',
-            ResourceEventType.MODIFYING: r'(\w+\.\w+):\s*Modifying\.\.\.',
-            ResourceEventType.MODIFIED: r'(\w+\.\w+):\s*Modifications complete after (\d+[ms])',
-            ResourceEventType.DESTROYING: r'(\w+\.\w+):\s*Destroying\.\.\.',
-            ResourceEventType.DESTROYED: r'(\w+\.\w+):\s*Destruction complete after (\d+[ms])',
-        }
+    """Parses Terraform output to extract resource events and format them nicely.
+
+    Each line is matched once against a single precompiled pattern, after a
+    substring prefilter that rejects most lines (plan bodies, logs) without
+    running the regex at all.
+    """
     
     def parse_line(self, line: str) -> Optional[ResourceEvent]:
         """Parse a single line of Terraform output."""
+        # Every event contains one of these; checked before stripping or matching
+        if 'Creat' not in line and 'Modif' not in line and 'Destr' not in line:
+            return None
         line = line.strip()
-        if not line:
+        match = _RESOURCE_EVENT_PATTERN.search(line)
+        if match is None:
             return None
-            
-        for event_type, pattern in self.patterns.items():
-            match = re.search(pattern, line)
-            if match:
-                full_name = match.group(1)
-                resource_name = self._extract_resource_name(full_name)
-                duration = match.group(2) if len(match.groups()) > 1 else None
-                
-                return ResourceEvent(
-                    event_type=event_type,
-                    resource_name=resource_name,
-                    duration=duration,
-                    raw_line=line
-                )
-        
-        return None
+
+        kind = match.lastgroup
+        event_type = _EVENT_TYPES[kind]
+        return ResourceEvent(
+            event_type=event_type,
+            resource_name=self._extract_resource_name(match.group(1)),
+            duration=match.group(kind) if kind in _COMPLETIONS else None,
+            raw_line=line
+        )
+
+    def iter_events(self, lines: Iterable[str]) -> Iterator[ResourceEvent]:
+        """Lazily parse an iterable of lines (e.g. an open log file or a process' stdout)."""
+        parse_line = self.parse_line
+        for line in lines:
+            event = parse_line(line)
+            if event is not None:
+                yield event
     
     def _extract_resource_name(self, full_name: str) -> str:
         """Extract resource name from full Terraform resource name."""
@@ -83,4 +101,88 @@ class TerraformOutputParser:
             duration_text = f" ({event.duration})" if event.duration else ""
             return f"✅ Destroyed {event.resource_name}{duration_text}"
         
-        return event.raw_line 
\ No newline at end of file
+        return event.raw_line 
+
+
+def _hook_event(kind: EventKind):
+    def parse(message: dict) -> ProvisionEvent:
+        hook = message.get('hook', {})
+        return ProvisionEvent(
+            kind=kind,
+            resource=hook.get('resource', {}).get('addr'),
+            action=hook.get('action'),
+            elapsed=hook.get('elapsed_seconds')
+        )
+    return parse
+
+
+def _planned_change(message: dict) -> ProvisionEvent:
+    change = message.get('change', {})
+    return ProvisionEvent(EventKind.PLANNED_CHANGE, resource=change.get('resource', {}).get('addr'), action=change.get('action'))
+
+
+def _diagnostic(message: dict) -> ProvisionEvent:
+    diagnostic = message.get('diagnostic', {})
+    text = diagnostic.get('summary', '')
+    if diagnostic.get('detail'):
+        text = f"{text}: {diagnostic['detail']}"
+    if diagnostic.get('address'):
+        text = f"{diagnostic['address']}: {text}"
+    return ProvisionEvent(EventKind.DIAGNOSTIC, severity=diagnostic.get('severity'), message=text)
+
+
+def _change_summary(message: dict) -> ProvisionEvent:
+    changes = message.get('changes', {})
+    return ProvisionEvent(
+        EventKind.CHANGE_SUMMARY,
+        action=changes.get('operation'),
+        message=message.get('@message'),
+        changes={key: changes[key] for key in ('add', 'change', 'remove', 'import') if key in changes}
+    )
+
+
+def _outputs(message: dict) -> ProvisionEvent:
+    return ProvisionEvent(EventKind.OUTPUTS, outputs=message.get('outputs', {}))
+
+
+class TerraformJsonParser:
+    """Decodes the `terraform apply/plan/destroy -json` stream into typed events.
+
+    Terraform writes one JSON message per line; each line is decoded on its
+    own and nothing is kept between lines. Message types that carry no
+    progress (version, log, refresh_*) yield None.
+    """
+
+    _handlers = {
+        'apply_start': _hook_event(EventKind.RESOURCE_START),
+        'apply_progress': _hook_event(EventKind.RESOURCE_PROGRESS),
+        'apply_complete': _hook_event(EventKind.RESOURCE_COMPLETE),
+        'apply_errored': _hook_event(EventKind.RESOURCE_ERRORED),
+        'planned_change': _planned_change,
+        'diagnostic': _diagnostic,
+        'change_summary': _change_summary,
+        'outputs': _outputs,
+    }
+
+    def parse_line(self, line: str) -> Optional[ProvisionEvent]:
+        """Parse a single line of `-json` output; non-JSON lines yield None."""
+        line = line.strip()
+        if not line.startswith('{'):
+            return None
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return None
+        handler = self._handlers.get(message.get('type'))
+        return handler(message) if handler else None
+
+    def iter_events(self, lines: Iterable[str]) -> Iterator[ProvisionEvent]:
+        """Lazily parse an iterable of `-json` lines."""
+        parse_line = self.parse_line
+        for line in lines:
+            event = parse_line(line)
+            if event is not None:
+                yield event
+
+    def format_event(self, event: ProvisionEvent) -> Optional[str]:
+        return format_event(event)
@@ -1,3 +1,14 @@
-from .gcp import GCPTarget
+import importlib
 
-__all__ = ['GCPTarget'] 
\ No newline at end of file
+# Resolved on first access so the Google SDK is only loaded for GCP deployments
+_EXPORTS = {
+    'GCPTarget': '.gcp',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,11 +7,14 @@ from deploybot.core.stack import Stack
 from deploybot.provisioners.base import BaseProvisioner
 from .base import BaseTarget
 from ..provisioners.factory import ProvisionerFactory
+from .credential_cache import CredentialCache, principal_key
+from deploybot.utils.cache import get_cache_dir
 
 class AWSTarget(BaseTarget):   
     def __init__(self, config: Dict[str, Any], provisioner: Provisioner):
         region = config.get('region', 'us-east-1')
         super().__init__(name=Target.AWS.value, region=region, config=config, provisioner=provisioner)
+        self.credential_cache = CredentialCache(Target.AWS.value)
         
         # Initialize AWS credentials
         self._init_credentials()
@@ -19,18 +22,42 @@ class AWSTarget(BaseTarget):
     def _init_credentials(self) -> None:
         """Initialize AWS credentials."""
         try:
-            self.session = boto3.Session(region_name=self.region)
-            self.sts = self.session.client('sts')
+            self.session = boto3.Session(botocore_session=self._botocore_session(), region_name=self.region)
+            credentials = self.session.get_credentials()
+            # Identifies the access key and profile; the secret key is never part of the key
+            self._principal = principal_key(
+                credentials.access_key if credentials else None,
+                self.session.profile_name
+            )
         except Exception as e:
             raise Exception(f"Failed to initialize AWS credentials: {str(e)}")
+
+    @staticmethod
+    def _botocore_session():
+        """botocore session persisting assumed-role credentials, so later runs reuse them until they expire (as the AWS CLI does)."""
+        import botocore.session
+        from botocore.utils import JSONFileCache
+
+        core_session = botocore.session.get_session()
+        try:
+            provider = core_session.get_component('credential_provider').get_provider('assume-role')
+            provider.cache = JSONFileCache(str(get_cache_dir() / 'aws-assume-role'))
+        except Exception:
+            # Without the provider, role credentials are just not shared between runs
+            pass
+        return core_session
     
     def validate_credentials(self) -> None:
-        """Validate AWS credentials and permissions."""
+        """Validate AWS credentials and permissions, unless they were validated recently."""
+        if self.credential_cache.is_validated(self._principal):
+            return
         try:
             # Make a simple API call to verify credentials
-            self.sts.get_caller_identity()
+            identity = self.session.client('sts').get_caller_identity()
         except Exception as e:
+            self.credential_cache.invalidate(self._principal)
             raise Exception(f"Failed to validate AWS credentials: {str(e)}")
+        self.credential_cache.record_validation(self._principal, {'account': identity.get('Account')})
     
     def get_provisioner(self, stack_obj: Stack) -> BaseProvisioner:
         return ProvisionerFactory.create(self.provisioner, stack_obj, Target.AWS, self.config) 
\ No newline at end of file
@@ -0,0 +1,84 @@
+import datetime
+import hashlib
+import os
+from typing import Any, Dict, Optional
+
+from deploybot.utils.cache import JsonFileCache
+
+# How long a successful credential validation is trusted (seconds); 0 disables the cache
+_VALIDATION_TTL = float(os.getenv('DEPLOYBOT_CREDENTIAL_TTL', 15 * 60))
+# Cached access tokens are only reused with at least this much lifetime left
+_TOKEN_MIN_REMAINING = datetime.timedelta(minutes=5)
+_TOKEN_TTL = 60 * 60
+
+
+def _as_utc(moment: datetime.datetime) -> datetime.datetime:
+    """Make a datetime timezone-aware; naive values are UTC, as google-auth uses them."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=datetime.timezone.utc)
+    return moment.astimezone(datetime.timezone.utc)
+
+
+def principal_key(*parts: Optional[str]) -> str:
+    """Hash identifying values (never stored in clear) into a cache key."""
+    return hashlib.sha256('\0'.join(part or '' for part in parts).encode()).hexdigest()[:32]
+
+
+class CredentialCache:
+    """Remembers successful credential validations and GCP access tokens across CLI runs.
+
+    Entries are keyed by target plus a hash of the principal and the
+    project/account, so switching identity or project is always a miss.
+    """
+
+    def __init__(self, target: str, validation_ttl: float = _VALIDATION_TTL):
+        self.target = target
+        self.enabled = validation_ttl > 0
+        self._validations = JsonFileCache('credential-validations', validation_ttl)
+        self._tokens = JsonFileCache('access-tokens', _TOKEN_TTL)
+
+    def _key(self, principal: str) -> str:
+        return f"{self.target}-{principal}"
+
+    def is_validated(self, principal: str) -> bool:
+        return self.enabled and self._validations.get(self._key(principal)) is not None
+
+    def record_validation(self, principal: str, details: Optional[Dict[str, Any]] = None) -> None:
+        if self.enabled:
+            self._validations.set(self._key(principal), details or {})
+
+    def invalidate(self, principal: str) -> None:
+        self._validations.delete(self._key(principal))
+        self._tokens.delete(self._key(principal))
+
+    def restore_token(self, principal: str, credentials) -> bool:
+        """Load a cached, still-fresh access token into google-auth credentials.
+
+        The token is a live bearer token read from disk (see store_token).
+        """
+        if not self.enabled:
+            return False
+        entry = self._tokens.get(self._key(principal))
+        if not entry:
+            return False
+        expiry = _as_utc(datetime.datetime.fromisoformat(entry['expiry']))
+        if expiry - datetime.datetime.now(datetime.timezone.utc) < _TOKEN_MIN_REMAINING:
+            return False
+        credentials.token = entry['token']
+        # google-auth compares expiry as a naive UTC datetime
+        credentials.expiry = expiry.replace(tzinfo=None)
+        return True
+
+    def store_token(self, principal: str, credentials) -> None:
+        """Write the credentials' access token to the cache until it expires.
+
+        This stores the live bearer token in clear text under ~/.cache/deploybot,
+        in a file readable only by the current user (0600). Anyone who can read
+        it can act as the principal until the token expires. Set
+        DEPLOYBOT_CREDENTIAL_TTL=0 to disable the cache and keep tokens off disk.
+        """
+        if self.enabled and credentials.token and credentials.expiry:
+            self._tokens.set(self._key(principal), {
+                'token': credentials.token,
+                'expiry': _as_utc(credentials.expiry).isoformat()
+            })
@@ -1,25 +1,27 @@
 # deploybot/targets/factory.py
+import importlib
 from typing import Dict, Any
 
 from deploybot.core.parameters import DeployParameters
 from .base import BaseTarget
-from .gcp import GCPTarget
-from .aws import AWSTarget
 from ..core.enums import Target
 
 class TargetFactory:
     """Factory for creating deployment targets."""
     
+    # Target modules are imported on demand: each one pulls in its cloud SDK
     _targets = {
-        Target.GCP: GCPTarget,
-        Target.AWS: AWSTarget,
+        Target.GCP: ('deploybot.targets.gcp', 'GCPTarget'),
+        Target.AWS: ('deploybot.targets.aws', 'AWSTarget'),
     }
     
     @classmethod
     def create(cls, target_type: Target, config: Dict[str, Any], parameters: DeployParameters) -> BaseTarget:
-        target_class = cls._targets.get(target_type)
-        if not target_class:
+        target_entry = cls._targets.get(target_type)
+        if not target_entry:
             raise ValueError(f"Unsupported target type: {target_type}")
+        module_name, class_name = target_entry
+        target_class = getattr(importlib.import_module(module_name), class_name)
 
         target_config = config.get(target_type.value, {}).copy()
         
@@ -1,6 +1,7 @@
+import threading
 from typing import Dict, Any
-from google.cloud import storage
 import google.auth
+import google.auth.transport.requests
 
 from deploybot.core.enums import Target, Provisioner
 from deploybot.core.stack import Stack
@@ -8,6 +9,19 @@ from deploybot.provisioners.base import BaseProvisioner
 from .base import BaseTarget
 from ..provisioners.factory import ProvisionerFactory
 from deploybot.core.global_state import global_state_manager
+from .credential_cache import CredentialCache, principal_key
+
+_adc_lock = threading.Lock()
+_adc = None
+
+def _default_credentials():
+    """Application Default Credentials, loaded once per process and shared by every stack."""
+    global _adc
+    with _adc_lock:
+        if _adc is None:
+            _adc = google.auth.default()
+        return _adc
+
 
 class GCPTarget(BaseTarget):
     """GCP deployment target implementation."""
@@ -17,6 +31,7 @@ class GCPTarget(BaseTarget):
         super().__init__(name=Target.GCP.value, region=region, config=config, provisioner=provisioner)
         self.project_id = config.get('project_id')
         self.zone = config.get('zone', 'us-central1-a')
+        self.credential_cache = CredentialCache(Target.GCP.value)
         
         # Initialize credentials using Application Default Credentials
         self._init_credentials()
@@ -30,12 +45,26 @@ class GCPTarget(BaseTarget):
     def _init_credentials(self) -> None:
         """Initialize GCP credentials using Application Default Credentials."""
         try:
-            credentials, default_project = google.auth.default()
+            credentials, default_project = _default_credentials()
             
             if not self.project_id and default_project:
                 self.project_id = default_project
                 self.config['project_id'] = default_project
 
+            # Identifies who is calling and for which project; the refresh token is only ever hashed
+            self._principal = principal_key(
+                type(credentials).__name__,
+                getattr(credentials, 'service_account_email', None),
+                getattr(credentials, 'client_id', None),
+                getattr(credentials, 'refresh_token', None),
+                self.project_id
+            )
+            # Reuse the token of another stack in this run, or of a recent run, instead of refreshing it again
+            with _adc_lock:
+                if not credentials.valid and not self.credential_cache.restore_token(self._principal, credentials):
+                    credentials.refresh(google.auth.transport.requests.Request())
+                    self.credential_cache.store_token(self._principal, credentials)
+
             global_state_manager.gcp_credentials = credentials
             
         except Exception as e:
@@ -46,17 +75,24 @@ class GCPTarget(BaseTarget):
             )
     
     def validate_credentials(self) -> None:
-        """Validate GCP credentials and permissions."""
+        """Validate GCP credentials and permissions, unless they were validated recently."""
+        if self.credential_cache.is_validated(self._principal):
+            return
         try:
+            # Imported here: skipped entirely while a cached validation is fresh
+            from google.cloud import storage
+
             # Try to access GCS as a simple permission check
             storage_client = storage.Client(
                 credentials=global_state_manager.gcp_credentials,
                 project=self.project_id
             )
-            # Make a small API call to verify credentials
-            storage_client.list_buckets(max_results=1)
+            # Make a small API call to verify credentials (the iterator is lazy, so consume it)
+            list(storage_client.list_buckets(max_results=1))
         except Exception as e:
+            self.credential_cache.invalidate(self._principal)
             raise Exception(f"Failed to validate GCP credentials: {str(e)}")
+        self.credential_cache.record_validation(self._principal)
     
     def get_provisioner(self, stack_obj: Stack) -> BaseProvisioner:
         return ProvisionerFactory.create(self.provisioner, stack_obj, Target.GCP, self.config) 
\ No newline at end of file
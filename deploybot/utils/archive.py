@@ -0,0 +1,161 @@
+import hashlib
+import io
+import os
+import stat
+import tarfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from deploybot.utils.compression import CompressionCodec, GzipCodec
+from deploybot.utils.ignore import IgnoreRules
+
+_READ_CHUNK_SIZE = 1024 * 1024
+# Files up to this size are read ahead on worker threads; larger ones stream from disk
+_PREFETCH_MAX_FILE_SIZE = 1024 * 1024
+_DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class SourceTree:
+    """The entries of a source directory selected for packaging, in a stable order.
+
+    Ignored paths are dropped during the walk; ignored directories are pruned
+    whole where no '!' rule could re-include something beneath them.
+    """
+
+    def __init__(self, source_dir: str, ignore_rules: Optional[IgnoreRules] = None):
+        self.source_dir = source_dir
+        self.ignore_rules = ignore_rules if ignore_rules is not None else IgnoreRules.from_directory(source_dir)
+        self.entries: List[Tuple[str, str, os.stat_result]] = []
+        self.included_files = 0
+        self.included_bytes = 0
+        self.excluded_files = 0
+        self.excluded_bytes = 0
+        # Ignored directories skipped without listing them; their files are not counted above
+        self.pruned_dirs = 0
+        self._scan()
+
+    def _scan(self) -> None:
+        self.entries.append((".", self.source_dir, os.lstat(self.source_dir)))
+        self._scan_dir(self.source_dir, "", False)
+
+    def _scan_dir(self, path: str, rel_dir: str, dir_ignored: bool) -> None:
+        with os.scandir(path) as it:
+            children = sorted(it, key=lambda entry: entry.name)
+        for entry in children:
+            relpath = f"{rel_dir}{entry.name}"
+            is_dir = entry.is_dir(follow_symlinks=False)
+            ignored = self.ignore_rules.is_ignored(relpath, is_dir, dir_ignored)
+            if is_dir:
+                if ignored and self.ignore_rules.can_prune(relpath):
+                    self.pruned_dirs += 1
+                    continue
+                if not ignored:
+                    self.entries.append((f"./{relpath}", entry.path, entry.stat(follow_symlinks=False)))
+                self._scan_dir(entry.path, f"{relpath}/", ignored)
+                continue
+
+            st = entry.stat(follow_symlinks=False)
+            if ignored:
+                self.excluded_files += 1
+                self.excluded_bytes += st.st_size
+            else:
+                self.entries.append((f"./{relpath}", entry.path, st))
+                self.included_files += 1
+                self.included_bytes += st.st_size
+
+    def summary(self) -> str:
+        return (
+            f"{self.included_files} files ({self.included_bytes / 1e6:.1f} MB) included, "
+            f"{self.excluded_files} files ({self.excluded_bytes / 1e6:.1f} MB) excluded, "
+            f"{self.pruned_dirs} ignored directories skipped"
+        )
+
+
+def _normalized_mode(st_mode: int) -> int:
+    if stat.S_ISDIR(st_mode) or st_mode & stat.S_IXUSR:
+        return 0o755
+    return 0o644
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_small_file(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _map_ordered(executor: ThreadPoolExecutor, func, items: List, window: int) -> Iterator:
+    """Like executor.map, but with at most `window` results buffered ahead of the consumer."""
+    in_flight = deque()
+    for item in items:
+        in_flight.append(executor.submit(func, item) if item is not None else None)
+        if len(in_flight) > window:
+            future = in_flight.popleft()
+            yield future.result() if future is not None else None
+    while in_flight:
+        future = in_flight.popleft()
+        yield future.result() if future is not None else None
+
+
+def hash_source_tree(tree: SourceTree, workers: int = _DEFAULT_WORKERS) -> str:
+    """Return a sha256 digest of the names, types, modes and contents of a source tree.
+
+    File contents are hashed on worker threads; hashlib releases the GIL.
+    """
+    entries = tree.entries
+    regular_files = [path if stat.S_ISREG(st.st_mode) else None for _, path, st in entries]
+
+    digest = hashlib.sha256()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        file_digests = _map_ordered(executor, _file_digest, regular_files, window=workers * 4)
+        for (arcname, path, st), file_digest in zip(entries, file_digests):
+            if stat.S_ISLNK(st.st_mode):
+                digest.update(f"L {arcname} {os.readlink(path)}\0".encode())
+            elif stat.S_ISDIR(st.st_mode):
+                digest.update(f"D {arcname}\0".encode())
+            elif stat.S_ISREG(st.st_mode):
+                digest.update(f"F {arcname} {_normalized_mode(st.st_mode):o} {file_digest}\0".encode())
+    return digest.hexdigest()
+
+
+def write_deterministic_tar(tree: SourceTree, fileobj: BinaryIO, codec: Optional[CompressionCodec] = None, workers: int = _DEFAULT_WORKERS) -> None:
+    """Write the tree as a compressed tar whose bytes depend only on its contents.
+
+    Entries are sorted and mtimes, owners and permission bits are normalized.
+    Small files are read ahead on worker threads while earlier entries are
+    being compressed. Defaults to single-threaded gzip.
+    """
+    codec = codec or GzipCodec()
+    entries = tree.entries
+    prefetch = [
+        path if stat.S_ISREG(st.st_mode) and st.st_size <= _PREFETCH_MAX_FILE_SIZE else None
+        for _, path, st in entries
+    ]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor, codec.open(fileobj) as compressed:
+        with tarfile.open(fileobj=compressed, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+            contents = _map_ordered(executor, _read_small_file, prefetch, window=workers * 4)
+            for (arcname, path, st), content in zip(entries, contents):
+                info = tar.gettarinfo(path, arcname=arcname)
+                if info is None:
+                    # Sockets, FIFOs and other special files are not archived
+                    continue
+                info.mtime = 0
+                info.uid = info.gid = 0
+                info.uname = info.gname = ''
+                info.mode = _normalized_mode(st.st_mode)
+                if not info.isreg():
+                    tar.addfile(info)
+                elif content is not None:
+                    info.size = len(content)
+                    tar.addfile(info, io.BytesIO(content))
+                else:
+                    with open(path, 'rb') as f:
+                        tar.addfile(info, f)
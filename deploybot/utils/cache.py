@@ -0,0 +1,65 @@
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+def get_cache_dir() -> Path:
+    """Return the deploybot cache directory (overridable via DEPLOYBOT_CACHE_DIR)."""
+    cache_dir = os.getenv('DEPLOYBOT_CACHE_DIR')
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.home() / '.cache' / 'deploybot'
+
+
+class JsonFileCache:
+    """On-disk JSON cache with one file per key and a time-to-live per entry.
+
+    Files are written atomically and readable only by the current user. A
+    missing, expired or corrupt entry is treated as a cache miss.
+    """
+
+    def __init__(self, namespace: str, ttl: float):
+        self.directory = get_cache_dir() / namespace
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            with open(self._path(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or time.time() - entry.get('stored_at', 0) > self.ttl:
+            return None
+        return entry.get('value')
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        tmp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # A unique, 0600 temp file per writer, so concurrent writers (threads or processes) never share one
+            fd, tmp_path = tempfile.mkstemp(prefix=f"{path.name}.", suffix='.tmp', dir=self.directory)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'stored_at': time.time(), 'value': value}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            # The cache is an optimisation only; never fail a deployment over it
+            print(f"Warning: could not write cache entry {path}: {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,150 @@
+import gzip
+import io
+import os
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict
+
+
+class _UnclosingWriter(io.RawIOBase):
+    """Passes writes through without closing the underlying file."""
+
+    def __init__(self, fileobj: BinaryIO):
+        super().__init__()
+        self._fileobj = fileobj
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self._fileobj.write(data)
+
+
+class _ParallelGzipWriter(io.RawIOBase):
+    """Compresses fixed-size blocks on worker threads as independent gzip members.
+
+    Concatenated gzip members form a valid gzip stream, so the output is readable
+    by any gzip decoder. zlib releases the GIL, so blocks compress in parallel.
+    """
+
+    def __init__(self, fileobj: BinaryIO, level: int, block_size: int, workers: int):
+        super().__init__()
+        self._fileobj = fileobj
+        self._level = level
+        self._block_size = block_size
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pgzip')
+        self._max_in_flight = workers * 2
+        self._in_flight = deque()
+        self._buffer = bytearray()
+        self._members = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            self._submit(bytes(self._buffer[:self._block_size]))
+            del self._buffer[:self._block_size]
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        self._in_flight.append(self._executor.submit(gzip.compress, block, self._level, mtime=0))
+        self._members += 1
+        while len(self._in_flight) > self._max_in_flight:
+            self._fileobj.write(self._in_flight.popleft().result())
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                if self._buffer or not self._members:
+                    self._submit(bytes(self._buffer))
+                    self._buffer.clear()
+                while self._in_flight:
+                    self._fileobj.write(self._in_flight.popleft().result())
+            finally:
+                self._executor.shutdown()
+        super().close()
+
+
+class CompressionCodec(ABC):
+    """A compression format for source archives."""
+    name = ''
+    extension = ''
+    # Shell command that unpacks ARCHIVE into the current directory
+    extract_command = ''
+
+    @abstractmethod
+    def open(self, fileobj: BinaryIO) -> BinaryIO:
+        """Return a writable stream compressing into fileobj; closing it leaves fileobj open."""
+        pass
+
+
+class GzipCodec(CompressionCodec):
+    name = 'gzip'
+    extension = 'tar.gz'
+    extract_command = 'tar -xzf ARCHIVE'
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def open(self, fileobj: BinaryIO) -> BinaryIO:
+        return gzip.GzipFile(filename='', mode='wb', fileobj=fileobj, mtime=0, compresslevel=self.level)
+
+
+class ParallelGzipCodec(GzipCodec):
+    """Multi-threaded gzip producing standard (multi-member) .tar.gz archives."""
+    name = 'pgzip'
+
+    def __init__(self, level: int = 6, workers: int = 0, block_size: int = 1024 * 1024):
+        super().__init__(level)
+        self.workers = workers or os.cpu_count() or 1
+        self.block_size = block_size
+
+    def open(self, fileobj: BinaryIO) -> BinaryIO:
+        return _ParallelGzipWriter(fileobj, self.level, self.block_size, self.workers)
+
+
+class ZstdCodec(CompressionCodec):
+    """Multi-threaded zstd; requires the optional 'zstandard' package."""
+    name = 'zstd'
+    extension = 'tar.zst'
+    extract_command = 'zstd -dc ARCHIVE | tar -xf -'
+
+    def __init__(self, level: int = 3, threads: int = -1):
+        self.level = level
+        self.threads = threads
+
+    def open(self, fileobj: BinaryIO) -> BinaryIO:
+        try:
+            import zstandard
+        except ImportError:
+            raise Exception("zstd compression requires the 'zstandard' package (pip install zstandard)")
+        compressor = zstandard.ZstdCompressor(level=self.level, threads=self.threads)
+        return compressor.stream_writer(fileobj, closefd=False)
+
+
+class NoCompressionCodec(CompressionCodec):
+    """Plain tar, for fast networks where compression costs more than it saves."""
+    name = 'none'
+    extension = 'tar'
+    extract_command = 'tar -xf ARCHIVE'
+
+    def open(self, fileobj: BinaryIO) -> BinaryIO:
+        return _UnclosingWriter(fileobj)
+
+
+CODECS: Dict[str, type] = {
+    GzipCodec.name: GzipCodec,
+    ParallelGzipCodec.name: ParallelGzipCodec,
+    ZstdCodec.name: ZstdCodec,
+    NoCompressionCodec.name: NoCompressionCodec,
+}
+
+
+def get_codec(name: str) -> CompressionCodec:
+    """Return a codec instance by name ('gzip', 'pgzip', 'zstd' or 'none')."""
+    if name not in CODECS:
+        raise ValueError(f"Unsupported compression '{name}'. Choose one of: {', '.join(CODECS)}")
+    return CODECS[name]()
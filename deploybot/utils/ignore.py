@@ -0,0 +1,154 @@
+import os
+import re
+from typing import Iterable, List, Optional, Pattern
+
+# Used when a source directory has neither a .dockerignore nor a .gcloudignore
+DEFAULT_IGNORE_PATTERNS = [
+    '.git/',
+    '__pycache__/',
+    '*.py[cod]',
+    '.venv/',
+    'venv/',
+    'node_modules/',
+    '.pytest_cache/',
+    '.mypy_cache/',
+]
+
+# Docker always sends these with the build context, whatever .dockerignore says
+ALWAYS_INCLUDED = ('Dockerfile', '.dockerignore')
+
+_WILDCARD_CHARS = '*?['
+
+
+def _translate(pattern: str) -> str:
+    """Translate a glob with '**' support into a regex over '/'-separated paths."""
+    i, n = 0, len(pattern)
+    parts = []
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif c == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif c == '?':
+            parts.append('[^/]')
+            i += 1
+        elif c == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                parts.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:end].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = end + 1
+        else:
+            parts.append(re.escape(c))
+            i += 1
+    return ''.join(parts)
+
+
+class IgnoreRule:
+    """A single compiled ignore pattern."""
+
+    def __init__(self, pattern: str, anchored_only: bool):
+        self.negated = pattern.startswith('!')
+        if self.negated:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith('/')
+        pattern = pattern.strip('/') if anchored_only else pattern.rstrip('/')
+        # gitignore style: a pattern without an inner slash matches at any depth
+        anchored = anchored_only or '/' in pattern
+        pattern = pattern.lstrip('/')
+        self.regex: Pattern = re.compile(('' if anchored else '(?:.*/)?') + _translate(pattern))
+        # Literal leading path of the pattern, used to decide whether a negation can reach into a directory
+        literal = re.split(r'[*?\[]', pattern, maxsplit=1)[0]
+        self.literal_prefix = literal if anchored else None
+
+    def matches(self, relpath: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        return self.regex.fullmatch(relpath) is not None
+
+
+class IgnoreRules:
+    """Compiled .dockerignore / .gcloudignore style rules; the last matching rule wins.
+
+    .dockerignore patterns are anchored at the source root (use '**/' to match
+    at any depth); .gcloudignore and the defaults follow .gitignore, where a
+    pattern without a slash matches at any depth. A pattern matching a
+    directory excludes everything beneath it unless a later '!' rule
+    re-includes something there. Paths in always_include are never excluded.
+    """
+
+    def __init__(self, rules: List[IgnoreRule], always_include: Iterable[str] = ()):
+        self.rules = rules
+        self.always_include = frozenset(always_include)
+        self.negations = [rule for rule in rules if rule.negated]
+        # Without negations one combined regex per kind decides every path
+        self._combined_any = self._combine([rule for rule in rules if not rule.dir_only])
+        self._combined_dirs = self._combine([rule for rule in rules if rule.dir_only])
+
+    @staticmethod
+    def _combine(rules: List[IgnoreRule]) -> Optional[Pattern]:
+        if not rules:
+            return None
+        return re.compile('|'.join(f'(?:{rule.regex.pattern})' for rule in rules))
+
+    @classmethod
+    def parse(cls, lines: List[str], anchored_only: bool = False) -> List[IgnoreRule]:
+        rules = []
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            rules.append(IgnoreRule(line, anchored_only))
+        return rules
+
+    @classmethod
+    def from_directory(cls, source_dir: str) -> 'IgnoreRules':
+        """Load .dockerignore and .gcloudignore from source_dir, or fall back to the defaults."""
+        rules = []
+        found = False
+        for filename, anchored_only in (('.dockerignore', True), ('.gcloudignore', False)):
+            path = os.path.join(source_dir, filename)
+            if os.path.isfile(path):
+                found = True
+                with open(path, 'r') as f:
+                    rules.extend(cls.parse(f.read().splitlines(), anchored_only))
+        if not found:
+            rules = cls.parse(DEFAULT_IGNORE_PATTERNS)
+        return cls(rules, ALWAYS_INCLUDED)
+
+    def is_ignored(self, relpath: str, is_dir: bool, parent_ignored: bool = False) -> bool:
+        """Return whether relpath is excluded, given whether its parent directory is."""
+        if relpath in self.always_include:
+            return False
+        if not self.negations:
+            if parent_ignored:
+                return True
+            if self._combined_any is not None and self._combined_any.fullmatch(relpath):
+                return True
+            return is_dir and self._combined_dirs is not None and self._combined_dirs.fullmatch(relpath) is not None
+
+        for rule in reversed(self.rules):
+            if rule.matches(relpath, is_dir):
+                return not rule.negated
+        return parent_ignored
+
+    def can_prune(self, relpath: str) -> bool:
+        """Return whether an ignored directory can be skipped without visiting its contents."""
+        for rule in self.negations:
+            if rule.literal_prefix is None:
+                return False
+            prefix = rule.literal_prefix
+            if prefix.startswith(relpath + '/') or (relpath + '/').startswith(prefix):
+                return False
+        return True
@@ -0,0 +1,131 @@
+import io
+import queue
+import threading
+from typing import Callable, BinaryIO, Optional
+
+_EOF = object()
+
+
+class PipeAborted(Exception):
+    """Raised in the producer when the consumer stopped reading."""
+
+
+class BoundedPipe(io.RawIOBase):
+    """Read side of an in-memory pipe fed by a producer running on its own thread.
+
+    The producer writes into a bounded queue of blocks, so it blocks instead of
+    buffering when the consumer falls behind and peak memory stays constant.
+    Producer errors are re-raised on the next read. The stream only supports
+    seeking to its current position, which is what resumable uploads rely on.
+    """
+
+    def __init__(self, producer: Callable[[BinaryIO], None], block_size: int = 256 * 1024, max_blocks: int = 16):
+        super().__init__()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_blocks)
+        self._writer = _PipeWriter(self, block_size)
+        self._buffer = bytearray()
+        self._position = 0
+        self._error: Optional[BaseException] = None
+        self._aborted = threading.Event()
+        self._eof = False
+        self._thread = threading.Thread(target=self._produce, args=(producer,), name='bounded-pipe-producer', daemon=True)
+        self._thread.start()
+
+    def _produce(self, producer: Callable[[BinaryIO], None]) -> None:
+        try:
+            producer(self._writer)
+            self._writer.flush()
+        except PipeAborted:
+            return
+        except BaseException as e:
+            self._error = e
+        try:
+            self._put(_EOF)
+        except PipeAborted:
+            # The reader is gone; nobody is left to receive the end marker
+            pass
+
+    def _put(self, item) -> None:
+        while not self._aborted.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        raise PipeAborted()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        target = {io.SEEK_SET: offset, io.SEEK_CUR: self._position + offset}.get(whence)
+        if target != self._position:
+            raise io.UnsupportedOperation("BoundedPipe can only seek to its current position")
+        return self._position
+
+    def _next_block(self) -> bool:
+        if self._eof:
+            return False
+        item = self._queue.get()
+        if item is _EOF:
+            self._eof = True
+            if self._error is not None:
+                raise self._error
+            return False
+        self._buffer += item
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            while self._next_block():
+                pass
+            size = len(self._buffer)
+        else:
+            while len(self._buffer) < size and self._next_block():
+                pass
+            size = min(size, len(self._buffer))
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._position += len(data)
+        return data
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        # Unblock a producer that is still writing into a pipe nobody will read
+        self._aborted.set()
+        super().close()
+
+
+class _PipeWriter(io.RawIOBase):
+    """Write side handed to the producer; coalesces small writes into blocks."""
+
+    def __init__(self, pipe: BoundedPipe, block_size: int):
+        super().__init__()
+        self._pipe = pipe
+        self._block_size = block_size
+        self._pending = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._pending += data
+        while len(self._pending) >= self._block_size:
+            self._pipe._put(bytes(self._pending[:self._block_size]))
+            del self._pending[:self._block_size]
+        return len(data)
+
+    def flush(self) -> None:
+        if self._pending:
+            self._pipe._put(bytes(self._pending))
+            self._pending.clear()
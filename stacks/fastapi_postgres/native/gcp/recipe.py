@@ -1,37 +1,93 @@
+import asyncio
 from deploybot.core.recipie import BaseRecipe
+from deploybot.core.plan import ChangeAction, ResourceChange
+from deploybot.core.state import compute_fingerprint
+from deploybot.core.status import ResourceStatus, is_not_found, print_status
 from deploybot.cloud.gcp.services.sql_admin import GCPCloudSQLAdminService
 from deploybot.cloud.gcp.services.storage import GCPStorageService
 from deploybot.cloud.gcp.services.cloud_run import GCPCloudRunService
-from deploybot.cloud.gcp.cloud_build import GCPCloudBuild
+from deploybot.cloud.gcp.services.cloud_build import GCPCloudBuildService, GCR_LOCATION, GCR_REPOSITORY, build_cache_key, build_cache_tag
 from deploybot.cloud.gcp.services.sql_templates import POSTGRES_SQL_TEMPLATE
 from pathlib import Path
 from google.iam.v1.policy_pb2 import Binding
-from google.cloud.run_v2 import Service, RevisionTemplate, Container, VolumeMount, Volume, CloudSqlInstance, EnvVar
-from concurrent.futures import ThreadPoolExecutor
+from google.cloud.run_v2 import Service, RevisionTemplate, Container, VolumeMount, Volume, CloudSqlInstance, EnvVar, Condition
+from deploybot.core.scheduler import Step
 from deploybot.cloud.gcp.services.service_usage import GCPServiceUsageService
 from deploybot.cloud.gcp.enums.services import GoogleCloudService
-from deploybot.cloud.gcp.services.artifact_registry import GCPArtifactRegistryService
-# from deploybot.core.recipie_registry import RecipeRegistry
+from deploybot.cloud.gcp.services.artifact_registry import GCPArtifactRegistryService, GCPArtifactRegistryAsyncService
+from deploybot.cloud.gcp.cloud_run import GCPCloudRunAsync
+from deploybot.cloud.gcp.sql_admin import GCPCloudSQLAdminAsync
+from deploybot.cloud.gcp.storage import GCPStorageAsync
+from deploybot.cloud.gcp.services.storage import GCPStorageAsyncService
+from deploybot.cloud.gcp.artifact_registry import GCPArtifactRegistryAsync
+from deploybot.cloud.gcp.client_factory import GCPClientFactory
+
+_APP_DIR = Path(__file__).parent.parent.parent / 'app'
+
+def _live(result, kind: str, name: str):
+    """Return a probed resource, None if it does not exist, or raise if it could not be read."""
+    if isinstance(result, BaseException):
+        if is_not_found(result):
+            return None
+        raise Exception(f"Could not read {kind} {name}: {result}")
+    return result
 
 class FastAPIPostgresRecipe(BaseRecipe):
-    def __init__(self):
-        super().__init__()
+    supports_status = True
+
+    def __init__(self, variables=None):
+        super().__init__(variables)
         self.stack_name = 'fastapi-postgres'
         self.service_usage_service = GCPServiceUsageService()
         self.sql_admin_service = GCPCloudSQLAdminService()
         self.storage_service = GCPStorageService()
-        self.cloud_build = GCPCloudBuild()
+        self.cloud_build_service = GCPCloudBuildService()
         self.cloud_run_service = GCPCloudRunService()
         self.artifact_registry_service = GCPArtifactRegistryService()
-    
-    def _db_flow(self):
+        self._plan = None
+
+    def _planned_exists(self, step_name):
+        # A plan already knows whether the resource exists, so the lookup can be skipped
+        change = self._plan.change_for(step_name) if self._plan else None
+        if change is None:
+            return None
+        return change.action != ChangeAction.CREATE
+
+    def _enable_apis(self, _):
+        self.service_usage_service.enable_apis(self.variables['project_id'], [
+            GoogleCloudService.CLOUD_SQL,
+            GoogleCloudService.CLOUD_RUN,
+            GoogleCloudService.CLOUD_BUILD,
+            GoogleCloudService.CLOUD_STORAGE,
+            GoogleCloudService.CONTAINER_REGISTRY,
+        ])
+
+    def _create_db_instance(self, _):
         instance_body = POSTGRES_SQL_TEMPLATE
         instance = self.sql_admin_service.create_psql_instance(
             self.variables['project_id'],
             self.variables['db_instance'],
             self.variables['region'],
-            instance_body
+            instance_body,
+            exists=self._planned_exists('db_instance')
         )
+
+        return {
+            # 'sql_instance': instance,
+            # 'sql_url': instance['selfLink'],
+            # 'sql_ip': instance['ipAddresses'][0]['ipAddress'],
+            'sql_connection_name': instance['connectionName']
+        }
+
+    def _db_instance_inputs(self, _):
+        return {
+            'project_id': self.variables['project_id'],
+            'db_instance': self.variables['db_instance'],
+            'region': self.variables['region'],
+            'instance_body': POSTGRES_SQL_TEMPLATE
+        }
+
+    def _create_database_and_user(self, _):
         self.sql_admin_service.create_database_and_user(
             self.variables['project_id'],
             self.variables['db_instance'],
@@ -40,65 +96,46 @@ class FastAPIPostgresRecipe(BaseRecipe):
             self.variables['db_password']
         )
 
+    def _database_and_user_inputs(self, results):
         return {
-            # 'sql_instance': instance,
-            # 'sql_url': instance['selfLink'],
-            # 'sql_ip': instance['ipAddresses'][0]['ipAddress'],
-            'sql_connection_name': instance['connectionName']
+            'instance': results['db_instance'],
+            'database_name': self.variables['database_name'],
+            'db_user': self.variables['db_user'],
+            'db_password': self.variables['db_password']
         }
 
-    def _app_flow(self):
-        source_dir = str(Path(__file__).parent.parent.parent / 'app')
-        object_name = self.storage_service.upload_directory_as_tar(
+    def _upload_source(self, _):
+        # The returned archive carries the source digest so later steps can key caches on it
+        source_dir = str(_APP_DIR)
+        return self.storage_service.upload_source(
             self.variables['bucket_name'],
             source_dir,
-            self.variables['app_name']
+            self.variables['app_name'],
+            compression=self.variables.get('source_compression', 'gzip')
         )
 
-        image_path = f"gcr.io/{self.variables['project_id']}/{self.variables['app_name']}:{self.variables['image_tag']}"
-        build_body = {
-        'source': {
-            'storage_source': {
-                'bucket': self.variables['bucket_name'],
-                'object': object_name
-            }
-        },
-        'steps': [
-            {
-                'name': 'gcr.io/cloud-builders/docker',
-                'args': [
-                    'build', '-t', image_path, '.'
-                ]
-            }
-        ],
-        'images': [image_path]
-    }
-        build = self.cloud_build.create_build(
+    def _build_image(self, results):
+        # Skips Cloud Build entirely when an image for the same source digest already exists
+        return self.cloud_build_service.build_image(
             self.variables['project_id'],
-            build_body
+            self.variables['app_name'],
+            self.variables['image_tag'],
+            results['upload_source'],
+            str(_APP_DIR / 'Dockerfile')
         )
 
-        image_url = f"{build.results.images[0].name}@{build.results.images[0].digest}"
-
-        return image_url
-     
-
-    def deploy(self):
-        self.service_usage_service.enable_api(self.variables['project_id'], GoogleCloudService.CLOUD_SQL)
-        self.service_usage_service.enable_api(self.variables['project_id'], GoogleCloudService.CLOUD_RUN)
-        self.service_usage_service.enable_api(self.variables['project_id'], GoogleCloudService.CLOUD_BUILD)
-        self.service_usage_service.enable_api(self.variables['project_id'], GoogleCloudService.CLOUD_STORAGE)
-        self.service_usage_service.enable_api(self.variables['project_id'], GoogleCloudService.CONTAINER_REGISTRY)
-
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            future_db = executor.submit(self._db_flow)
-            future_app = executor.submit(self._app_flow)
-
-            db_result = future_db.result()
-            image_url = future_app.result()
+    def _build_image_inputs(self, results):
+        return {
+            'project_id': self.variables['project_id'],
+            'app_name': self.variables['app_name'],
+            'image_tag': self.variables['image_tag'],
+            'cache_key': build_cache_key(results['upload_source'], str(_APP_DIR / 'Dockerfile'))
+        }
 
-        # print(db_result)
-        service_body = Service(
+    def _service_body(self, results):
+        db_result = results['db_instance']
+        image_url = results['build_image']
+        return Service(
         template=RevisionTemplate(
             containers=[Container(
                 image=image_url,
@@ -112,167 +149,317 @@ class FastAPIPostgresRecipe(BaseRecipe):
             volumes=[Volume(name='cloudsql', cloud_sql_instance=CloudSqlInstance(instances=[db_result['sql_connection_name']]))]
         )
     )
+
+    def _deploy_service_inputs(self, results):
+        # The full service spec, so any Cloud Run config change triggers a redeploy
+        return {
+            'project_id': self.variables['project_id'],
+            'region': self.variables['region'],
+            'app_name': self.variables['app_name'],
+            'service': Service.to_json(self._service_body(results))
+        }
+
+    def _deploy_service(self, results):
         service = self.cloud_run_service.deploy(
             self.variables['project_id'],
             self.variables['region'],
             self.variables['app_name'],
-            service_body
+            self._service_body(results),
+            exists=self._planned_exists('deploy_service')
         )
+        # Recorded in the deployment state, so only plain identifiers are returned
+        return {
+            'name': service.name,
+            'uri': service.uri
+        }
 
-        binding = Binding(
+    def _iam_binding(self):
+        return Binding(
             role='roles/run.invoker',
             members=['allUsers']
         )
+
+    def _iam_policy_inputs(self, results):
+        binding = self._iam_binding()
+        return {
+            'service': results['deploy_service']['name'],
+            'role': binding.role,
+            'members': list(binding.members)
+        }
+
+    def _set_iam_policy(self, _):
         self.cloud_run_service.set_iam_policy(
             self.variables['project_id'],
             self.variables['region'],
             self.variables['app_name'],
-            binding
+            self._iam_binding()
         )
 
-        # print(f"Application URL: {service.uri}")
+    def deploy(self, plan=None):
+        # Each step starts as soon as its own prerequisites are done, so the
+        # Cloud SQL instance (the slowest path) overlaps the source upload and build.
+        # The APIs are checked in one batch call, skipped entirely on a cache hit.
+        # Steps with fingerprints are skipped when their inputs match the last
+        # deploy recorded in the stack's state file, or that the plan found unchanged.
+        steps = [
+            Step('enable_apis', self._enable_apis),
+            Step('db_instance', self._create_db_instance, ('enable_apis',), self._db_instance_inputs),
+            Step('db_database_user', self._create_database_and_user, ('db_instance',), self._database_and_user_inputs),
+            Step('upload_source', self._upload_source, ('enable_apis',)),
+            Step('build_image', self._build_image, ('enable_apis', 'upload_source'), self._build_image_inputs),
+            Step('deploy_service', self._deploy_service, ('enable_apis', 'db_instance', 'db_database_user', 'build_image'), self._deploy_service_inputs),
+            Step('set_iam_policy', self._set_iam_policy, ('deploy_service',), self._iam_policy_inputs),
+        ]
+        self._plan = plan
+        try:
+            results = self.run_steps(steps, plan)
+        finally:
+            self._plan = None
+        service = results['deploy_service']
+
+        # print(f"Application URL: {service['uri']}")
         # print(f"FastAPI PostgreSQL stack deployment completed!")
 
         return {
-            'app_url': service.uri
+            'app_url': service['uri']
         }
 
-
-        # TODO: Create a state file to track the deployment (e.g. something simple just to know if the deployment is done, failed, etc.)
-        
-
     def destroy(self):
         print("Starting parallel destruction of FastAPI PostgreSQL stack...")
-        
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit all deletion tasks in parallel
-            future_cloud_run = executor.submit(
-                self.cloud_run_service.delete_service,
+        # Forget recorded steps first, so a partial destroy never lets a later deploy skip a deleted resource
+        self.state.clear()
+
+        steps = [
+            Step('delete_service', lambda _: self.cloud_run_service.delete_service(
                 self.variables['project_id'],
                 self.variables['region'],
                 self.variables['app_name']
-            )
-            
-            future_sql = executor.submit(
-                self.sql_admin_service.delete_sql_instance,
+            )),
+            Step('delete_sql_instance', lambda _: self.sql_admin_service.delete_sql_instance(
                 self.variables['project_id'],
                 self.variables['db_instance']
-            )
-            
-            future_storage = executor.submit(
-                self.storage_service.delete_file,
+            )),
+            Step('delete_source', lambda _: self.storage_service.delete_files_with_prefix(
                 self.variables['bucket_name'],
-                f"{self.variables['app_name']}.tar.gz"
-            )
-            
-            repository_name = 'gcr.io'
-            location = 'us'
-            future_artifact = executor.submit(
-                self.artifact_registry_service.delete_package,
+                f"{self.variables['app_name']}/"
+            )),
+            Step('delete_package', lambda _: self.artifact_registry_service.delete_package(
                 self.variables['project_id'],
-                location,
-                repository_name,
+                GCR_LOCATION,
+                GCR_REPOSITORY,
                 self.variables['app_name']
-            )
-            
-            # Wait for all operations to complete
-            future_cloud_run.result()
-            future_sql.result()
-            future_storage.result()
-            future_artifact.result()
+            )),
+        ]
+        self.run_steps(steps)
         
         print("FastAPI PostgreSQL stack destruction completed!")
 
 
+    async def _probe_resources(self):
+        """Read every live resource of the stack concurrently.
+
+        Returns a dict of probe results; a probe that failed holds its exception.
+        """
+        project_id = self.variables['project_id']
+        region = self.variables['region']
+        app_name = self.variables['app_name']
+        db_instance = self.variables['db_instance']
+        cloud_run = GCPCloudRunAsync()
+        sql_admin = GCPCloudSQLAdminAsync()
+        storage = GCPStorageAsync()
+        artifact_registry = GCPArtifactRegistryAsync()
+
+        async def probe_image():
+            # The cache tag depends on the local source digest, so this probe chains two calls
+            local_source = await GCPStorageAsyncService().describe_source(
+                self.variables['bucket_name'],
+                str(_APP_DIR),
+                app_name,
+                compression=self.variables.get('source_compression', 'gzip')
+            )
+            digest = await GCPArtifactRegistryAsyncService().find_image_digest(
+                project_id, GCR_LOCATION, GCR_REPOSITORY, app_name,
+                build_cache_tag(local_source, str(_APP_DIR / 'Dockerfile'))
+            )
+            return local_source, digest
+
+        probes = {
+            'service': cloud_run.get_service(project_id, region, app_name),
+            'iam_policy': cloud_run.get_iam_policy(project_id, region, app_name),
+            'instance': sql_admin.get_instance(project_id, db_instance),
+            'database': sql_admin.get_database(project_id, db_instance, self.variables['database_name']),
+            'user': sql_admin.get_user(project_id, db_instance, self.variables['db_user']),
+            'archives': storage.list_files(self.variables['bucket_name'], f"{app_name}/"),
+            'image': probe_image(),
+            'package': artifact_registry.get_package(project_id, GCR_LOCATION, GCR_REPOSITORY, app_name),
+        }
+        # Every probe is in flight at once; failures come back as exceptions
+        try:
+            results = await asyncio.gather(*probes.values(), return_exceptions=True)
+        finally:
+            # The async clients die with this event loop; close their channels while it runs
+            await GCPClientFactory().aclose()
+        return dict(zip(probes, results))
+
+    def status(self):
+        """Fetch every stack resource concurrently and report drift from the recorded deployment."""
+        recorded = {name: step['outputs'] for name, step in self.state.steps.items()}
+        probes = asyncio.run(self._probe_resources())
+        service, instance, archives, image = probes['service'], probes['instance'], probes['archives'], probes['image']
+
+        def expected(step_name):
+            return step_name in recorded if recorded else None
+
+        service_status = ResourceStatus.from_result('Cloud Run service', self.variables['app_name'], service, expected('deploy_service'))
+        if service_status.exists:
+            service_status.details.append(f"URL: {service.uri}")
+            image_url = service.template.containers[0].image if service.template.containers else None
+            if 'build_image' in recorded and image_url != recorded['build_image']:
+                service_status.drift.append(f"running image {image_url}, last deployed {recorded['build_image']}")
+            if service.terminal_condition.state == Condition.State.CONDITION_FAILED:
+                service_status.drift.append(f"not ready: {service.terminal_condition.message}")
+
+        instance_status = ResourceStatus.from_result('Cloud SQL instance', self.variables['db_instance'], instance, expected('db_instance'))
+        if instance_status.exists:
+            instance_status.details.append(f"State: {instance.get('state')}")
+            if instance.get('state') != 'RUNNABLE':
+                instance_status.drift.append(f"instance is {instance.get('state')}, expected RUNNABLE")
+            recorded_connection = recorded.get('db_instance', {}).get('sql_connection_name')
+            if recorded_connection and instance.get('connectionName') != recorded_connection:
+                instance_status.drift.append(f"connection name {instance.get('connectionName')}, last deployed {recorded_connection}")
+
+        database_status = ResourceStatus.from_result('Cloud SQL database', self.variables['database_name'], probes['database'], expected('db_database_user'))
+        user_status = ResourceStatus.from_result('Cloud SQL user', self.variables['db_user'], probes['user'], expected('db_database_user'))
+
+        source_status = ResourceStatus('Source archive', f"gs://{self.variables['bucket_name']}/{self.variables['app_name']}/", expected=expected('build_image'))
+        if isinstance(archives, BaseException):
+            source_status.error = str(archives)
+        else:
+            source_status.exists = bool(archives)
+            source_status.details.append(f"{len(archives)} archive(s) stored")
+            if source_status.expected is True and not archives:
+                source_status.drift.append("recorded as deployed but not found")
+            if isinstance(image, BaseException):
+                source_status.details.append(f"local source could not be hashed: {image}")
+            elif image[0].object_name not in {blob.name for blob in archives}:
+                source_status.details.append("local source has changed since the last upload")
+
+        package_status = ResourceStatus.from_result('Container image', f"{GCR_REPOSITORY}/{self.variables['project_id']}/{self.variables['app_name']}", probes['package'], expected('build_image'))
+
+        statuses = [service_status, instance_status, database_status, user_status, source_status, package_status]
+        if not recorded:
+            print("\nNo deployment recorded for this stack, target, project and region.")
+        drifted = print_status(self.stack_name, statuses)
+        return {
+            'drifted_resources': drifted,
+            'resources': {status.kind: status.exists for status in statuses}
+        }
+
     def plan(self):
-        """Show deployment plan with all resources and app details."""
-        print("=" * 60)
-        print("🚀 FastAPI PostgreSQL Stack Deployment Plan")
-        print("=" * 60)
-        
-        # Project Information
-        print(f"\n📋 Project Information:")
-        print(f"   Project ID: {self.variables['project_id']}")
-        print(f"   Region: {self.variables['region']}")
-        print(f"   Stack: {self.stack_name}")
-        
-        # Application Details
-        print(f"\n📱 Application Details:")
-        print(f"   App Name: {self.variables['app_name']}")
-        print(f"   Image Tag: {self.variables['image_tag']}")
-        print(f"   Source: FastAPI application with PostgreSQL")
-        print(f"   Container Registry: gcr.io/{self.variables['project_id']}/{self.variables['app_name']}:{self.variables['image_tag']}")
-        
-        # Infrastructure Resources
-        print(f"\n🏗️  Infrastructure Resources to Create:")
-        print(f"   ┌─ Google Cloud APIs to Enable:")
-        print(f"   │  ├─ Cloud SQL Admin API")
-        print(f"   │  ├─ Cloud Run API")
-        print(f"   │  ├─ Cloud Build API")
-        print(f"   │  ├─ Cloud Storage API")
-        print(f"   │  └─ Container Registry API")
-        print(f"   │")
-        print(f"   ├─ Database Layer:")
-        print(f"   │  ├─ Cloud SQL Instance: {self.variables['db_instance']}")
-        print(f"   │  │  ├─ Database: {self.variables['database_name']}")
-        print(f"   │  │  ├─ User: {self.variables['db_user']}")
-        print(f"   │  │  └─ Version: PostgreSQL 14")
-        print(f"   │  └─ Connection: Private VPC")
-        print(f"   │")
-        print(f"   ├─ Application Layer:")
-        print(f"   │  ├─ Cloud Run Service: {self.variables['app_name']}")
-        print(f"   │  │  ├─ Region: {self.variables['region']}")
-        print(f"   │  │  ├─ CPU: {self.variables['cloud_run_cpu']}")
-        print(f"   │  │  ├─ Memory: {self.variables['cloud_run_memory']}")
-        print(f"   │  │  ├─ Max Instances: {self.variables['cloud_run_max_instances']}")
-        print(f"   │  │  └─ Public Access: Enabled")
-        print(f"   │  └─ Cloud SQL Connection: Enabled")
-        print(f"   │")
-        print(f"   ├─ Build & Storage:")
-        print(f"   │  ├─ Cloud Storage Bucket: {self.variables['bucket_name']}")
-        print(f"   │  ├─ Source Archive: {self.variables['app_name']}.tar.gz")
-        print(f"   │  ├─ Cloud Build: Docker container build")
-        print(f"   │  └─ Artifact Registry: Container image storage")
-        print(f"   │")
-        print(f"   └─ Security & IAM:")
-        print(f"      ├─ Service Account: Cloud Run service account")
-        print(f"      ├─ IAM Binding: roles/run.invoker for allUsers")
-        print(f"      └─ Cloud SQL Client: Service account permissions")
-        
-        # Environment Variables
-        print(f"\n🔧 Environment Variables:")
-        print(f"   ├─ DB_USER: {self.variables['db_user']}")
-        print(f"   ├─ DB_PASSWORD: [HIDDEN]")
-        print(f"   ├─ DB_NAME: {self.variables['database_name']}")
-        print(f"   └─ DB_CONNECTION_NAME: [Auto-generated]")
-        
-        # Deployment Strategy
-        print(f"\n⚡ Deployment Strategy:")
-        print(f"   ├─ Parallel Deployment: Infrastructure + App")
-        print(f"   ├─ Database: Cloud SQL instance creation")
-        print(f"   ├─ Application: Container build + Cloud Run deployment")
-        print(f"   └─ Integration: Cloud SQL connection via Unix socket")
-        
-        # Estimated Costs (rough estimates)
-        print(f"\n💰 Estimated Monthly Costs (rough estimates):")
-        print(f"   ├─ Cloud SQL (db-f1-micro): ~$7-15/month")
-        print(f"   ├─ Cloud Run (512Mi, 1 CPU): ~$5-20/month (usage-based)")
-        print(f"   ├─ Cloud Storage: ~$0.02/GB/month")
-        print(f"   ├─ Cloud Build: ~$0.003/minute (build time)")
-        print(f"   └─ Total: ~$12-35/month (depending on usage)")
-        
-        # Post-Deployment Info
-        print(f"\n🎯 Post-Deployment Information:")
-        print(f"   ├─ Application URL: https://{self.variables['app_name']}-[hash]-{self.variables['region']}.run.app")
-        print(f"   ├─ Database Connection: Private VPC only")
-        print(f"   ├─ Scaling: Automatic (0 to {self.variables['cloud_run_max_instances']} instances)")
-        print(f"   └─ Monitoring: Cloud Run metrics available")
-        
-        print(f"\n" + "=" * 60)
-        print("✅ Plan complete! Run 'deploy' to execute this plan.")
-        print("=" * 60)
+        """Diff the desired stack against live resources and return the plan deploy can execute."""
+        project_id = self.variables['project_id']
+        app_name = self.variables['app_name']
+        image_repo = f"gcr.io/{project_id}/{app_name}"
+        recorded = self.state.steps
+        probes = asyncio.run(self._probe_resources())
+        changes = []
+
+        def unchanged(step_name, inputs):
+            entry = recorded.get(step_name)
+            return entry is not None and entry['fingerprint'] == compute_fingerprint(inputs)
+
+        # Cloud SQL instance
+        instance = _live(probes['instance'], 'Cloud SQL instance', self.variables['db_instance'])
+        instance_change = ResourceChange('db_instance', 'Cloud SQL instance', self.variables['db_instance'], ChangeAction.CREATE)
+        if instance is None:
+            instance_change.reasons.append("instance does not exist")
+        else:
+            inputs = self._db_instance_inputs(None)
+            instance_change.action = ChangeAction.NOOP
+            instance_change.fingerprint = compute_fingerprint(inputs)
+            instance_change.outputs = {'sql_connection_name': instance['connectionName']}
+            if instance.get('state') != 'RUNNABLE':
+                instance_change.reasons.append(f"instance is {instance.get('state')}")
+            if 'db_instance' in recorded and not unchanged('db_instance', inputs):
+                instance_change.reasons.append("instance settings changed; existing instances are not modified in place")
+        changes.append(instance_change)
+
+        # Database and user; neither can exist without the instance
+        database = _live(probes['database'], 'Cloud SQL database', self.variables['database_name']) if instance is not None else None
+        user = _live(probes['user'], 'Cloud SQL user', self.variables['db_user']) if instance is not None else None
+        database_change = ResourceChange(
+            'db_database_user', 'Cloud SQL database and user',
+            f"{self.variables['database_name']} / {self.variables['db_user']}", ChangeAction.CREATE
+        )
+        if database is None:
+            database_change.reasons.append(f"database {self.variables['database_name']} does not exist")
+        if user is None:
+            database_change.reasons.append(f"user {self.variables['db_user']} does not exist")
+        if database is not None and user is not None:
+            database_change.action = ChangeAction.NOOP
+            database_change.fingerprint = compute_fingerprint(self._database_and_user_inputs({'db_instance': instance_change.outputs}))
+        changes.append(database_change)
+
+        # Source archive
+        image_probe = _live(probes['image'], 'container image for', app_name)
+        if image_probe is None:
+            # A missing image is a None digest, so a 404 here means the probe itself failed
+            raise Exception(f"Could not read container image for {app_name}: not found")
+        local_source, image_digest = image_probe
+        archives = _live(probes['archives'], 'source archives in', self.variables['bucket_name']) or []
+        source_change = ResourceChange('upload_source', 'Source archive', local_source.uri, ChangeAction.CREATE)
+        if local_source.object_name in {blob.name for blob in archives}:
+            source_change.action = ChangeAction.NOOP
+        else:
+            source_change.reasons.append("no archive for the current source yet")
+        changes.append(source_change)
+
+        # Container image, looked up by the build cache tag
+        image_change = ResourceChange('build_image', 'Container image', f"{image_repo}:{self.variables['image_tag']}", ChangeAction.CREATE)
+        if image_digest:
+            image_change.action = ChangeAction.NOOP
+            image_change.fingerprint = compute_fingerprint(self._build_image_inputs({'upload_source': local_source}))
+            image_change.outputs = f"{image_repo}@{image_digest}"
+        else:
+            image_change.reasons.append("no image built from the current source yet")
+        changes.append(image_change)
+
+        # Cloud Run service
+        service = _live(probes['service'], 'Cloud Run service', app_name)
+        service_change = ResourceChange('deploy_service', 'Cloud Run service', app_name, ChangeAction.UPDATE)
+        if service is None:
+            service_change.action = ChangeAction.CREATE
+            service_change.reasons.append("service does not exist")
+        elif instance_change.outputs is None or image_change.outputs is None:
+            service_change.reasons.append("new image or database connection")
+        else:
+            inputs = self._deploy_service_inputs({'db_instance': instance_change.outputs, 'build_image': image_change.outputs})
+            live_image = service.template.containers[0].image if service.template.containers else None
+            if live_image != image_change.outputs:
+                service_change.reasons.append(f"image changes from {live_image} to {image_change.outputs}")
+            if not unchanged('deploy_service', inputs):
+                service_change.reasons.append("service configuration differs from the last deploy")
+            if not service_change.reasons:
+                service_change.action = ChangeAction.NOOP
+                service_change.fingerprint = compute_fingerprint(inputs)
+                service_change.outputs = {'name': service.name, 'uri': service.uri}
+        changes.append(service_change)
+
+        # Public invoker binding
+        binding = self._iam_binding()
+        policy = _live(probes['iam_policy'], 'IAM policy of', app_name) if service is not None else None
+        iam_change = ResourceChange('set_iam_policy', 'IAM binding', f"{binding.role} for {', '.join(binding.members)}", ChangeAction.CREATE)
+        if policy is not None and any(b.role == binding.role and set(binding.members) <= set(b.members) for b in policy.bindings):
+            iam_change.action = ChangeAction.NOOP
+            iam_change.fingerprint = compute_fingerprint(self._iam_policy_inputs({'deploy_service': {'name': service.name, 'uri': service.uri}}))
+        else:
+            iam_change.reasons.append("binding is not in the service's IAM policy")
+        changes.append(iam_change)
 
-# RecipeRegistry.register('fastapi-postgres', FastAPIPostgresRecipe)
+        plan = self.new_plan(changes)
+        print(f"\n📋 {self.stack_name} in {project_id} ({self.variables['region']})")
+        plan.print()
+        return plan
 
 
 if __name__ == "__main__":